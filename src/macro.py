@@ -3,9 +3,13 @@ import json
 import os
 import math
 import logging
+import queue
 import threading
+from collections import deque
 from logging.handlers import RotatingFileHandler
 from dataclasses import dataclass
+from enum import IntEnum
+from types import SimpleNamespace
 from typing import Optional, Tuple, List
 
 import numpy as np
@@ -20,11 +24,203 @@ from ctypes import wintypes
 from overlay_qt import OverlayQt
 import glob
 
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; callers fall back to vectorized NumPy without it
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
 VK_LEFT = 0x25
 VK_RIGHT = 0x27
+VK_X = 0x58
 
 KEYEVENTF_KEYDOWN = 0x0000
+KEYEVENTF_EXTENDEDKEY = 0x0001
 KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_SCANCODE = 0x0008
+
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_VIRTUALDESK = 0x4000
+MOUSEEVENTF_ABSOLUTE = 0x8000
+
+# Virtual-key codes for keys released via native SendInput
+VK_CODES = {
+    "left": VK_LEFT,
+    "right": VK_RIGHT,
+    "x": VK_X,
+}
+
+# DirectInput scan codes for keys pressed in the hot loop; arrows live on the extended keypad
+SCAN_CODES = {
+    "left": 0x4B,
+    "right": 0x4D,
+    "x": 0x2D,
+}
+EXTENDED_KEYS = frozenset(("left", "right"))
+
+IS_WINDOWS = platform.system() == "Windows"
+
+# How long a foreground-window check stays valid before Win32 is queried again
+FOCUS_CACHE_TTL = 0.25
+
+# Legacy click-cycle phases during which a target is being engaged
+CLICK_BUSY_PHASES = frozenset(("load", "shoot"))
+
+# Camera arrow for a -1/0/+1 direction code (index with code + 1), and screen side by bool
+ARROW_FOR_DIR = ("left", None, "right")
+SIDE_NAMES = ("left", "right")
+
+# Square input size the YOLO model is exported/fed at
+YOLO_IMGSZ = 640
+# Confidence floor shared by the predictor and raw YOLO paths (Ultralytics' default conf)
+YOLO_CONF = 0.25
+# NMS settings for the raw (predictor-less) YOLO path, matching Ultralytics defaults
+YOLO_NMS_IOU = 0.7
+YOLO_MAX_DET = 300
+
+# Red wraps around hue 0/180, which used to take two inRange calls plus an OR. Converting the BGR frame
+# with COLOR_RGB2HSV swaps R and B, mapping hue h -> (120 - h) mod 180 with S/V unchanged, so red's
+# [0, 10] U [160, 179] becomes the single band [110, 140]. These bounds expect that swapped conversion.
+HSV_RED_LOWER = np.array([110, 100, 70], dtype=np.uint8)  # red-ratio check
+HSV_RED_UPPER = np.array([140, 255, 255], dtype=np.uint8)
+SLEIGH_RED_LOWER = np.array([110, 80, 80], dtype=np.uint8)  # sleigh color search
+SLEIGH_RED_UPPER = np.array([140, 255, 255], dtype=np.uint8)
+RECT_KERNEL_3 = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
+# Win32 INPUT structures for SendInput
+PUL = ctypes.POINTER(ctypes.c_ulong)
+
+
+class KeyBdInput(ctypes.Structure):
+    _fields_ = [("wVk", ctypes.c_ushort),
+                ("wScan", ctypes.c_ushort),
+                ("dwFlags", ctypes.c_ulong),
+                ("time", ctypes.c_ulong),
+                ("dwExtraInfo", PUL)]
+
+
+class HardwareInput(ctypes.Structure):
+    _fields_ = [("uMsg", ctypes.c_ulong),
+                ("wParamL", ctypes.c_short),
+                ("wParamH", ctypes.c_ushort)]
+
+
+class MouseInput(ctypes.Structure):
+    _fields_ = [("dx", ctypes.c_long),
+                ("dy", ctypes.c_long),
+                ("mouseData", ctypes.c_ulong),
+                ("dwFlags", ctypes.c_ulong),
+                ("time", ctypes.c_ulong),
+                ("dwExtraInfo", PUL)]
+
+
+class Input_I(ctypes.Union):
+    _fields_ = [("ki", KeyBdInput),
+                ("mi", MouseInput),
+                ("hi", HardwareInput)]
+
+
+class Input(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong),
+                ("ii", Input_I)]
+
+
+INPUT_SIZE = ctypes.sizeof(Input)
+
+# SendInput bound once with explicit argtypes so hot-path calls skip the windll attribute lookup
+if IS_WINDOWS:
+    _SendInput = ctypes.WinDLL("user32", use_last_error=True).SendInput
+    _SendInput.argtypes = (ctypes.c_uint, ctypes.c_void_p, ctypes.c_int)
+    _SendInput.restype = ctypes.c_uint
+else:
+    _SendInput = None
+
+
+# Prebuilt scancode INPUT structs keyed by (key, down) so key presses never allocate
+_KEY_INPUTS = {}
+_KEY_EXTRA = ctypes.c_ulong(0)
+
+
+def _key_input(key: str, down: bool) -> Input:
+    """Return the cached SendInput struct that presses (down=True) or releases a key by scan code."""
+    inp = _KEY_INPUTS.get((key, down))
+    if inp is None:
+        flags = KEYEVENTF_SCANCODE
+        if key in EXTENDED_KEYS:
+            flags |= KEYEVENTF_EXTENDEDKEY
+        if not down:
+            flags |= KEYEVENTF_KEYUP
+        inp = Input(INPUT_KEYBOARD, Input_I(ki=KeyBdInput(0, SCAN_CODES[key], flags, 0, ctypes.pointer(_KEY_EXTRA))))
+        _KEY_INPUTS[(key, down)] = inp
+    return inp
+
+
+@njit(cache=True)
+def movement_span(hist, n):
+    """Largest X or Y range covered by the first n rows of an (N, 2) position buffer."""
+    if n <= 0:
+        return 0
+    min_x = max_x = hist[0, 0]
+    min_y = max_y = hist[0, 1]
+    for i in range(1, n):
+        x = hist[i, 0]
+        y = hist[i, 1]
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+    return max(max_x - min_x, max_y - min_y)
+
+
+@njit(cache=True, fastmath=True)
+def predict_aim(prev_cx, prev_cy, curr_cx, curr_cy):
+    """Extrapolate the aim point two frames ahead of the latest center."""
+    vx = (curr_cx - prev_cx) * 2.0
+    vy = (curr_cy - prev_cy) * 2.0
+    return int(curr_cx + vx), int(curr_cy + vy)
+
+
+@njit(cache=True)
+def nms_single_class(boxes, scores, iou_thr):
+    """Greedy NMS for one class of (N, 4) xyxy boxes; returns kept row indices, best score first."""
+    order = np.argsort(-scores)
+    n = order.shape[0]
+    suppressed = np.zeros(n, dtype=np.bool_)
+    keep = np.empty(n, dtype=np.int64)
+    k = 0
+    for a in range(n):
+        if suppressed[a]:
+            continue
+        i = order[a]
+        keep[k] = i
+        k += 1
+        area_i = (boxes[i, 2] - boxes[i, 0]) * (boxes[i, 3] - boxes[i, 1])
+        for b in range(a + 1, n):
+            if suppressed[b]:
+                continue
+            j = order[b]
+            iw = min(boxes[i, 2], boxes[j, 2]) - max(boxes[i, 0], boxes[j, 0])
+            ih = min(boxes[i, 3], boxes[j, 3]) - max(boxes[i, 1], boxes[j, 1])
+            if iw <= 0 or ih <= 0:
+                continue
+            inter = iw * ih
+            area_j = (boxes[j, 2] - boxes[j, 0]) * (boxes[j, 3] - boxes[j, 1])
+            if inter / (area_i + area_j - inter) > iou_thr:
+                suppressed[b] = True
+    return keep[:k]
 
 
 class MacroState:
@@ -38,11 +234,21 @@ class MacroState:
     CAMERA_TRACKING = "camera_tracking"
 
 
-@dataclass
+class AttackPhase(IntEnum):
+    """YOLO-mode attack state; ints keep the per-frame phase checks cheap."""
+    IDLE = 0
+    ATTACKING = 1
+
+
+@dataclass(slots=True)
 class DetectionResult:
     bbox: Optional[Tuple[int, int, int, int]]
     confidence: float
     color_score: float = 0.0
+
+
+# Shared empty result for per-frame "nothing detected" paths; treat as read-only
+NO_DETECTION = DetectionResult(bbox=None, confidence=0.0)
     
     
 @dataclass
@@ -66,6 +272,8 @@ class SantaMacro:
             self.cfg = json.load(f)
 
         self.logger = self._setup_logger(self.cfg["logging"])
+        self._dbg_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        self._info_enabled = self.logger.isEnabledFor(logging.INFO)
         self.state = MacroState.IDLE
         self.last_state = self.state
 
@@ -73,22 +281,46 @@ class SantaMacro:
         self.monitor_index = self.cfg["capture"]["monitor_index"]
         self.monitor = self.sct.monitors[self.monitor_index]
         self.roi = self._compute_roi()
+        self._recompute_edge_thresholds()
+        self._refresh_geom()
+        # Reusable SendInput buffer: absolute move to the target + 1px relative nudge
+        self._virtual_screen = self.sct.monitors[0]
+        self._mouse_extra = ctypes.c_ulong(0)
+        self._mouse_events = (Input * 2)()
+        self._mouse_events[0].type = INPUT_MOUSE
+        self._mouse_events[0].ii.mi = MouseInput(0, 0, 0, MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_VIRTUALDESK, 0, ctypes.pointer(self._mouse_extra))
+        self._mouse_events[1].type = INPUT_MOUSE
+        self._mouse_events[1].ii.mi = MouseInput(0, 1, 0, MOUSEEVENTF_MOVE, 0, ctypes.pointer(self._mouse_extra))
         self.grayscale = self.cfg["capture"].get("grayscale", True)
 
         self.templates: List[np.ndarray] = []
         self.template_names: List[str] = []
         self._load_templates(self.cfg["detection"]["templates"], self.grayscale)
 
-        self.det_mode: str = self.cfg["detection"].get("mode", "template").lower()
+        self.set_detection_mode(self.cfg["detection"].get("mode", "template"))
         self.method = getattr(cv2, self.cfg["detection"].get("method", "TM_CCOEFF_NORMED"))
         self.scales: List[float] = self.cfg["detection"].get("scales", [0.9, 1.0, 1.1])
+        # Motion/color/template detectors run on the ROI downscaled by this factor; bboxes are mapped back
+        self._detect_scale = min(1.0, max(0.1, float(self.cfg["detection"].get("detect_scale", 0.5))))
+        self._detect_src: List[Optional[np.ndarray]] = [None, None]  # last full-res gray/BGR inputs
+        self._detect_small: List[Optional[np.ndarray]] = [None, None]  # their downscaled copies
+        # Templates are scaled once up front; with OpenCL they are also kept on the device as UMats
+        self._use_ocl = bool(self.cfg["detection"].get("opencl", True)) and cv2.ocl.haveOpenCL()
+        if self._use_ocl:
+            cv2.ocl.setUseOpenCL(True)
+            self.logger.info("Template matching: OpenCL enabled")
+        self._scaled_templates = self._prepare_templates()
+        self._corr_stacks = {}  # (match_w, match_h) -> reused float32 result stack for that bucket
         self.threshold: float = float(self.cfg["detection"].get("threshold", 0.20))
         self.ema_alpha: float = float(self.cfg["detection"].get("ema_alpha", 0.25))
+        self._ema_keep: float = 1.0 - self.ema_alpha
         
         self._last_detection_frame = -1000
         self._detection_grace_frames = 20  # Increased from 8 to 20 for long custom attack sequences
         self._predicted_position = None
-        self._position_history = []
+        # Velocity window: first sample + sample count (only the endpoints matter for the estimate)
+        self._pos_first: Optional[Tuple[int, int]] = None
+        self._pos_count = 0
         self._max_position_history = 5
         self._consecutive_detections = 0
         self._required_detections_to_start = 3
@@ -108,7 +340,7 @@ class SantaMacro:
         self.attack_committed = False
         
         # Attack phase tracking
-        self.attack_phase = "idle"
+        self.attack_phase = AttackPhase.IDLE
         self.attack_phase_start: Optional[float] = None
         
         # Initialize custom attack manager
@@ -132,6 +364,18 @@ class SantaMacro:
         self._smoothed_cursor_pos = None
         self._cursor_smooth_alpha = 0.4
         self.motion_cfg = self.cfg["detection"].get("motion", {})
+        # Motion-diff parameters and morphology kernels are built once; sizes are configured in
+        # full-resolution pixels and converted to the detect_scale frame here
+        scale = self._detect_scale
+        self._motion_blur_k = max(1, int(int(self.motion_cfg.get("blur_kernel", 9)) * scale)) | 1
+        motion_thr = int(self.motion_cfg.get("diff_threshold", 25))
+        # Union of the "aggressive" (thr - 10, floored at 10) and normal masks is just the lower threshold
+        self._motion_thr = min(motion_thr, max(10, motion_thr - 10))
+        motion_morph_k = int(self.motion_cfg.get("morph_kernel", 5))
+        self._motion_kernel = self._scaled_rect_kernel(motion_morph_k) if motion_morph_k > 1 else None
+        # The fixed 3x3 cleanup kernel used on downscaled color/motion masks
+        self._detect_kernel_3 = self._scaled_rect_kernel(3)
+        self._motion_min_area = int(self.motion_cfg.get("min_area", 800)) * scale * scale
 
         self.learning_duration: float = float(self.cfg.get("smart_tracking", {}).get("learning_duration_seconds", 10.0))
         self.lock_on_enabled: bool = bool(self.cfg.get("smart_tracking", {}).get("enabled", True))
@@ -155,6 +399,7 @@ class SantaMacro:
         self.tick_hz: int = int(self.cfg["loop"].get("tick_hz", 25))
         self.idle_backoff_ms: int = int(self.cfg["loop"].get("idle_backoff_ms", 25))
         self.tick_interval: float = 1.0 / max(self.tick_hz, 1)
+        self._next_tick_deadline: float = 0.0
 
         self.overlay_enabled = bool(self.cfg["overlay"].get("enabled", True))
         self.overlay_title = self.cfg["overlay"].get("window_title", "SantaMacro Overlay")
@@ -163,6 +408,8 @@ class SantaMacro:
         self.overlay_topmost = bool(self.cfg["overlay"].get("topmost", True))
         self.overlay_draw_frame = bool(self.cfg["overlay"].get("draw_frame", False))
         self.overlay_status_bar_mode = bool(self.cfg["overlay"].get("status_bar_mode", False))
+        # Overlay repaints are capped independently of tick_hz; detection keeps running every tick
+        self._overlay_interval = 1.0 / max(1.0, float(self.cfg["overlay"].get("max_fps", 15)))
         self.show_fps = bool(self.cfg["overlay"].get("show_fps", True))
         self.save_low_conf_frames = bool(self.cfg["overlay"].get("save_low_conf_frames", False))
         self.dump_dir = self.cfg["overlay"].get("dump_dir", "logs/dumps")
@@ -189,7 +436,10 @@ class SantaMacro:
         self.learning_sample_dir = self.cfg.get("learning", {}).get("sample_dir", "logs/learning")
         if self.learning_enabled:
             os.makedirs(self.learning_sample_dir, exist_ok=True)
-        self._learning_detections = []
+        # Sample files are numbered per session; stamp once so runs don't overwrite each other
+        self._sample_prefix = os.path.join(self.learning_sample_dir, f"detect_{time.strftime('%Y%m%d_%H%M%S')}_")
+        self._sample_counter = 0
+        self._learning_detections: deque = deque(maxlen=50)
 
         self._learning_start_ts: Optional[float] = None
         self._santa_profile: SantaProfile = SantaProfile()
@@ -211,8 +461,14 @@ class SantaMacro:
         self._right_mouse_down: bool = False
         self._debug_log_counter: int = 0
         
-        self._detection_movement_history: List[Tuple[int, int]] = []
         self._max_movement_history: int = 10  # Increased to track more frames
+        # Ring buffer of recent detection centers used to reject static objects
+        self._mv_buf = np.zeros((self._max_movement_history, 2), dtype=np.int32)
+        self._mv_idx: int = 0
+        self._mv_len: int = 0
+        if HAVE_NUMBA:
+            movement_span(self._mv_buf, self._mv_len)  # pay the JIT compile once at startup
+            predict_aim(0, 0, 0, 0)
         self._min_movement_pixels: int = 15  # Reasonable movement threshold - Santa moves, trees don't
         self._has_attacked_successfully: bool = False
         self._camera_has_tracked: bool = False  # Track if we've followed Santa with camera
@@ -229,6 +485,12 @@ class SantaMacro:
         # Hotkey debouncing to prevent phantom keypresses
         self._last_hotkey_time = {}
         self._hotkey_debounce_ms = 500  # Minimum 500ms between same hotkey presses
+        self._hotkey_debounce_ns = int(self._hotkey_debounce_ms * 1_000_000)
+        hk = self.cfg["hotkeys"]
+        self._hk_toggle_lower = hk.get("toggle", "f1").lower()
+        self._hk_start_lower = hk.get("start", "").lower()
+        self._hk_stop_lower = hk.get("stop", "").lower()
+        self._hk_shutdown_lower = hk["shutdown"].lower()
         
         # Periodic cleanup to prevent stuck keys
         self._last_cleanup_frame = 0
@@ -253,17 +515,22 @@ class SantaMacro:
 
         self._last_loss_ts: Optional[float] = None
         self._last_reentry_ts: Optional[float] = None
-        self._movement_history: List[Tuple[float, Tuple[int, int]]] = []
+        self._movement_history: deque = deque()  # (ts, point) over the last 2s
         self._click_cycle_phase: str = "cooldown"
         self._click_cycle_start_ts: Optional[float] = None
+        self._click_phase_handlers = {
+            "load": self._tick_click_load,
+            "shoot": self._tick_click_shoot,
+            "cooldown": self._tick_click_cooldown,
+        }
         self._locked_aim_point: Optional[Tuple[int, int]] = None
         self._shoot_ref_bbox: Optional[Tuple[int, int, int, int]] = None
         
         self._locked_on_santa: bool = False
         self._lock_start_ts: Optional[float] = None
         self._lock_timeout_seconds: float = 30.0
-        self._santa_bbox_history: List[Tuple[int, int, int, int]] = []
         self._max_bbox_history: int = 5
+        self._santa_bbox_history: deque = deque(maxlen=self._max_bbox_history)
         self._stuck_detection_threshold: int = 10
         self._stuck_counter: int = 0
         self._last_movement_ts: Optional[float] = None
@@ -271,6 +538,14 @@ class SantaMacro:
         
         self._last_e_press_ts: Optional[float] = None
         self._e_spam_interval: float = 0.1
+        # Cooldown E-spam runs on its own thread; the loop only sets/clears _espam_evt
+        self._espam_evt = threading.Event()
+        self._espam_stop = threading.Event()
+        self._espam_thread: Optional[threading.Thread] = None
+        self._kbd = keyboard.Controller()
+        # Learning samples / low-conf dumps are PNG-encoded off the tick loop
+        self._disk_q: "queue.Queue" = queue.Queue(maxsize=32)
+        self._disk_thread: Optional[threading.Thread] = None
         
         self._santa_confirm_start_ts: Optional[float] = None
         self._santa_confirm_duration: float = 1.5
@@ -284,6 +559,8 @@ class SantaMacro:
         self.shoot_color_red_weight: float = float(self.cfg.get("shoot", {}).get("red_weight", 0.12))
         self.shoot_fallback_ms: int = int(self.cfg.get("shoot", {}).get("fallback_ms", 450))
         self.shoot_tracker_fail_reset: int = int(self.cfg.get("shoot", {}).get("tracker_fail_reset", 3))
+        self.shoot_tracker_downscale: int = max(1, int(self.cfg.get("shoot", {}).get("tracker_downscale", 2)))
+        self._shoot_tracker_scale: int = 1
         self.shoot_blend_detection: bool = bool(self.cfg.get("shoot", {}).get("blend_detection", True))
         self.shoot_det_max_jump_px: int = int(self.cfg.get("shoot", {}).get("det_max_jump_px", 120))
         self.shoot_det_min_iou: float = float(self.cfg.get("shoot", {}).get("det_min_iou", 0.18))
@@ -291,6 +568,9 @@ class SantaMacro:
         self.shoot_det_max_center_dist_px: int = int(self.cfg.get("shoot", {}).get("det_max_center_dist_px", 220))
         self.shoot_blend_iou_min: float = float(self.cfg.get("shoot", {}).get("blend_iou_min", 0.30))
         self._shoot_tmpl: Optional[np.ndarray] = None
+        self._shoot_tmpl_u = None  # cv2.UMat copy of _shoot_tmpl when OpenCL is in use
+        # The shoot tracker can drop to CPU on its own after an OpenCL error without affecting template matching
+        self._shoot_ocl = self._use_ocl
         self._shoot_tmpl_size: Optional[Tuple[int, int]] = None
         self._shoot_track_box: Optional[Tuple[int, int, int, int]] = None
         self.shoot_tmpl_min_score: float = float(self.cfg.get("shoot", {}).get("tmpl_min_score", 0.45))
@@ -298,14 +578,17 @@ class SantaMacro:
         self._shoot_last_det_ts: Optional[float] = None
 
         self._fps = 0.0
-        self._last_frame_ts = time.time()
+        self._last_frame_ts = time.perf_counter()
         self._prev_frame_gray: Optional[np.ndarray] = None
         self._overlay_initialized = False
         self._qt_overlay: Optional[OverlayQt] = None
         self._last_overlay_update_ts = 0.0
+        self._overlay_canvas = None  # reused blank ROI image for the frameless overlay
+        self._overlay_det = DetectionResult(bbox=None, confidence=0.0)  # Reused by the YOLO overlay each frame
 
         pyautogui.FAILSAFE = True
         pyautogui.PAUSE = 0
+        pydirectinput.PAUSE = 0  # default 50ms sleep after every key call stalls the detection loop
 
         self.logger.info("SantaMacro initialized. Templates loaded: %d", len(self.templates))
         self.ignore_top_fraction = float(self.cfg.get("capture", {}).get("ignore_top_fraction", 0.0))
@@ -326,8 +609,9 @@ class SantaMacro:
         
         self.is_holding_arrow = False
         self.current_arrow_key = None
-        self.arrow_lock = threading.Lock()
-        self.keys_lock = threading.Lock()
+        self.arrow_lock = threading.Lock()  # Guards current_arrow_key and camera_keys_pressed
+        self._focus_cache_ts = 0.0
+        self._focus_cache_val = True
         
         self.search_state = "idle"
         self.last_santa_side = "left"
@@ -337,7 +621,29 @@ class SantaMacro:
         
         self.yolo_model = None
         self.yolo_model_path = self.cfg.get("detection", {}).get("yolo_model_path", None)
+        self.yolo_tensorrt = bool(self.cfg.get("detection", {}).get("yolo_tensorrt", False))
+        self.yolo_batch_size = max(1, int(self.cfg.get("detection", {}).get("yolo_batch_size", 1)))
+        self.yolo_skip_diff = int(self.cfg.get("detection", {}).get("yolo_skip_diff", 4000))
+        self.yolo_max_skip = int(self.cfg.get("detection", {}).get("yolo_max_skip", 3))
+        self.yolo_gpu_preprocess = bool(self.cfg.get("detection", {}).get("yolo_gpu_preprocess", True))
+        self._yolo_lb: Optional[np.ndarray] = None  # letterbox buffer fed to YOLO as a tensor
+        self._yolo_cuda = False
+        self._yolo_letterbox = None
+        self._raw_model = None
+        self._prev_small_gray: Optional[np.ndarray] = None
+        self._last_best_santa: Optional[dict] = None
+        self._yolo_skip_count = 0
+        self.yolo_async = bool(self.cfg.get("detection", {}).get("yolo_async", False))
+        self._frame_q: "queue.Queue" = queue.Queue(maxsize=1)
+        self._det_q: "queue.Queue" = queue.Queue(maxsize=1)
+        self._infer_thread: Optional[threading.Thread] = None
+        self._capture_q: "queue.Queue" = queue.Queue(maxsize=2)
+        self._capture_stop = threading.Event()
+        self._capture_thread: Optional[threading.Thread] = None
+        self._capture_bufs: List[Optional[Tuple[np.ndarray, np.ndarray]]] = [None, None]  # (bgr, gray) ping-pong
+        self._capture_buf_idx = 0
         self.santa_class_name = "Santa"
+        self._santa_cls_id = -1
         if self.yolo_model_path:
             if not os.path.isabs(self.yolo_model_path):
                 config_dir = os.path.dirname(os.path.abspath(config_path))
@@ -346,8 +652,18 @@ class SantaMacro:
             if os.path.exists(self.yolo_model_path):
                 try:
                     from ultralytics import YOLO
-                    self.yolo_model = YOLO(self.yolo_model_path)
-                    self.logger.info(f"[YOLO MODEL] Loaded from {self.yolo_model_path}")
+                    model_path = self.yolo_model_path
+                    if self.yolo_tensorrt:
+                        model_path = self._resolve_yolo_engine(self.yolo_model_path)
+                    self.yolo_model = YOLO(model_path, task="detect")
+                    self.logger.info(f"[YOLO MODEL] Loaded from {model_path}")
+                    self._santa_cls_id = self._resolve_santa_class_id()
+                    if self._santa_cls_id < 0:
+                        self.logger.warning(f"[YOLO MODEL] Class '{self.santa_class_name}' not in model classes {list(self.yolo_model.names.values())}")
+                    if self.yolo_gpu_preprocess:
+                        self._init_yolo_preprocess()
+                        if self._yolo_cuda:
+                            self._init_raw_yolo()
                 except Exception as e:
                     self.logger.error(f"[YOLO MODEL] Failed to load: {e}")
             else:
@@ -359,6 +675,137 @@ class SantaMacro:
 
 
 
+    def _resolve_yolo_engine(self, pt_path: str) -> str:
+        """Return a TensorRT FP16 engine next to the YOLO weights, exporting it once if needed.
+        Engines are per batch size (batched engines are dynamic up to yolo_batch_size so single frames still fit).
+        Falls back to the .pt weights if TensorRT is not available."""
+        batch = self.yolo_batch_size
+        engine_path = "%s_b%d.engine" % (os.path.splitext(pt_path)[0], batch)
+        if os.path.exists(engine_path) and os.path.getmtime(engine_path) >= os.path.getmtime(pt_path):
+            return engine_path
+        try:
+            from ultralytics import YOLO
+            self.logger.info("[YOLO MODEL] Exporting TensorRT engine for batch %d (one-time, may take a few minutes)...", batch)
+            exported = YOLO(pt_path).export(format="engine", half=True, imgsz=YOLO_IMGSZ, dynamic=batch > 1, batch=batch)
+            os.replace(str(exported), engine_path)
+            return engine_path
+        except Exception as e:
+            self.logger.warning(f"[YOLO MODEL] TensorRT export failed, using PyTorch weights: {e}")
+            return pt_path
+
+    def _init_yolo_preprocess(self):
+        """Allocate persistent letterbox buffers so frames reach YOLO as a ready-made tensor.
+        On CUDA the buffer is pinned and normalized on the GPU; on CPU it is normalized into a reused NCHW blob."""
+        try:
+            import torch
+            if torch.cuda.is_available():
+                self._yolo_pinned = torch.empty((YOLO_IMGSZ, YOLO_IMGSZ, 3), dtype=torch.uint8).pin_memory()
+                self._yolo_lb = self._yolo_pinned.numpy()
+                self._yolo_gpu_u8 = torch.empty((YOLO_IMGSZ, YOLO_IMGSZ, 3), dtype=torch.uint8, device="cuda")
+                self._yolo_gpu_in = torch.empty((1, 3, YOLO_IMGSZ, YOLO_IMGSZ), dtype=torch.float32, device="cuda")
+                self._yolo_cuda = True
+            else:
+                self._yolo_lb = np.empty((YOLO_IMGSZ, YOLO_IMGSZ, 3), dtype=np.uint8)
+                self._blob = np.empty((1, 3, YOLO_IMGSZ, YOLO_IMGSZ), dtype=np.float32)
+                self._blob_t = torch.from_numpy(self._blob)  # shares memory with _blob
+            self.logger.info("[YOLO MODEL] %s preprocessing enabled (%dx%d)", "GPU" if self._yolo_cuda else "Blob", YOLO_IMGSZ, YOLO_IMGSZ)
+        except Exception as e:
+            self._yolo_lb = None
+            self._yolo_cuda = False
+            self.logger.warning(f"[YOLO MODEL] Tensor preprocessing unavailable: {e}")
+
+    def _init_raw_yolo(self):
+        """Keep a fused FP16 handle on the torch module so inference can bypass the Ultralytics predictor."""
+        try:
+            import torch
+            model = self.yolo_model.model
+            if not isinstance(model, torch.nn.Module):
+                return  # exported engines only run through the predictor
+            self._raw_model = model.fuse(verbose=False).to("cuda").half().eval()
+            self._yolo_gpu_in = self._yolo_gpu_in.half()
+            if HAVE_NUMBA:
+                nms_single_class(np.zeros((1, 4), np.float32), np.zeros(1, np.float32), YOLO_NMS_IOU)  # JIT warm-up
+            self.logger.info("[YOLO MODEL] Using direct forward + Santa-only NMS")
+        except Exception as e:
+            self._raw_model = None
+            self.logger.warning(f"[YOLO MODEL] Direct forward unavailable, using predictor: {e}")
+
+    def _resolve_santa_class_id(self) -> int:
+        """Integer class id of santa_class_name in the loaded model (-1 if the model has no such class)."""
+        ids = {str(v).lower(): int(k) for k, v in self.yolo_model.names.items()}
+        return ids.get(self.santa_class_name.lower(), -1)
+
+    def _yolo_raw_detect(self, yolo_in) -> np.ndarray:
+        """Run the raw model and Santa-only NMS; returns (N, 6) x1, y1, x2, y2, conf, cls in model-input pixels."""
+        import torch
+        santa_id = self._santa_cls_id
+        if santa_id < 0:
+            return np.empty((0, 6), dtype=np.float32)
+        conf_floor = max(self.threshold, YOLO_CONF)
+        with torch.inference_mode():
+            out = self._raw_model(yolo_in)
+            pred = out[0] if isinstance(out, (list, tuple)) else out
+            pred = pred[0].transpose(0, 1)  # (anchors, 4 + nc)
+            if pred.shape[1] == 5:
+                # Single-class head: the only score column is Santa's
+                scores = pred[:, 4]
+                keep = scores >= conf_floor
+            else:
+                scores, cls_ids = pred[:, 4:].max(1)
+                keep = (cls_ids == santa_id) & (scores >= conf_floor)
+            pred, scores = pred[keep], scores[keep]
+            if pred.shape[0] == 0:
+                return np.empty((0, 6), dtype=np.float32)
+            half_wh = pred[:, 2:4] * 0.5
+            cand = torch.cat((pred[:, :2] - half_wh, pred[:, :2] + half_wh, scores[:, None]), 1).float().cpu().numpy()
+        # Only a handful of Santa boxes survive the masks, so NMS runs on the CPU without a GPU launch
+        idx = nms_single_class(cand[:, :4], cand[:, 4], YOLO_NMS_IOU)[:YOLO_MAX_DET]
+        det = np.empty((len(idx), 6), dtype=np.float32)
+        det[:, :5] = cand[idx]
+        det[:, 5] = santa_id
+        return det
+
+    def _run_yolo(self, frame_bgr: np.ndarray, frame_batch: Optional[List[np.ndarray]] = None):
+        """Run YOLO on a frame (or batch); returns ([(N, 6) boxes per frame], letterbox params or None)."""
+        letterbox = None
+        if frame_batch is not None:
+            frame_dets = [r.boxes.data.cpu().numpy() for r in self.yolo_model(frame_batch, conf=YOLO_CONF, verbose=False)]
+        elif self._yolo_lb is not None:
+            yolo_in, *letterbox = self._preprocess_yolo(frame_bgr)
+            if self._raw_model is not None:
+                frame_dets = [self._yolo_raw_detect(yolo_in)]
+            else:
+                frame_dets = [r.boxes.data.cpu().numpy() for r in self.yolo_model(yolo_in, conf=YOLO_CONF, verbose=False)]
+        else:
+            frame_dets = [r.boxes.data.cpu().numpy() for r in self.yolo_model(frame_bgr, conf=YOLO_CONF, verbose=False)]
+        return frame_dets, letterbox
+
+    def _preprocess_yolo(self, frame_bgr: np.ndarray):
+        """Letterbox the frame into the persistent buffer and turn it into a model tensor; returns (tensor, scale, pad_x, pad_y)."""
+        h, w = frame_bgr.shape[:2]
+        scale = min(YOLO_IMGSZ / h, YOLO_IMGSZ / w)
+        nw = int(round(w * scale))
+        nh = int(round(h * scale))
+        pad_x = (YOLO_IMGSZ - nw) // 2
+        pad_y = (YOLO_IMGSZ - nh) // 2
+        buf = self._yolo_lb
+        if self._yolo_letterbox != (nw, nh):
+            buf[:] = 114  # padding only needs refilling when the ROI size changes
+            self._yolo_letterbox = (nw, nh)
+        if (nw, nh) == (w, h):
+            buf[pad_y:pad_y + nh, pad_x:pad_x + nw] = frame_bgr
+        else:
+            buf[pad_y:pad_y + nh, pad_x:pad_x + nw] = cv2.resize(frame_bgr, (nw, nh), interpolation=cv2.INTER_LINEAR)
+        if not self._yolo_cuda:
+            # BGR->RGB, HWC->NCHW, uint8->float32 in [0, 1] written straight into the persistent blob
+            np.multiply(buf[..., ::-1].transpose(2, 0, 1), 1.0 / 255.0, out=self._blob[0], casting='unsafe')
+            return self._blob_t, scale, pad_x, pad_y
+        self._yolo_gpu_u8.copy_(self._yolo_pinned, non_blocking=True)
+        # HWC BGR uint8 -> NCHW RGB float in [0, 1], all on the GPU
+        self._yolo_gpu_in[0].copy_(self._yolo_gpu_u8.permute(2, 0, 1).flip(0))
+        self._yolo_gpu_in.div_(255.0)
+        return self._yolo_gpu_in, scale, pad_x, pad_y
+
     def _setup_logger(self, log_cfg: dict) -> logging.Logger:
         logger = logging.getLogger("SantaMacro")
         level = getattr(logging, log_cfg.get("level", "INFO"))
@@ -392,19 +839,26 @@ class SantaMacro:
         self.logger.info("[ZOOM] Initial zoom setup complete!")
 
     def _is_roblox_focused(self) -> bool:
-        """Check if Roblox window is currently focused."""
+        """Check if Roblox window is currently focused (cached for FOCUS_CACHE_TTL seconds)."""
+        now = time.monotonic()
+        if now - self._focus_cache_ts < FOCUS_CACHE_TTL:
+            return self._focus_cache_val
         try:
             hwnd = ctypes.windll.user32.GetForegroundWindow()
             length = ctypes.windll.user32.GetWindowTextLengthW(hwnd)
             buff = ctypes.create_unicode_buffer(length + 1)
             ctypes.windll.user32.GetWindowTextW(hwnd, buff, length + 1)
             title = buff.value
-            return "Roblox" in title or "roblox" in title.lower()
+            focused = "Roblox" in title or "roblox" in title.lower()
         except:
-            return True
+            focused = True
+        self._focus_cache_val = focused
+        self._focus_cache_ts = now
+        return focused
     
     def _force_focus_roblox(self) -> bool:
         """Forcefully focus Roblox window - critical for input to work"""
+        self._focus_cache_ts = 0.0  # foreground is about to change; re-check next time
         try:
             # Find Roblox window
             hwnd = ctypes.windll.user32.FindWindowW(None, "Roblox")
@@ -439,73 +893,145 @@ class SantaMacro:
             "height": int(frac["height"] * height),
         }
         return roi
+
+    def _recompute_edge_thresholds(self):
+        """Cache the ROI edge limits used by _check_santa_left_screen. Call whenever self.roi changes."""
+        roi_left = self.roi["left"]
+        roi_top = self.roi["top"]
+        roi_width = self.roi["width"]
+        self._edge_left = roi_left + 50
+        self._edge_right = roi_left + roi_width - 50
+        self._edge_top = roi_top + 50
+    
+    def _refresh_geom(self):
+        """Cache the ROI/monitor-derived positions/thresholds read every frame. Call whenever self.roi changes."""
+        roi_width = self.roi["width"]
+        roi_height = self.roi["height"]
+        mon = self.monitor
+        self._geom = SimpleNamespace(
+            mon_left=mon["left"],
+            mon_top=mon["top"],
+            mon_width=mon["width"],
+            mon_height=mon["height"],
+            mon_right=mon["left"] + mon["width"],
+            mon_bottom=mon["top"] + mon["height"],
+            mon_center_x=mon["left"] + mon["width"] // 2,
+            mon_center_y=mon["top"] + mon["height"] // 2,
+            deadzone_half_w=int(mon["width"] * 0.3) // 2,
+            deadzone_half_h=int(mon["height"] * 0.3) // 2,
+            roi_left=self.roi["left"],
+            roi_top=self.roi["top"],
+            roi_width=roi_width,
+            roi_height=roi_height,
+            center_x=roi_width // 2,
+            optimal_x=int(roi_width * 0.60),
+            move_threshold=roi_width * 0.30,
+            reposition_left=int(roi_width * 0.10),
+            reposition_right=int(roi_width * 0.90),
+            safe_zone_left=int(roi_width * 0.25),
+            safe_zone_right=int(roi_width * 0.75),
+            max_santa_area=roi_width * roi_height * 0.15,
+        )
     
     def _native_key_release(self, vk_code: int):
         """Force release a key using Windows SendInput API (most reliable)"""
         try:
-            # Define INPUT structure
-            PUL = ctypes.POINTER(ctypes.c_ulong)
-            
-            class KeyBdInput(ctypes.Structure):
-                _fields_ = [("wVk", ctypes.c_ushort),
-                           ("wScan", ctypes.c_ushort),
-                           ("dwFlags", ctypes.c_ulong),
-                           ("time", ctypes.c_ulong),
-                           ("dwExtraInfo", PUL)]
-            
-            class HardwareInput(ctypes.Structure):
-                _fields_ = [("uMsg", ctypes.c_ulong),
-                           ("wParamL", ctypes.c_short),
-                           ("wParamH", ctypes.c_ushort)]
-            
-            class MouseInput(ctypes.Structure):
-                _fields_ = [("dx", ctypes.c_long),
-                           ("dy", ctypes.c_long),
-                           ("mouseData", ctypes.c_ulong),
-                           ("dwFlags", ctypes.c_ulong),
-                           ("time", ctypes.c_ulong),
-                           ("dwExtraInfo", PUL)]
-            
-            class Input_I(ctypes.Union):
-                _fields_ = [("ki", KeyBdInput),
-                           ("mi", MouseInput),
-                           ("hi", HardwareInput)]
-            
-            class Input(ctypes.Structure):
-                _fields_ = [("type", ctypes.c_ulong),
-                           ("ii", Input_I)]
-            
             # Create keyup event
             extra = ctypes.c_ulong(0)
             ii_ = Input_I()
-            ii_.ki = KeyBdInput(vk_code, 0, 0x0002, 0, ctypes.pointer(extra))  # 0x0002 = KEYEVENTF_KEYUP
-            x = Input(ctypes.c_ulong(1), ii_)
+            ii_.ki = KeyBdInput(vk_code, 0, KEYEVENTF_KEYUP, 0, ctypes.pointer(extra))
+            x = Input(ctypes.c_ulong(INPUT_KEYBOARD), ii_)
             
             # Send the input
-            ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+            _SendInput(1, ctypes.byref(x), INPUT_SIZE)
             time.sleep(0.01)
         except Exception as e:
             self.logger.warning(f"[NATIVE INPUT ERROR] Failed to release VK {vk_code}: {e}")
     
+    def _send_keyups_batch(self, keys: List[Optional[str]]):
+        """Release several keys with a single SendInput call (falls back to pydirectinput off Windows).
+
+        Each key is released by virtual-key code and again by scan code, since keys pressed via _send_key
+        are scancode presses that raw-input/DirectInput games only see released by scan code."""
+        # Drop empty entries and duplicates while keeping order
+        keys = [k for k in dict.fromkeys(keys) if k]
+        if not keys:
+            return
+        vk_codes = [VK_CODES.get(k) for k in keys]
+        if IS_WINDOWS and None not in vk_codes and all(k in SCAN_CODES for k in keys):
+            try:
+                extra = ctypes.c_ulong(0)
+                events = (Input * (2 * len(keys)))()
+                for i, (key, vk) in enumerate(zip(keys, vk_codes)):
+                    events[2 * i].type = INPUT_KEYBOARD
+                    events[2 * i].ii.ki = KeyBdInput(vk, 0, KEYEVENTF_KEYUP, 0, ctypes.pointer(extra))
+                    events[2 * i + 1] = _key_input(key, False)
+                _SendInput(len(events), ctypes.byref(events), INPUT_SIZE)
+                return
+            except Exception as e:
+                self.logger.warning(f"[NATIVE INPUT ERROR] Batched key release failed: {e}")
+        for key in keys:
+            pydirectinput.keyUp(key)
+    
+    def _move_cursor(self, x: int, y: int):
+        """Move the cursor to screen (x, y) and nudge it 1px so the game registers it, in one SendInput call"""
+        if not IS_WINDOWS:
+            pyautogui.moveTo(x, y)
+            return
+        vs = self._virtual_screen
+        mi = self._mouse_events[0].ii.mi
+        mi.dx = ((x - vs["left"]) * 65535) // max(vs["width"] - 1, 1)
+        mi.dy = ((y - vs["top"]) * 65535) // max(vs["height"] - 1, 1)
+        _SendInput(2, ctypes.byref(self._mouse_events), INPUT_SIZE)
+    
+    def _send_key(self, key: str, down: bool = True):
+        """Press or release a key with one scancode SendInput (falls back to pydirectinput off Windows)"""
+        if not IS_WINDOWS or key not in SCAN_CODES:
+            if down:
+                pydirectinput.keyDown(key)
+            else:
+                pydirectinput.keyUp(key)
+            return
+        _SendInput(1, ctypes.byref(_key_input(key, down)), INPUT_SIZE)
+    
+    def _send_keys_batch(self, events: List[Tuple[str, bool]]):
+        """Send several (key, down) scancode transitions with a single SendInput call"""
+        if not IS_WINDOWS or any(key not in SCAN_CODES for key, _ in events):
+            for key, down in events:
+                self._send_key(key, down)
+            return
+        batch = (Input * len(events))(*(_key_input(key, down) for key, down in events))
+        _SendInput(len(batch), ctypes.byref(batch), INPUT_SIZE)
+    
+    def _set_arrow(self, new_key: Optional[str]) -> bool:
+        """Hold new_key as the camera arrow (None releases it). Caller must hold arrow_lock.
+        Returns True if the held arrow changed."""
+        old_key = self.current_arrow_key
+        if old_key == new_key:
+            return False
+        if old_key and new_key:
+            self._send_keys_batch([(old_key, False), (new_key, True)])
+        elif old_key:
+            self._send_key(old_key, down=False)
+        else:
+            self._send_key(new_key)
+        self.camera_keys_pressed.discard(old_key)
+        if new_key:
+            self.camera_keys_pressed.add(new_key)
+        self.current_arrow_key = new_key
+        self.is_holding_arrow = new_key is not None
+        return True
+    
     def _force_release_all_arrows(self):
         """Force release all arrow keys using native Windows API (most reliable)"""
         try:
-            # Release LEFT and RIGHT arrows using Windows SendInput
-            self._native_key_release(0x25)  # VK_LEFT
-            self._native_key_release(0x27)  # VK_RIGHT
-            
-            # Also try pydirectinput as backup
-            for key in ['left', 'right']:
-                try:
-                    pydirectinput.keyUp(key)
-                except:
-                    pass
+            # Release LEFT and RIGHT by virtual key and by scan code in one SendInput
+            self._send_keyups_batch(['left', 'right'])
             
             # Clear our tracking state
             with self.arrow_lock:
                 self.current_arrow_key = None
                 self.is_holding_arrow = False
-            with self.keys_lock:
                 self.camera_keys_pressed.clear()
             
             time.sleep(0.02)
@@ -516,10 +1042,10 @@ class SantaMacro:
         """Safely press/release a key with cleanup and delays to prevent stuck keys"""
         try:
             if action == "down":
-                pydirectinput.keyDown(key)
+                self._send_key(key)
                 time.sleep(0.01)  # Small delay after keyDown
             elif action == "up":
-                pydirectinput.keyUp(key)
+                self._send_key(key, down=False)
                 time.sleep(0.01)  # Small delay after keyUp
         except Exception as e:
             self.logger.warning(f"[INPUT ERROR] Failed to {action} key '{key}': {e}")
@@ -562,10 +1088,10 @@ class SantaMacro:
         frac = max(0.0, float(getattr(self, "ignore_top_fraction", 0.0)))
         return int(frac * self.roi["height"]) if frac > 0.0 else 0
 
-    def _grab_frame(self, mask_cursor: bool = True) -> np.ndarray:
-        shot = self.sct.grab(self.roi)
-        frame = np.array(shot)
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+    def _grab_frame(self, mask_cursor: bool = True, sct=None, out: Optional[np.ndarray] = None) -> np.ndarray:
+        shot = (sct or self.sct).grab(self.roi)
+        raw = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        frame = cv2.cvtColor(raw, cv2.COLOR_BGRA2BGR, dst=out)
         if getattr(self, "ignore_top_fraction", 0.0) > 0.0:
             mask_h = int(frame.shape[0] * self.ignore_top_fraction)
             if mask_h > 0:
@@ -609,33 +1135,228 @@ class SantaMacro:
                     frame[y0:y1, x0:x1] = 0
         return frame
 
+    def _grab_into_buffers(self, mask_cursor: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """Main-thread capture into alternating preallocated BGR/gray buffers.
+
+        Two slots so last tick's frame stays intact while this one is captured; anything kept longer must be copied."""
+        idx = self._capture_buf_idx = 1 - self._capture_buf_idx
+        slot = self._capture_bufs[idx]
+        if slot is None or slot[0].shape[:2] != (self.roi["height"], self.roi["width"]):
+            slot = (np.empty((self.roi["height"], self.roi["width"], 3), dtype=np.uint8),
+                    np.empty((self.roi["height"], self.roi["width"]), dtype=np.uint8))
+            self._capture_bufs[idx] = slot
+        frame_bgr = self._grab_frame(mask_cursor=mask_cursor, out=slot[0])
+        # The slots are reused, so array identity no longer marks a new frame; drop the downscale cache
+        self._detect_src[0] = self._detect_src[1] = None
+        return frame_bgr, cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY, dst=slot[1])
+
+    def _capture_worker(self):
+        """Grab batches of frames on a dedicated thread so capture overlaps YOLO inference."""
+        sct = mss()  # mss handles are not shareable across threads
+        while not self._capture_stop.is_set():
+            frames = []
+            stamps = []
+            for i in range(self.yolo_batch_size):
+                if i:
+                    time.sleep(self.tick_interval)
+                frames.append(self._grab_frame(mask_cursor=not (self._click_cycle_phase == "shoot"), sct=sct))
+                stamps.append(time.time())
+            try:
+                self._capture_q.put((frames, stamps), timeout=0.5)
+            except queue.Full:
+                pass
+
+    def _start_capture_thread(self):
+        if self.yolo_batch_size <= 1 or not self.yolo_model or not self.minimal_santa_mode_enabled:
+            return
+        self._capture_stop.clear()
+        self._capture_thread = threading.Thread(target=self._capture_worker, name="capture", daemon=True)
+        self._capture_thread.start()
+        self.logger.info("[CAPTURE] Batched capture thread started (batch=%d)", self.yolo_batch_size)
+
+    @staticmethod
+    def _put_latest(q: "queue.Queue", item):
+        """Put item on a size-1 queue, replacing whatever stale item is still waiting."""
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            pass
+
+    def _infer_worker(self):
+        """Run YOLO on the newest submitted frame so inference overlaps capture and input on the main thread."""
+        while not self._capture_stop.is_set():
+            try:
+                frame_bgr, frame_batch = self._frame_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                frame_dets, letterbox = self._run_yolo(frame_bgr, frame_batch)
+            except Exception as e:
+                self.logger.error(f"[YOLO ERROR] {e}")
+                frame_dets, letterbox = [], None
+            self._put_latest(self._det_q, (frame_dets, letterbox, frame_bgr))
+
+    def _start_infer_thread(self):
+        if not self.yolo_async or not self.yolo_model or not self.minimal_santa_mode_enabled:
+            return
+        self._capture_stop.clear()
+        self._infer_thread = threading.Thread(target=self._infer_worker, name="yolo-infer", daemon=True)
+        self._infer_thread.start()
+        self.logger.info("[YOLO MODEL] Inference thread started")
+
+    def _stop_infer_thread(self):
+        if self._infer_thread is None:
+            return
+        self._capture_stop.set()
+        self._infer_thread.join(timeout=1.0)
+        self._infer_thread = None
+
+    def _stop_capture_thread(self):
+        if self._capture_thread is None:
+            return
+        self._capture_stop.set()
+        self._capture_thread.join(timeout=1.0)
+        self._capture_thread = None
+
+    def _espam_worker(self):
+        """Tap E every _e_spam_interval while _espam_evt is set (click-cycle cooldown)."""
+        while not self._espam_stop.is_set():
+            if not self._espam_evt.wait(0.05):
+                continue
+            self._kbd.press('e')
+            self._kbd.release('e')
+            now = time.time()
+            self._last_e_press_ts = now
+            start_ts = self._click_cycle_start_ts
+            if start_ts is not None:
+                self.logger.info("COOLDOWN: Pressed E key (%.1fs into cooldown)", now - start_ts)
+            self._espam_stop.wait(self._e_spam_interval)
+
+    def _start_espam_thread(self):
+        self._espam_evt.clear()
+        self._espam_stop.clear()
+        self._espam_thread = threading.Thread(target=self._espam_worker, name="espam", daemon=True)
+        self._espam_thread.start()
+
+    def _stop_espam_thread(self):
+        self._espam_evt.clear()
+        if self._espam_thread is None:
+            return
+        self._espam_stop.set()
+        self._espam_thread.join(timeout=1.0)
+        self._espam_thread = None
+
+    def _disk_worker(self):
+        """Write queued (path, image) pairs until a None sentinel arrives."""
+        while True:
+            item = self._disk_q.get()
+            if item is None:
+                break
+            path, img = item
+            try:
+                cv2.imwrite(path, img)
+            except Exception as e:
+                self.logger.warning("Failed to write %s: %s", path, e)
+
+    def _start_disk_thread(self):
+        self._disk_thread = threading.Thread(target=self._disk_worker, name="disk", daemon=True)
+        self._disk_thread.start()
+
+    def _stop_disk_thread(self):
+        if self._disk_thread is None:
+            return
+        try:
+            self._disk_q.put(None, timeout=1.0)
+        except queue.Full:
+            pass
+        self._disk_thread.join(timeout=2.0)
+        self._disk_thread = None
+
+    def _queue_imwrite(self, path: str, img: np.ndarray):
+        """Hand an image to the disk thread; dropped if the writer is backed up."""
+        try:
+            self._disk_q.put_nowait((path, img.copy()))
+        except queue.Full:
+            pass
+
+    def _prepare_templates(self) -> List[Tuple[int, int, list, List[Tuple[int, int]]]]:
+        """Resize every template to every configured scale once, grouped by match size.
+
+        Returns (match_w, match_h, templates, sizes) buckets: the match size includes detect_scale,
+        sizes[i] is the full-resolution (w, h) reported in the bbox for templates[i]."""
+        buckets = {}
+        for tmpl in self.templates:
+            h, w = tmpl.shape[:2]
+            for s in self.scales:
+                scaled_w = max(1, int(w * s))
+                scaled_h = max(1, int(h * s))
+                match_w = max(1, int(scaled_w * self._detect_scale))
+                match_h = max(1, int(scaled_h * self._detect_scale))
+                tmpl_scaled = cv2.resize(tmpl, (match_w, match_h), interpolation=cv2.INTER_AREA)
+                tmpls, sizes = buckets.setdefault((match_w, match_h), ([], []))
+                tmpls.append(cv2.UMat(tmpl_scaled) if self._use_ocl else tmpl_scaled)
+                sizes.append((scaled_w, scaled_h))
+        return [(mw, mh, tmpls, sizes) for (mw, mh), (tmpls, sizes) in buckets.items()]
+
+    def _scaled_rect_kernel(self, full_k: int) -> np.ndarray:
+        """Rect structuring element for a full-resolution size, converted to detect_scale (odd, at least 3x3)."""
+        k = max(3, int(round(full_k * self._detect_scale)) | 1)
+        return cv2.getStructuringElement(cv2.MORPH_RECT, (k, k))
+
+    def _detect_input(self, frame: np.ndarray) -> np.ndarray:
+        """Return frame downscaled by detect_scale, resizing each captured frame at most once."""
+        if self._detect_scale >= 1.0:
+            return frame
+        slot = 0 if frame.ndim == 2 else 1
+        if self._detect_src[slot] is not frame:
+            self._detect_src[slot] = frame
+            self._detect_small[slot] = cv2.resize(frame, None, fx=self._detect_scale, fy=self._detect_scale, interpolation=cv2.INTER_AREA)
+        return self._detect_small[slot]
+
     def _match_templates(self, frame: np.ndarray) -> Optional[DetectionResult]:
-        if not self.templates:
+        if not self._scaled_templates:
             return DetectionResult(bbox=None, confidence=0.0)
         best_conf = -1.0
         best_bbox = None
-        frame_for_match = frame
-        for ti, tmpl in enumerate(self.templates):
-            for s in self.scales:
-                h, w = tmpl.shape[:2]
-                scaled_w = max(1, int(w * s))
-                scaled_h = max(1, int(h * s))
-                tmpl_scaled = cv2.resize(tmpl, (scaled_w, scaled_h), interpolation=cv2.INTER_AREA)
-                if frame_for_match.shape[0] < scaled_h or frame_for_match.shape[1] < scaled_w:
-                    continue
-                res = cv2.matchTemplate(frame_for_match, tmpl_scaled, self.method)
-                min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(res)
-                if self.method in (cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED):
-                    conf = 1.0 - float(min_val)
-                    loc = min_loc
-                else:
-                    conf = float(max_val)
-                    loc = max_loc
-                if conf > best_conf:
-                    x, y = loc
-                    bbox = (x, y, scaled_w, scaled_h)
-                    best_conf = conf
-                    best_bbox = bbox
+        frame = self._detect_input(frame)
+        frame_h, frame_w = frame.shape[:2]
+        # Upload the frame once per tick; matchTemplate/minMaxLoc then stay on the OpenCL device
+        frame_for_match = cv2.UMat(frame) if self._use_ocl else frame
+        use_min = self.method in (cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED)
+        inv_scale = 1.0 / self._detect_scale
+        for match_w, match_h, tmpls, sizes in self._scaled_templates:
+            if frame_h < match_h or frame_w < match_w:
+                continue
+            if len(tmpls) == 1 or self._use_ocl:
+                # Nothing to stack (or results live on the OpenCL device): one minMaxLoc per template
+                for tmpl_scaled, size in zip(tmpls, sizes):
+                    res = cv2.matchTemplate(frame_for_match, tmpl_scaled, self.method)
+                    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(res)
+                    conf, loc = (1.0 - float(min_val), min_loc) if use_min else (float(max_val), max_loc)
+                    if conf > best_conf:
+                        best_conf = conf
+                        best_bbox = (int(loc[0] * inv_scale), int(loc[1] * inv_scale)) + size
+                continue
+            # Same-size templates: correlate into one preallocated stack, reduce it, then a single minMaxLoc
+            stack_shape = (len(tmpls), frame_h - match_h + 1, frame_w - match_w + 1)
+            stack = self._corr_stacks.get((match_w, match_h))
+            if stack is None or stack.shape != stack_shape:
+                stack = np.empty(stack_shape, dtype=np.float32)
+                self._corr_stacks[(match_w, match_h)] = stack
+            for i, tmpl_scaled in enumerate(tmpls):
+                cv2.matchTemplate(frame_for_match, tmpl_scaled, self.method, result=stack[i])
+            reduced = stack.min(axis=0) if use_min else stack.max(axis=0)
+            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(reduced)
+            conf, loc = (1.0 - float(min_val), min_loc) if use_min else (float(max_val), max_loc)
+            if conf > best_conf:
+                column = stack[:, loc[1], loc[0]]
+                winner = int(column.argmin() if use_min else column.argmax())
+                best_conf = conf
+                best_bbox = (int(loc[0] * inv_scale), int(loc[1] * inv_scale)) + sizes[winner]
         if best_bbox is None:
             return DetectionResult(bbox=None, confidence=0.0)
         abs_bbox = (
@@ -648,31 +1369,24 @@ class SantaMacro:
 
     def _detect_motion_color(self, frame_bgr: np.ndarray) -> Optional[DetectionResult]:
         """Detect Santa's red sleigh using color segmentation"""
-        hsv = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
+        scale = self._detect_scale
+        hsv = cv2.cvtColor(self._detect_input(frame_bgr), cv2.COLOR_RGB2HSV)  # R/B swapped on purpose, see SLEIGH_RED_*
+        red_mask = cv2.inRange(hsv, SLEIGH_RED_LOWER, SLEIGH_RED_UPPER)
 
-        lower_red1 = np.array([0, 80, 80])
-        upper_red1 = np.array([10, 255, 255])
-        lower_red2 = np.array([160, 80, 80])
-        upper_red2 = np.array([180, 255, 255])
-
-        mask1 = cv2.inRange(hsv, lower_red1, upper_red1)
-        mask2 = cv2.inRange(hsv, lower_red2, upper_red2)
-        red_mask = cv2.bitwise_or(mask1, mask2)
-
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-        red_mask = cv2.morphologyEx(red_mask, cv2.MORPH_OPEN, kernel)
-        red_mask = cv2.morphologyEx(red_mask, cv2.MORPH_CLOSE, kernel)
+        red_mask = cv2.morphologyEx(red_mask, cv2.MORPH_OPEN, self._detect_kernel_3)
+        red_mask = cv2.morphologyEx(red_mask, cv2.MORPH_CLOSE, self._detect_kernel_3)
 
         contours, _ = cv2.findContours(red_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         if not contours:
             return None
 
         largest = max(contours, key=cv2.contourArea)
-        area = cv2.contourArea(largest)
+        # Areas/sizes below are in full-resolution pixels
+        area = cv2.contourArea(largest) / (scale * scale)
         if area < 30:
             return None
 
-        x, y, w, h = cv2.boundingRect(largest)
+        x, y, w, h = (int(v / scale) for v in cv2.boundingRect(largest))
         
         if w < 20 or h < 20:
             self.logger.debug("Rejecting tiny color detection: %dx%d (min 20x20)", w, h)
@@ -699,15 +1413,10 @@ class SantaMacro:
         if rw <= 10 or rh <= 10:
             return None
         search = frame_bgr[int(ry):int(ry+rh), int(rx):int(rx+rw)]
-        hsv = cv2.cvtColor(search, cv2.COLOR_BGR2HSV)
-        lower1 = np.array([0, 80, 80], dtype=np.uint8)
-        upper1 = np.array([10, 255, 255], dtype=np.uint8)
-        lower2 = np.array([160, 80, 80], dtype=np.uint8)
-        upper2 = np.array([179, 255, 255], dtype=np.uint8)
-        mask = cv2.inRange(hsv, lower1, upper1) | cv2.inRange(hsv, lower2, upper2)
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+        hsv = cv2.cvtColor(search, cv2.COLOR_RGB2HSV)  # R/B swapped on purpose, see SLEIGH_RED_*
+        mask = cv2.inRange(hsv, SLEIGH_RED_LOWER, SLEIGH_RED_UPPER)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, RECT_KERNEL_3)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, RECT_KERNEL_3)
         cnts, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         if not cnts:
             return None
@@ -726,45 +1435,90 @@ class SantaMacro:
         conf = min(0.95, 0.6 + area / 4000.0)
         return DetectionResult(bbox=(gx, gy, w, h), confidence=conf)
 
+    def set_detection_mode(self, mode: str):
+        """Set det_mode and bind the matching per-tick search detector (unrecognised modes behave as hybrid)."""
+        self.det_mode = mode.lower()
+        self._detect_fn = {
+            "template": self._detect_template_path,
+            "motion": self._detect_motion_path,
+        }.get(self.det_mode, self._detect_hybrid_path)
+
+    def _detect_template_path(self, frame_gray: np.ndarray, frame_bgr: np.ndarray) -> DetectionResult:
+        try:
+            return self._match_templates(frame_gray)
+        except Exception as e:
+            self.logger.error("Template matching error: %s", e)
+            return DetectionResult(bbox=None, confidence=0.0)
+
+    def _detect_motion_path(self, frame_gray: np.ndarray, frame_bgr: np.ndarray) -> DetectionResult:
+        """Red-sleigh color first, then frame-diff motion with oversized blobs rejected."""
+        try:
+            color_det = self._detect_motion_color(frame_bgr)
+            if color_det is not None:
+                if self._dbg_enabled:
+                    self.logger.debug("Found red sleigh color detection, using it (conf=%.2f)", color_det.confidence)
+                return color_det
+            det = self._detect_motion(frame_gray)
+            if det.bbox is not None:
+                _, _, w, h = det.bbox
+                det_area = w * h
+                max_santa_area = self._geom.max_santa_area
+                if det_area > max_santa_area:
+                    if self._dbg_enabled:
+                        self.logger.debug("Rejecting large motion blob (area=%.0f > max=%.0f)", det_area, max_santa_area)
+                    return DetectionResult(bbox=None, confidence=0.0)
+            return det
+        except Exception as e:
+            self.logger.error("Motion detection error: %s", e)
+            return DetectionResult(bbox=None, confidence=0.0)
+
+    def _detect_hybrid_path(self, frame_gray: np.ndarray, frame_bgr: np.ndarray) -> DetectionResult:
+        """Template match if confident enough, otherwise fall back to motion. frame_gray is always 2-D (converted at capture)."""
+        try:
+            det_t = self._match_templates(frame_gray)
+            if det_t.bbox is not None and det_t.confidence >= self.threshold:
+                return det_t
+            return self._detect_motion(frame_gray)
+        except Exception as e:
+            self.logger.error("Hybrid detection error: %s", e)
+            return DetectionResult(bbox=None, confidence=0.0)
+
     def _detect_motion(self, frame_gray: np.ndarray) -> DetectionResult:
-        if self._prev_frame_gray is None:
-            self._prev_frame_gray = frame_gray.copy()
+        scale = self._detect_scale
+        src_gray = frame_gray
+        frame_gray = self._detect_input(frame_gray)
+        # Downscaled inputs are fresh arrays and can be kept by reference; at detect_scale 1.0 the input
+        # may be a reused capture buffer that a later grab overwrites, so that case keeps a copy
+        prev_gray = frame_gray.copy() if frame_gray is src_gray else frame_gray
+        if self._prev_frame_gray is None or self._prev_frame_gray.shape != frame_gray.shape:
+            self._prev_frame_gray = prev_gray
             return DetectionResult(bbox=None, confidence=0.0)
-        blur_k = int(self.motion_cfg.get("blur_kernel", 9))
-        if blur_k % 2 == 0:
-            blur_k += 1
-        thr = int(self.motion_cfg.get("diff_threshold", 25))
-        morph_k = int(self.motion_cfg.get("morph_kernel", 5))
-        min_area = int(self.motion_cfg.get("min_area", 800))
+        blur_k = self._motion_blur_k
+        min_area = self._motion_min_area
 
         diff = cv2.absdiff(frame_gray, self._prev_frame_gray)
         diff = cv2.GaussianBlur(diff, (blur_k, blur_k), 0)
+        _, mask = cv2.threshold(diff, self._motion_thr, 255, cv2.THRESH_BINARY)
 
-        _, mask_aggressive = cv2.threshold(diff, max(10, thr - 10), 255, cv2.THRESH_BINARY)
-        _, mask_normal = cv2.threshold(diff, thr, 255, cv2.THRESH_BINARY)
-
-        mask = cv2.bitwise_or(mask_aggressive, mask_normal)
-
-        if morph_k > 1:
-            kernel_small = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (morph_k, morph_k))
-            mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
-            mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel_small)
+        if self._motion_kernel is not None:
+            mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self._motion_kernel)
+            mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self._detect_kernel_3)
 
         contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        self._prev_frame_gray = frame_gray.copy()
+        self._prev_frame_gray = prev_gray
 
-        self.logger.debug("Motion detection: blur_k=%d thr=%d morph_k=%d min_area=%d contours=%d", blur_k, thr, morph_k, min_area, len(contours))
+        self.logger.debug("Motion detection: blur_k=%d thr=%d min_area=%d contours=%d", blur_k, self._motion_thr, min_area, len(contours))
         if not contours:
             return DetectionResult(bbox=None, confidence=0.0)
 
         ignored_top = self._ignored_top_pixels()
+        ignored_top_small = ignored_top * scale
         def _y_of(c):
             return cv2.boundingRect(c)[1]
-        valid_contours = [c for c in contours if cv2.contourArea(c) >= min_area and _y_of(c) >= ignored_top]
+        valid_contours = [c for c in contours if cv2.contourArea(c) >= min_area and _y_of(c) >= ignored_top_small]
 
         if not valid_contours:
-            small_contours = [c for c in contours if cv2.contourArea(c) >= min_area * 0.25 and _y_of(c) >= ignored_top]
+            small_contours = [c for c in contours if cv2.contourArea(c) >= min_area * 0.25 and _y_of(c) >= ignored_top_small]
             if small_contours:
                 largest = max(small_contours, key=cv2.contourArea)
                 area = cv2.contourArea(largest)
@@ -783,7 +1537,8 @@ class SantaMacro:
             area = min_area * 0.15
             self.logger.debug("Motion detection: relaxed area due to tracking -> %.1f", area)
 
-        x, y, w, h = cv2.boundingRect(largest)
+        area /= scale * scale
+        x, y, w, h = (int(v / scale) for v in cv2.boundingRect(largest))
         
         if w < 20 or h < 20:
             self.logger.debug("_detect_motion: Rejecting tiny detection: %dx%d (min 20x20)", w, h)
@@ -810,14 +1565,6 @@ class SantaMacro:
 
         return DetectionResult(bbox=abs_bbox, confidence=conf)
 
-    def _ema(self, prev: Optional[float], val: float, alpha: float) -> float:
-        return val if prev is None else (alpha * val + (1 - alpha) * prev)
-
-    def _ema_pt(self, prev: Optional[Tuple[float, float]], pt: Tuple[float, float], alpha: float) -> Tuple[float, float]:
-        if prev is None:
-            return pt
-        return (alpha * pt[0] + (1 - alpha) * prev[0], alpha * pt[1] + (1 - alpha) * prev[1])
-    
     def _start_learning_phase(self):
         """Initialize learning phase to understand Santa's characteristics"""
         self._learning_start_ts = time.time()
@@ -1085,8 +1832,7 @@ class SantaMacro:
     
     def _perform_camera_drag(self, target_x: int):
         """Drag camera left to follow Santa using right-mouse drag"""
-        screen_center_x = self.monitor["left"] + self.monitor["width"] // 2
-        offset_x = target_x - screen_center_x
+        offset_x = target_x - self._geom.mon_center_x
         
         if abs(offset_x) < self.camera_center_deadzone:
             return
@@ -1127,41 +1873,86 @@ class SantaMacro:
         cx = x + w // 4  # Aim between left edge and center (1/4 width from left)
         cy = y + h // 2
         if self.clamp_to_screen:
-            screen_right = self.monitor["left"] + self.monitor["width"]
-            screen_bottom = self.monitor["top"] + self.monitor["height"]
-            cx = max(self.monitor["left"], min(screen_right - 1, cx))
-            cy = max(self.monitor["top"], min(screen_bottom - 1, cy))
+            geom = self._geom
+            cx = max(geom.mon_left, min(geom.mon_right - 1, cx))
+            cy = max(geom.mon_top, min(geom.mon_bottom - 1, cy))
         return (cx, cy)
 
-    def _update_fps(self):
-        now = time.time()
+    def _update_fps(self, now: Optional[float] = None):
+        if now is None:
+            now = time.perf_counter()
         dt = now - self._last_frame_ts
         self._last_frame_ts = now
         if dt > 0:
             self._fps = 1.0 / dt
 
+    def _set_timer_resolution(self, high: bool):
+        """Request (or release) 1 ms Windows timer resolution so short sleeps don't round up to ~15.6 ms."""
+        if not IS_WINDOWS:
+            return
+        try:
+            winmm = ctypes.WinDLL("winmm")
+            if high:
+                winmm.timeBeginPeriod(1)
+            else:
+                winmm.timeEndPeriod(1)
+        except Exception as e:
+            self.logger.warning(f"Timer resolution change failed: {e}")
+
+    def _sleep_until_next_tick(self):
+        """Sleep to the next fixed-rate tick deadline so variable per-frame work doesn't accumulate drift."""
+        now = time.perf_counter()
+        deadline = self._next_tick_deadline + self.tick_interval
+        if deadline < now:
+            # Fell more than a tick behind: resync instead of running a burst of catch-up frames
+            deadline = now
+        self._next_tick_deadline = deadline
+        delay = deadline - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def _push_detection_movement(self, cx: int, cy: int):
+        buf = self._mv_buf
+        buf[self._mv_idx, 0] = cx
+        buf[self._mv_idx, 1] = cy
+        self._mv_idx = (self._mv_idx + 1) % len(buf)
+        if self._mv_len < len(buf):
+            self._mv_len += 1
+
+    def _detection_movement_span(self) -> int:
+        """Largest X/Y range covered by the buffered detection centers."""
+        if HAVE_NUMBA:
+            return int(movement_span(self._mv_buf, self._mv_len))
+        if self._mv_len == 0:
+            return 0
+        v = self._mv_buf[:self._mv_len]
+        return int((v.max(0) - v.min(0)).max())
+
+    def _clear_detection_movement(self):
+        self._mv_idx = 0
+        self._mv_len = 0
+
     def _push_movement(self, pt: Tuple[int, int]):
         now = time.time()
         self._movement_history.append((now, pt))
         cutoff = now - 2.0
-        while self._movement_history and self._movement_history[0][0] < cutoff:
-            self._movement_history.pop(0)
+        history = self._movement_history
+        while history and history[0][0] < cutoff:
+            history.popleft()
 
     def _is_moving_naturally(self) -> bool:
         if len(self._movement_history) < 2:
             return False
         total_dist = 0.0
         total_time = 0.0
-        for i in range(1, len(self._movement_history)):
-            t0, p0 = self._movement_history[i - 1]
-            t1, p1 = self._movement_history[i]
+        samples = iter(self._movement_history)
+        t0, p0 = next(samples)
+        for t1, p1 in samples:
             dt = t1 - t0
-            if dt <= 0:
-                continue
-            dx = p1[0] - p0[0]
-            dy = p1[1] - p0[1]
-            total_dist += math.hypot(dx, dy)
-            total_time += dt
+            if dt > 0:
+                total_dist += math.hypot(p1[0] - p0[0], p1[1] - p0[1])
+                total_time += dt
+            t0, p0 = t1, p1
         if total_time <= 0:
             return False
         speed = total_dist / total_time
@@ -1277,6 +2068,7 @@ class SantaMacro:
 
     def _send_mouse_click(self, down: bool = True):
         """Send mouse click using Python pyautogui"""
+        self._focus_cache_ts = 0.0  # a click can move focus to another window
         try:
             if down:
                 pyautogui.mouseDown()
@@ -1288,19 +2080,21 @@ class SantaMacro:
             self.logger.error(f"pyautogui click failed: {e}")
     
     def _send_x_key(self, down: bool = True):
-        """Send X key press/release using pydirectinput"""
+        """Send X key press/release using SendInput"""
         try:
             if down:
-                pydirectinput.keyDown('x')
-                self.logger.info("[PYDIRECTINPUT] X key DOWN")
+                self._send_key('x')
+                self.logger.info("[INPUT] X key DOWN")
             else:
-                pydirectinput.keyUp('x')
-                self.logger.info("[PYDIRECTINPUT] X key UP")
+                self._send_key('x', down=False)
+                self.logger.info("[INPUT] X key UP")
         except Exception as e:
             self.logger.error(f"X key input failed: {e}")
     
     def _send_attack_input(self, down: bool = True):
-        """Send attack input using custom attack system"""
+        """Start (down=True) or stop the custom attack sequence; no-op if it is already in that state"""
+        if self.custom_attack_manager and self.custom_attack_manager.player.playing == down:
+            return
         if not self.custom_attack_manager:
             self.logger.error("[ATTACK] No custom attack manager available!")
             return
@@ -1415,38 +2209,53 @@ class SantaMacro:
                 tracker = None
         return tracker
 
+    def _tracker_frame(self, frame_bgr: np.ndarray, scale: int) -> np.ndarray:
+        """Downscale a frame for the CSRT/KCF tracker (pyrDown for the common 2x case)"""
+        if scale == 2:
+            return cv2.pyrDown(frame_bgr)
+        if scale > 1:
+            return cv2.resize(frame_bgr, None, fx=1.0 / scale, fy=1.0 / scale, interpolation=cv2.INTER_AREA)
+        return frame_bgr
+
     def _init_shoot_tracker(self, frame_bgr: np.ndarray, bbox_global: Tuple[int, int, int, int]):
         x, y, w, h = bbox_global
         rx = max(0, x - self.roi["left"]) 
         ry = max(0, y - self.roi["top"]) 
         rw = max(1, min(w, self.roi["width"] - rx))
         rh = max(1, min(h, self.roi["height"] - ry))
-        local_bbox = (int(rx), int(ry), int(rw), int(rh))
+        scale = self.shoot_tracker_downscale
+        local_bbox = (int(rx) // scale, int(ry) // scale, max(1, int(rw) // scale), max(1, int(rh) // scale))
         self._shoot_tracker = self._create_tracker()
         if self._shoot_tracker is not None:
             try:
-                ok = self._shoot_tracker.init(frame_bgr, local_bbox)
+                ok = self._shoot_tracker.init(self._tracker_frame(frame_bgr, scale), local_bbox)
+                self._shoot_tracker_scale = scale
                 self._shoot_track_failures = 0
-                self.logger.debug("Shoot tracker initialized at %s (local)", local_bbox)
+                if self._dbg_enabled:
+                    self.logger.debug("Shoot tracker initialized at %s (local, 1/%d scale)", local_bbox, scale)
                 return ok
             except Exception as e:
-                self.logger.debug("Shoot tracker init failed: %s", e)
+                if self._dbg_enabled:
+                    self.logger.debug("Shoot tracker init failed: %s", e)
         else:
-            self.logger.debug("Shoot tracker unavailable")
+            if self._dbg_enabled:
+                self.logger.debug("Shoot tracker unavailable")
         return False
 
     def _update_shoot_tracker(self, frame_bgr: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
         if self._shoot_tracker is None:
             return None
+        scale = self._shoot_tracker_scale
         try:
-            ok, box = self._shoot_tracker.update(frame_bgr)
+            ok, box = self._shoot_tracker.update(self._tracker_frame(frame_bgr, scale))
         except Exception as e:
-            self.logger.debug("Shoot tracker update error: %s", e)
+            if self._dbg_enabled:
+                self.logger.debug("Shoot tracker update error: %s", e)
             ok, box = False, None
         if not ok or box is None:
             self._shoot_track_failures += 1
             return None
-        lx, ly, lw, lh = [int(v) for v in box]
+        lx, ly, lw, lh = [int(v) * scale for v in box]
         gx = lx + self.roi["left"]
         gy = ly + self.roi["top"]
         self._shoot_track_failures = 0
@@ -1461,12 +2270,15 @@ class SantaMacro:
         crop = frame_bgr[int(ry):int(ry+rh), int(rx):int(rx+rw)]
         if crop.size == 0 or crop.shape[0] < 8 or crop.shape[1] < 8:
             self._shoot_tmpl = None
+            self._shoot_tmpl_u = None
             self._shoot_tmpl_size = None
             return False
         self._shoot_tmpl = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
+        self._shoot_tmpl_u = cv2.UMat(self._shoot_tmpl) if self._shoot_ocl else None
         self._shoot_tmpl_size = (int(rw), int(rh))
         self._shoot_track_box = bbox_global
-        self.logger.debug("Shoot template initialized size=%s", self._shoot_tmpl_size)
+        if self._dbg_enabled:
+            self.logger.debug("Shoot template initialized size=%s", self._shoot_tmpl_size)
         return True
 
     def _update_shoot_template(self, frame_bgr: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
@@ -1487,43 +2299,52 @@ class SantaMacro:
         search = frame_bgr[int(ry):int(ry+rh), int(rx):int(rx+rw)]
         if search.size == 0:
             return None
-        search_gray = cv2.cvtColor(search, cv2.COLOR_BGR2GRAY)
-        try:
-            res = cv2.matchTemplate(search_gray, self._shoot_tmpl, cv2.TM_CCOEFF_NORMED)
-        except Exception as e:
-            self.logger.debug("matchTemplate error: %s", e)
-            return None
+        res = None
+        if self._shoot_ocl and self._shoot_tmpl_u is not None:
+            try:
+                search_gray_u = cv2.cvtColor(cv2.UMat(search), cv2.COLOR_BGR2GRAY)
+                res = cv2.matchTemplate(search_gray_u, self._shoot_tmpl_u, cv2.TM_CCOEFF_NORMED)
+            except Exception as e:
+                self.logger.warning("OpenCL matchTemplate failed, falling back to CPU: %s", e)
+                self._shoot_ocl = False
+                self._shoot_tmpl_u = None
+                res = None
+        if res is None:
+            search_gray = cv2.cvtColor(search, cv2.COLOR_BGR2GRAY)
+            try:
+                res = cv2.matchTemplate(search_gray, self._shoot_tmpl, cv2.TM_CCOEFF_NORMED)
+            except Exception as e:
+                if self._dbg_enabled:
+                    self.logger.debug("matchTemplate error: %s", e)
+                return None
         minVal, maxVal, minLoc, maxLoc = cv2.minMaxLoc(res)
         if maxVal < self.shoot_tmpl_min_score:
-            self.logger.debug("Shoot tmpl score low: %.2f < %.2f", maxVal, self.shoot_tmpl_min_score)
+            if self._dbg_enabled:
+                self.logger.debug("Shoot tmpl score low: %.2f < %.2f", maxVal, self.shoot_tmpl_min_score)
             return None
         top_left = (int(maxLoc[0] + rx), int(maxLoc[1] + ry))
         new_box = (top_left[0] + self.roi["left"], top_left[1] + self.roi["top"], tw, th)
         self._shoot_track_box = new_box
-        self.logger.debug("Shoot tmpl update: score=%.2f box=%s", maxVal, new_box)
+        if self._dbg_enabled:
+            self.logger.debug("Shoot tmpl update: score=%.2f box=%s", maxVal, new_box)
         return new_box
 
     def _check_santa_left_screen(self, bbox: Tuple[int, int, int, int]) -> bool:
         """Check if Santa left the screen from top, left, or right edges."""
         x, y, w, h = bbox
-        screen_left = self.roi["left"]
-        screen_top = self.roi["top"]
-        screen_right = self.roi["left"] + self.roi["width"]
-        screen_bottom = self.roi["top"] + self.roi["height"]
-        
         cx = x + w // 2
         cy = y + h // 2
         
-        if cx < screen_left + 50:
-            self.logger.info("Santa left screen from LEFT edge (cx=%d < %d)", cx, screen_left + 50)
+        if cx < self._edge_left:
+            self.logger.info("Santa left screen from LEFT edge (cx=%d < %d)", cx, self._edge_left)
             return True
         
-        if cx > screen_right - 50:
-            self.logger.info("Santa left screen from RIGHT edge (cx=%d > %d)", cx, screen_right - 50)
+        if cx > self._edge_right:
+            self.logger.info("Santa left screen from RIGHT edge (cx=%d > %d)", cx, self._edge_right)
             return True
         
-        if cy < screen_top + 50:
-            self.logger.info("Santa left screen from TOP edge (cy=%d < %d)", cy, screen_top + 50)
+        if cy < self._edge_top:
+            self.logger.info("Santa left screen from TOP edge (cy=%d < %d)", cy, self._edge_top)
             return True
         
         return False
@@ -1537,13 +2358,9 @@ class SantaMacro:
         crop = frame_bgr[int(ry):int(ry+rh), int(rx):int(rx+rw)]
         if crop.size == 0:
             return 0.0
-        hsv = cv2.cvtColor(crop, cv2.COLOR_BGR2HSV)
-        lower1 = np.array([0, 100, 70], dtype=np.uint8)
-        upper1 = np.array([10, 255, 255], dtype=np.uint8)
-        lower2 = np.array([160, 100, 70], dtype=np.uint8)
-        upper2 = np.array([179, 255, 255], dtype=np.uint8)
-        mask = cv2.inRange(hsv, lower1, upper1) | cv2.inRange(hsv, lower2, upper2)
-        red = np.count_nonzero(mask)
+        hsv = cv2.cvtColor(crop, cv2.COLOR_RGB2HSV)  # R/B swapped on purpose, see HSV_RED_*
+        mask = cv2.inRange(hsv, HSV_RED_LOWER, HSV_RED_UPPER)
+        red = cv2.countNonZero(mask)
         total = crop.shape[0] * crop.shape[1]
         return float(red) / float(max(1, total))
 
@@ -1552,23 +2369,27 @@ class SantaMacro:
         x, y, w, h = bbox
         
         if w < 30 or h < 30:
-            self.logger.debug("LOCK-ON REJECTED: Too small (w=%d, h=%d < 30px)", w, h)
+            if self._dbg_enabled:
+                self.logger.debug("LOCK-ON REJECTED: Too small (w=%d, h=%d < 30px)", w, h)
             return False
         
         roi_area = self.roi["width"] * self.roi["height"]
         if (w * h) > roi_area * 0.25:
-            self.logger.debug("LOCK-ON REJECTED: Too large (area=%d > 25%% ROI)", w * h)
+            if self._dbg_enabled:
+                self.logger.debug("LOCK-ON REJECTED: Too large (area=%d > 25%% ROI)", w * h)
             return False
         
         aspect = w / max(h, 1)
         if aspect < 0.3 or aspect > 3.5:
-            self.logger.debug("LOCK-ON REJECTED: Bad aspect ratio %.2f", aspect)
+            if self._dbg_enabled:
+                self.logger.debug("LOCK-ON REJECTED: Bad aspect ratio %.2f", aspect)
             return False
         
         self._locked_on_santa = True
         self._lock_start_ts = time.time()
         self._last_movement_ts = time.time()
-        self._santa_bbox_history = [bbox]
+        self._santa_bbox_history.clear()
+        self._santa_bbox_history.append(bbox)
         self._stuck_counter = 0
         self.logger.info("LOCK-ON INITIATED: Santa detected at bbox=%s (w=%d, h=%d)", bbox, w, h)
         return True
@@ -1581,9 +2402,11 @@ class SantaMacro:
             last_bbox = self._santa_bbox_history[-1]
             last_cx, last_cy = last_bbox[0] + last_bbox[2] // 2, last_bbox[1] + last_bbox[3] // 2
             curr_cx, curr_cy = bbox[0] + bbox[2] // 2, bbox[1] + bbox[3] // 2
-            distance = math.hypot(curr_cx - last_cx, curr_cy - last_cy)
+            dx = curr_cx - last_cx
+            dy = curr_cy - last_cy
+            dist_sq = dx * dx + dy * dy
             
-            if distance < 10:
+            if dist_sq < 100:  # 10px
                 self._stuck_counter += 1
                 
                 if self._last_movement_ts:
@@ -1595,19 +2418,18 @@ class SantaMacro:
                 
                 if self._stuck_counter >= self._stuck_detection_threshold:
                     self.logger.warning("STUCK DETECTION: Bbox hasn't moved in %d frames (dist=%.1f)", 
-                                      self._stuck_counter, distance)
+                                      self._stuck_counter, math.sqrt(dist_sq))
                     self._release_lock_on(f"Stuck on static object ({self._stuck_counter} frames)")
                     return
             else:
                 self._stuck_counter = 0
                 self._last_movement_ts = now
-                self.logger.debug("Movement detected: %.1f pixels", distance)
+                if self._dbg_enabled:
+                    self.logger.debug("Movement detected: %.1f pixels", math.sqrt(dist_sq))
         else:
             self._last_movement_ts = now
         
         self._santa_bbox_history.append(bbox)
-        if len(self._santa_bbox_history) > self._max_bbox_history:
-            self._santa_bbox_history.pop(0)
     
     def _release_lock_on(self, reason: str):
         """Release lock-on and reset tracking."""
@@ -1616,10 +2438,11 @@ class SantaMacro:
         self._locked_on_santa = False
         self._lock_start_ts = None
         self._last_movement_ts = None
-        self._santa_bbox_history = []
+        self._santa_bbox_history.clear()
         self._stuck_counter = 0
         self._shoot_tracker = None
         self._shoot_tmpl = None
+        self._shoot_tmpl_u = None
         self._shoot_ref_bbox = None
         self._last_valid_bbox = None
     
@@ -1643,6 +2466,44 @@ class SantaMacro:
             self._click_started_ts = None
             self.logger.info("mouseUp")
 
+    def _tick_click_load(self, phase_elapsed: float, now: float):
+        """Advance load->shoot once the load window has elapsed and a target is known."""
+        if phase_elapsed < self.click_load_ms:
+            return
+        if self._last_valid_bbox is None:
+            self.logger.debug("Staying in LOAD phase - no valid target yet")
+            return
+        self._click_cycle_phase = "shoot"
+        self._click_cycle_start_ts = now
+        self._low_conf_start_ts = None
+        if self._locked_on_santa:
+            self.logger.info("PHASE: load->shoot (LOCKED ON)")
+        else:
+            self.logger.info("PHASE: load->shoot (TRACKING)")
+
+    def _tick_click_shoot(self, phase_elapsed: float, now: float):
+        """Advance shoot->cooldown once the shoot window has elapsed."""
+        if phase_elapsed < self.click_shoot_ms:
+            return
+        self._enter_click_cooldown(now)
+        self.logger.info("PHASE: shoot->cooldown (STAYING LOCKED for next cycle)")
+
+    def _enter_click_cooldown(self, start_ts: Optional[float]):
+        """Release the mouse and put the click cycle in cooldown; start_ts=None ends the cycle without a timed cooldown."""
+        if self._mouse_down:
+            self._click_up()
+        self._click_cycle_phase = "cooldown"
+        self._click_cycle_start_ts = start_ts
+        self._locked_aim_point = None
+        self._last_e_press_ts = None
+
+    def _tick_click_cooldown(self, phase_elapsed: float, now: float):
+        """End the cooldown so the next Santa detection can start a new cycle."""
+        if self._click_cycle_start_ts is None or phase_elapsed < self.click_cooldown_ms:
+            return
+        self._click_cycle_start_ts = None
+        self.logger.info("PHASE: cooldown complete - resetting to detect new Santa")
+
     def _should_release_click(self) -> bool:
         if not self._mouse_down:
             return False
@@ -1652,9 +2513,10 @@ class SantaMacro:
 
     def _draw_overlay(self, frame_bgr: np.ndarray, det: DetectionResult, aim: Optional[Tuple[int, int]], attack_mode: str = "custom"):
         now = time.time()
-        if now - self._last_overlay_update_ts < self.tick_interval * 0.9:
+        if now - self._last_overlay_update_ts < self._overlay_interval:
             return
         self._last_overlay_update_ts = now
+        geom = self._geom
 
         try:
             if self.overlay_engine == "qt":
@@ -1668,32 +2530,42 @@ class SantaMacro:
                     )
                     # Set up callback for settings button clicks
                     self._qt_overlay.set_settings_callback(self._on_settings_button_click)
+                if not self._qt_overlay.visible:
+                    # Minimized/hidden: nothing on screen to paint, but keep pumping events so a restore is seen
+                    self._qt_overlay.pump_events()
+                    return
             else:
                 self._ensure_overlay_window(frame_bgr.shape[1], frame_bgr.shape[0])
 
-            if self.overlay_draw_frame:
-                img = frame_bgr.copy()
-            else:
-                img = np.zeros((self.roi["height"], self.roi["width"], 3), dtype=np.uint8)
-            
-            status_text = None
-            if self.overlay_status_bar_mode:
-                if self._paused:
-                    state_display = "PAUSED"
-                elif self._running:
-                    state_display = f"ACTIVE - {self.state.upper()}"
+            # The Qt status bar paints its own canvas and only reads the frame's shape,
+            # so skip building a scratch image in that mode.
+            img = None
+            if not self.overlay_status_bar_mode or self.overlay_engine != "qt":
+                if self.overlay_draw_frame:
+                    img = frame_bgr.copy()
                 else:
-                    state_display = "INACTIVE"
-                
-                status_text = f"{state_display}\nFPS: {self._fps:.1f} | Conf: {det.confidence:.2f}"
+                    # The previous overlay frame is painted before the next tick, so clear and reuse its canvas
+                    img = self._overlay_canvas
+                    if img is None or img.shape[:2] != (geom.roi_height, geom.roi_width):
+                        img = self._overlay_canvas = np.zeros((geom.roi_height, geom.roi_width, 3), dtype=np.uint8)
+                    else:
+                        img.fill(0)
+            
+            # The status bar only shows the status word and the state detail, so hand those over directly
+            status, status_detail = "INACTIVE", ""
+            if self._paused:
+                status = "PAUSED"
+            elif self._running:
+                status, status_detail = "ACTIVE", self.state.upper()
             
             if not self.overlay_status_bar_mode:
                 if det.bbox is not None:
                     x, y, w, h = det.bbox
-                    cv2.rectangle(img, (x - self.roi["left"], y - self.roi["top"]), (x - self.roi["left"] + w, y - self.roi["top"] + h), (0, 255, 0), 3)
+                    rx, ry = x - geom.roi_left, y - geom.roi_top
+                    cv2.rectangle(img, (rx, ry), (rx + w, ry + h), (0, 255, 0), 3)
                 if aim is not None:
-                    ax = aim[0] - self.roi["left"]
-                    ay = aim[1] - self.roi["top"]
+                    ax = aim[0] - geom.roi_left
+                    ay = aim[1] - geom.roi_top
                     cv2.circle(img, (ax, ay), 6, (0, 0, 255), -1)
                     cv2.circle(img, (ax, ay), 8, (255, 255, 255), 2)
                 info = f"state={self.state} conf={det.confidence:.2f} fps={self._fps:.1f}"
@@ -1703,15 +2575,18 @@ class SantaMacro:
             if self.overlay_engine == "qt":
                 if self.overlay_status_bar_mode:
                     self._qt_overlay.update(
-                        img,
-                        status_text=status_text,
+                        frame_bgr,  # read-only
                         det_bbox=det.bbox,
                         aim_point=aim,
-                        roi_offset=(self.roi["left"], self.roi["top"]),
-                        attack_mode=attack_mode
+                        roi_offset=(geom.roi_left, geom.roi_top),
+                        attack_mode=attack_mode,
+                        status=status,
+                        detail=status_detail,
                     )
                 else:
                     self._qt_overlay.update(img)
+                # There is no Qt event loop (this loop owns the thread), so window/input events are pumped once per overlay tick
+                self._qt_overlay.pump_events()
             else:
                 cv2.imshow(self.overlay_title, img)
                 cv2.waitKey(1)
@@ -1792,7 +2667,44 @@ class SantaMacro:
         if det.confidence < self.low_conf_dump_threshold:
             ts = time.strftime("%Y%m%d_%H%M%S")
             path = os.path.join(self.dump_dir, f"lowconf_{ts}_{det.confidence:.2f}.png")
-            cv2.imwrite(path, frame_bgr)
+            self._queue_imwrite(path, frame_bgr)
+
+    def _do_stop(self):
+        """Stop the macro: halt attacks, release every held input and reset tracking state"""
+        self._running = False
+        self._paused = False
+        self.state = MacroState.IDLE
+        self._espam_evt.clear()
+        
+        # Stop custom attack sequence if running
+        if self.custom_attack_manager and self.custom_attack_manager.player.playing:
+            self.custom_attack_manager.stop_attack()
+            self.logger.info("[STOP] Stopped custom attack sequence")
+        
+        if self._mouse_down:
+            self._click_up()
+        if self._x_key_down:
+            self._send_key('x', down=False)
+            self._x_key_down = False
+        try:
+            held = self.current_arrow_key
+            # Same VK + scancode release as every other cleanup path; it takes arrow_lock and clears the tracking state
+            self._force_release_all_arrows()
+            if held:
+                self.logger.info(f"[STOP] Released {held}")
+        except Exception as e:
+            self.logger.warning(f"Error releasing keys on stop: {e}")
+        self.search_state = "idle"
+        self.attack_phase = AttackPhase.IDLE
+        self.attack_committed = False
+        self._consecutive_detections = 0
+        self._last_detection_frame = -1000
+        self._last_santa_center = None
+        self._pos_first = None
+        self._clear_detection_movement()
+        # Webhook: Macro stopped
+        if self.webhook_manager:
+            self.webhook_manager.macro_stopped()
 
     def _on_key(self, key):
         try:
@@ -1804,61 +2716,23 @@ class SantaMacro:
                 name = key.char
             except Exception:
                 name = str(key)
-        hk = self.cfg["hotkeys"]
         if isinstance(name, str):
             # Debounce hotkey presses to prevent phantom triggers
-            current_time = time.time() * 1000  # Convert to milliseconds
+            current_ns = time.monotonic_ns()
             key_lower = name.lower()
-            last_time = self._last_hotkey_time.get(key_lower, 0)
+            last_ns = self._last_hotkey_time.get(key_lower, 0)
             
-            if current_time - last_time < self._hotkey_debounce_ms:
+            if current_ns - last_ns < self._hotkey_debounce_ns:
                 self.logger.debug(f"[HOTKEY] Ignoring duplicate key press: {key_lower} (debounce)")
                 return
             
-            self._last_hotkey_time[key_lower] = current_time
+            self._last_hotkey_time[key_lower] = current_ns
             
-            if name.lower() == hk.get("toggle", "f1").lower():
+            if key_lower == self._hk_toggle_lower:
                 self.logger.info(f"[HOTKEY] Toggle key '{name}' pressed at frame {self._debug_log_counter}")
                 if self._running:
-                    self._running = False
-                    self._paused = False
-                    self.state = MacroState.IDLE
-                    
-                    # Stop custom attack sequence if running
-                    if self.custom_attack_manager and self.custom_attack_manager.player.playing:
-                        self.custom_attack_manager.stop_attack()
-                        self.logger.info("[STOP] Stopped custom attack sequence")
-                    
-                    if self._mouse_down:
-                        self._click_up()
-                    if self._x_key_down:
-                        pydirectinput.keyUp('x')
-                        self._x_key_down = False
-                    try:
-                        with self.arrow_lock:
-                            if self.current_arrow_key:
-                                pydirectinput.keyUp(self.current_arrow_key)
-                                self.logger.info(f"[STOP] Released {self.current_arrow_key}")
-                            pydirectinput.keyUp('left')
-                            pydirectinput.keyUp('right')
-                            with self.keys_lock:
-                                self.camera_keys_pressed.clear()
-                            self.is_holding_arrow = False
-                            self.current_arrow_key = None
-                    except Exception as e:
-                        self.logger.warning(f"Error releasing keys on stop: {e}")
-                    self.search_state = "idle"
-                    self.attack_phase = "idle"
-                    self.attack_committed = False
-                    self._consecutive_detections = 0
-                    self._last_detection_frame = -1000
-                    self._last_santa_center = None
-                    self._position_history.clear()
-                    self._detection_movement_history.clear()
+                    self._do_stop()
                     self.logger.info("Hotkey TOGGLE -> STOPPED (running=False)")
-                    # Webhook: Macro stopped
-                    if self.webhook_manager:
-                        self.webhook_manager.macro_stopped()
                 else:
                     if not self._zoom_performed:
                         self._perform_initial_zoom()
@@ -1870,7 +2744,7 @@ class SantaMacro:
                     # Webhook: Macro started
                     if self.webhook_manager:
                         self.webhook_manager.macro_started()
-            elif name.lower() == hk.get("start", "").lower() and hk.get("start"):
+            elif key_lower == self._hk_start_lower and self._hk_start_lower:
                 if not self._running:
                     if not self._zoom_performed:
                         self._perform_initial_zoom()
@@ -1879,41 +2753,17 @@ class SantaMacro:
                     self._paused = False
                     self.state = MacroState.DETECTING
                     self.logger.info("Hotkey START -> running=True")
-            elif name.lower() == hk.get("stop", "").lower() and hk.get("stop"):
+            elif key_lower == self._hk_stop_lower and self._hk_stop_lower:
                 if self._running:
-                    self._running = False
-                    self._paused = False
-                    self.state = MacroState.IDLE
-                    
-                    # Stop custom attack sequence if running
-                    if self.custom_attack_manager and self.custom_attack_manager.player.playing:
-                        self.custom_attack_manager.stop_attack()
-                        self.logger.info("[STOP] Stopped custom attack sequence")
-                    
-                    if self._mouse_down:
-                        self._click_up()
-                    if self._x_key_down:
-                        pydirectinput.keyUp('x')
-                        self._x_key_down = False
-                    try:
-                        with self.arrow_lock:
-                            if self.current_arrow_key:
-                                pydirectinput.keyUp(self.current_arrow_key)
-                                self.logger.info(f"[STOP] Released {self.current_arrow_key}")
-                            pydirectinput.keyUp('left')
-                            pydirectinput.keyUp('right')
-                            with self.keys_lock:
-                                self.camera_keys_pressed.clear()
-                            self.is_holding_arrow = False
-                            self.current_arrow_key = None
-                    except Exception as e:
-                        self.logger.warning(f"Error releasing keys on stop: {e}")
+                    self._do_stop()
                     self.logger.info("Hotkey STOP -> running=False")
-            elif name.lower() == hk["shutdown"].lower():
+            elif key_lower == self._hk_shutdown_lower:
                 self.state = MacroState.SHUTDOWN
                 self.logger.info("Hotkey shutdown")
 
     def start_hotkeys(self):
+        self._dbg_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        self._info_enabled = self.logger.isEnabledFor(logging.INFO)
         self._keyboard_listener = keyboard.Listener(on_press=self._on_key)
         self._keyboard_listener.start()
 
@@ -1922,976 +2772,905 @@ class SantaMacro:
             self._keyboard_listener.stop()
             self._keyboard_listener = None
 
-    def run(self):
-        self.start_hotkeys()
-        toggle_key = self.cfg["hotkeys"].get("toggle", self.cfg["hotkeys"].get("start", "F1"))
-        self.logger.info("Macro loop started. Press %s to START/STOP (toggle).", toggle_key.upper())
-        try:
-            while self.state != MacroState.SHUTDOWN:
-                start_ts = time.time()
-                
-                # Periodic cleanup to prevent stuck keys every 100 frames
-                if self._debug_log_counter - self._last_cleanup_frame >= self._cleanup_interval:
-                    self._force_release_all_arrows()
-                    self._last_cleanup_frame = self._debug_log_counter
-                    self.logger.info(f"[CLEANUP] Frame {self._debug_log_counter}: Native arrow release")
+    def _tick_minimal(self, frame_bgr: np.ndarray, frame_gray: np.ndarray, frame_batch: Optional[list], start_ts: float):
+        """One YOLO minimal-mode tick: detect, steer the camera/cursor and drive the custom attack."""
+        geom = self._geom
+        log_info = self._info_enabled
+        # Periodic-log cadence flags, computed once per tick
+        c = self._debug_log_counter
+        log5 = c % 5 == 0
+        log10 = c % 10 == 0
+        log25 = c % 25 == 0
+        log30 = c % 30 == 0
+        log50 = c % 50 == 0
+        log100 = c % 100 == 0
+        if self._debug_log_counter == 0:
+            self.logger.info("[MINIMAL MODE] Active - running YOLO detection loop")
+        
+        if log_info and log10 and self.search_state != "idle":
+            self.logger.info("[FRAME %s] search_state=%s, attack_phase=%s", self._debug_log_counter, self.search_state, self.attack_phase.name)
+        
+        if self.search_state == "searching_left":
+            # SIMPLIFIED: Just hold LEFT continuously like GPO Santa
+            if self.current_arrow_key != 'left':
+                with self.arrow_lock:
+                    if self._set_arrow('left'):
+                        self.logger.info("[SEARCH] Holding LEFT arrow")
+            
+            # Log status every 30 frames
+            if log_info and log30:
+                self.logger.info("[SEARCH] LEFT held (frame %s)", self._debug_log_counter)
+            time.sleep(0.01)
+        
+        best_santa = None
+        fresh = True  # False when best_santa is a repeat of an async result already counted on an earlier tick
+        
+        # Static-scene gate: reuse the last YOLO result while the frame has barely changed
+        small_gray = cv2.resize(frame_gray, (64, 64), interpolation=cv2.INTER_AREA)
+        reuse_last = (
+            frame_batch is None
+            and self._prev_small_gray is not None
+            and not self.is_holding_arrow
+            and self._yolo_skip_count < self.yolo_max_skip
+            and cv2.norm(small_gray, self._prev_small_gray, cv2.NORM_L1) < self.yolo_skip_diff
+        )
+        
+        if reuse_last:
+            best_santa = self._last_best_santa
+            self._yolo_skip_count += 1
+        elif self.yolo_model:
+            try:
+                if self._infer_thread is not None:
+                    # Hand this frame to the inference thread without waiting on it; act on the newest finished result
+                    self._put_latest(self._frame_q, (frame_bgr, frame_batch))
+                    try:
+                        frame_dets, letterbox, _ = self._det_q.get_nowait()
+                    except queue.Empty:
+                        # Nothing new finished since last tick: keep steering off the last completed detection
+                        frame_dets, letterbox = (), None
+                        best_santa = self._last_best_santa
+                        fresh = False
+                else:
+                    frame_dets, letterbox = self._run_yolo(frame_bgr, frame_batch)
                 
-                frame_bgr = self._grab_frame(mask_cursor=not (self._click_cycle_phase == "shoot"))
-                frame_gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
-
                 if not self._running:
-                    self.state = MacroState.IDLE
-                    det = DetectionResult(bbox=None, confidence=0.0)
-                    if self.overlay_enabled:
-                        self._update_fps()
-                        self._draw_overlay(frame_bgr, det, None, attack_mode="custom")
-                    time.sleep(self.idle_backoff_ms / 1000.0)
-                    continue
-
-                if self._paused:
-                    self.state = MacroState.PAUSED
-                    det = DetectionResult(bbox=None, confidence=0.0)
-                    if self._mouse_down:
-                        self._click_up()
-                    if self.overlay_enabled:
-                        self._update_fps()
-                        self._draw_overlay(frame_bgr, det, None, attack_mode="custom")
-                    time.sleep(self.tick_interval)
-                    continue
+                    self.logger.info("[STOP] Detected stop signal after YOLO detection")
+                    return
                 
-
-                if self.minimal_santa_mode_enabled:
-                    if self._debug_log_counter == 0:
-                        self.logger.info("[MINIMAL MODE] Active - running YOLO detection loop")
-                    
-                    if self._debug_log_counter % 10 == 0 and self.search_state != "idle":
-                        self.logger.info(f"[FRAME {self._debug_log_counter}] search_state={self.search_state}, attack_phase={self.attack_phase}")
-                    
-                    if self.search_state == "searching_left":
-                        # SIMPLIFIED: Just hold LEFT continuously like GPO Santa
-                        if not self.is_holding_arrow or self.current_arrow_key != 'left':
-                            with self.arrow_lock:
-                                # Release any other arrow first
-                                if self.current_arrow_key and self.current_arrow_key != 'left':
-                                    pydirectinput.keyUp(self.current_arrow_key)
-                                pydirectinput.keyDown('left')
-                                with self.keys_lock:
-                                    self.camera_keys_pressed.clear()
-                                    self.camera_keys_pressed.add('left')
-                                self.is_holding_arrow = True
-                                self.current_arrow_key = 'left'
-                                self.logger.info("[SEARCH] Holding LEFT arrow")
-                        
-                        # Log status every 30 frames
-                        if self._debug_log_counter % 30 == 0:
-                            self.logger.info(f"[SEARCH] LEFT held (frame {self._debug_log_counter})")
-                        time.sleep(0.01)
-                    
+                # Each entry holds one frame's boxes as (N, 6): x1, y1, x2, y2, conf, cls, filtered below with vectorized masks
+                for data in frame_dets:
+                    # Only the newest frame of a batch drives aiming; older ones just feed movement history
                     best_santa = None
+                    if log_info and log25 and len(data) > 0:
+                        self.logger.info("[YOLO RAW] Found %s detections", len(data))
+                    if len(data) == 0:
+                        continue
+                    if letterbox:
+                        # Map boxes from the letterboxed model input back to ROI pixels
+                        lb_scale, pad_x, pad_y = letterbox
+                        data[:, [0, 2]] = (data[:, [0, 2]] - pad_x) / lb_scale
+                        data[:, [1, 3]] = (data[:, [1, 3]] - pad_y) / lb_scale
                     
-                    if self.yolo_model:
-                        try:
-                            results = self.yolo_model(frame_bgr, verbose=False)
-                            
-                            if not self._running:
-                                self.logger.info("[STOP] Detected stop signal after YOLO detection")
-                                continue
-                            
-                            for result in results:
-                                boxes = result.boxes
-                                if self._debug_log_counter % 25 == 0 and len(boxes) > 0:
-                                    self.logger.info(f"[YOLO RAW] Found {len(boxes)} detections")
-                                
-                                for box in boxes:
-                                    class_id = int(box.cls[0])
-                                    class_name = result.names[class_id]
-                                    confidence = float(box.conf[0])
-                                    
-                                    if self._debug_log_counter % 25 == 0:
-                                        self.logger.info(f"[YOLO RAW] class={class_name}, conf={confidence:.4f}")
-                                    
-                                    if class_name.lower() == self.santa_class_name.lower() and confidence >= self.threshold:
-                                        x1, y1, x2, y2 = box.xyxy[0].tolist()
-                                        candidate_cx = int((x1 + x2) / 2)
-                                        candidate_cy = int((y1 + y2) / 2)
-                                        candidate_w = int(x2 - x1)
-                                        candidate_h = int(y2 - y1)
-                                        
-                                        min_santa_width = 40
-                                        min_santa_height = 25
-                                        max_santa_height = 200  # Prevent detecting tall trees
-                                        
-                                        # Reject if too small
-                                        if candidate_w < min_santa_width or candidate_h < min_santa_height:
-                                            if self._debug_log_counter % 10 == 0:
-                                                self.logger.info(f"[YOLO REJECT] Too small: {candidate_w}x{candidate_h} (min {min_santa_width}x{min_santa_height}) conf={confidence:.2f}")
-                                            continue
-                                        
-                                        # Reject if too tall (likely a tree or decoration)
-                                        if candidate_h > max_santa_height:
-                                            if self._debug_log_counter % 10 == 0:
-                                                self.logger.info(f"[YOLO REJECT] Too tall: {candidate_h}px (max {max_santa_height}px) - likely tree/decoration, conf={confidence:.2f}")
-                                            continue
-                                        
-                                        # Aspect ratio check: Santa should be roughly square or wider than tall
-                                        # Trees are much taller than wide (aspect ratio > 3.0)
-                                        # Only apply strict check during idle phase, be lenient during tracking/combat
-                                        aspect_ratio = candidate_h / candidate_w
-                                        max_aspect_ratio = 3.0 if self.attack_phase != "idle" else 2.5  # More lenient during combat
-                                        if aspect_ratio > max_aspect_ratio:
-                                            if self._debug_log_counter % 10 == 0:
-                                                self.logger.info(f"[YOLO REJECT] Too tall/narrow (aspect {aspect_ratio:.2f} > {max_aspect_ratio}) - likely tree, conf={confidence:.2f}")
-                                            continue
-                                        
-                                        is_valid_candidate = True
-                                        frames_since_search = self._debug_log_counter - getattr(self, '_search_exit_frame', -999)
-                                        skip_validation = frames_since_search < 3
-                                        
-                                        # Skip position jump validation if camera is actively moving - camera movement causes legitimate large position changes
-                                        camera_is_moving = self.current_arrow_key is not None and self.is_holding_arrow
-                                        
-                                        # Skip position jump validation during attack phases or when camera is moving
-                                        if self._last_santa_center is not None and self.search_state == "idle" and not skip_validation and self.attack_phase == "idle" and not camera_is_moving:
-                                            prev_cx, prev_cy = self._last_santa_center
-                                            jump_distance = abs(candidate_cx - prev_cx)
-                                            max_reasonable_jump = 250
-                                            
-                                            if jump_distance > max_reasonable_jump:
-                                                is_valid_candidate = False
-                                                if self._debug_log_counter % 10 == 0:
-                                                    self.logger.info(f"[YOLO REJECT] Position jump too large: X={candidate_cx} (prev={prev_cx}, jump={jump_distance}px > {max_reasonable_jump}px) conf={confidence:.2f}")
-                                        
-                                        if is_valid_candidate and self.attack_phase == "idle":
-                                            self._detection_movement_history.append((candidate_cx, candidate_cy))
-                                            if len(self._detection_movement_history) > self._max_movement_history:
-                                                self._detection_movement_history.pop(0)
-                                            
-                                            # Only check movement after collecting enough frames (reduced to 5 for faster response)
-                                            if len(self._detection_movement_history) >= 5:
-                                                x_positions = [pos[0] for pos in self._detection_movement_history]
-                                                y_positions = [pos[1] for pos in self._detection_movement_history]
-                                                x_range = max(x_positions) - min(x_positions)
-                                                y_range = max(y_positions) - min(y_positions)
-                                                total_movement = max(x_range, y_range)
-                                                
-                                                if total_movement < self._min_movement_pixels:
-                                                    is_valid_candidate = False
-                                                    self.logger.info(f"[YOLO REJECT] Static object detected (moved only {total_movement}px over 5 frames) - likely tree/decoration at X={candidate_cx}")
-                                                    self._consecutive_detections = 0
-                                                    self._detection_movement_history.clear()
-                                        
-                                        if is_valid_candidate:
-                                            if best_santa is None or confidence > best_santa['confidence']:
-                                                best_santa = {
-                                                    'box': (int(x1), int(y1), int(x2), int(y2)),
-                                                    'confidence': confidence
-                                                }
-                                                if self._debug_log_counter % 10 == 0:
-                                                    self.logger.info(f"[YOLO ACCEPT] Santa {candidate_w}x{candidate_h}, aspect={aspect_ratio:.2f}, conf={confidence:.2f}, phase={self.attack_phase}")
-                        except Exception as e:
-                            if self._debug_log_counter % 50 == 0:
-                                self.logger.error(f"[YOLO ERROR] {e}")
-                    else:
-                        if self._debug_log_counter % 100 == 0:
-                            self.logger.warning("[YOLO MODEL] Not loaded - cannot detect Santa")
+                    min_santa_width = 40
+                    min_santa_height = 25
+                    max_santa_height = 200  # Prevent detecting tall trees
+                    # Santa should be roughly square or wider than tall; trees are much taller than wide.
+                    # Only apply strict check during idle phase, be lenient during tracking/combat
+                    max_aspect_ratio = 3.0 if self.attack_phase != AttackPhase.IDLE else 2.5
                     
-                    if self._debug_log_counter % 25 == 0:
-                        if best_santa:
-                            self.logger.info(f"[DEBUG] YOLO detected Santa: {best_santa}")
-                        else:
-                            self.logger.info("[DEBUG] YOLO detection returned None")
+                    bw = data[:, 2] - data[:, 0]
+                    bh = data[:, 3] - data[:, 1]
+                    is_santa = (data[:, 5] == self._santa_cls_id) & (data[:, 4] >= self.threshold)
+                    too_small = (bw < min_santa_width) | (bh < min_santa_height)
+                    too_tall = bh > max_santa_height
+                    too_narrow = bh > max_aspect_ratio * np.maximum(bw, 1.0)
+                    keep = is_santa & ~too_small & ~too_tall & ~too_narrow
                     
-                    if not self._running:
-                        self.logger.info("[STOP] Stopping before processing Santa detection")
-                        if self._mouse_down:
-                            self._send_mouse_click(down=False)
-                            self._mouse_down = False
-                        with self.arrow_lock:
-                            if self.current_arrow_key:
-                                pydirectinput.keyUp(self.current_arrow_key)
-                                with self.keys_lock:
-                                    self.camera_keys_pressed.discard(self.current_arrow_key)
-                                self.current_arrow_key = None
-                                self.is_holding_arrow = False
-                        continue
-                    
-                    current_time = time.time()
+                    if log_info and log10 and not keep.all():
+                        n_small = int((is_santa & too_small).sum())
+                        n_tall = int((is_santa & ~too_small & too_tall).sum())
+                        n_narrow = int((is_santa & ~too_small & ~too_tall & too_narrow).sum())
+                        if n_small or n_tall or n_narrow:
+                            self.logger.info("[YOLO REJECT] small=%s (min %sx%s), tall=%s (max %spx), narrow=%s (aspect > %s)", n_small, min_santa_width, min_santa_height, n_tall, max_santa_height, n_narrow, max_aspect_ratio)
                     
-                    if best_santa:
-                        x1, y1, x2, y2 = best_santa['box']
-                        w = x2 - x1
-                        h = y2 - y1
-                        santa_cx = x1 + w // 4  # Aim between left edge and center (1/4 width from left)
-                        santa_cy = y1 + h // 2
-                        
-                        self._position_history.append((santa_cx, santa_cy))
-                        if len(self._position_history) > self._max_position_history:
-                            self._position_history.pop(0)
-                        
-                        if len(self._position_history) >= 2:
-                            dx = self._position_history[-1][0] - self._position_history[0][0]
-                            dy = self._position_history[-1][1] - self._position_history[0][1]
-                            frames = len(self._position_history)
-                            vx = dx / frames
-                            vy = dy / frames
-                            self._predicted_position = (int(santa_cx + vx * 2), int(santa_cy + vy * 2))
-                        
-                        if self._debug_log_counter % 10 == 0:
-                            self.logger.info(f"[SANTA DETECTED] Position: ({santa_cx}, {santa_cy}), size: {w}x{h}, conf: {best_santa['confidence']:.2f}")
-                            # Webhook: Santa detected (rate-limited in webhook manager)
-                            if self.webhook_manager and self._consecutive_detections == 1:
-                                self.webhook_manager.santa_detected(best_santa['confidence'], (santa_cx, santa_cy, w, h))
-                        
-                        target_x_roi = santa_cx
-                        target_y_roi = santa_cy
-                        
-                        if self._debug_log_counter % 10 == 0:
-                            self.logger.info(f"[AIM] Left-quarter of Santa (between left edge and center)")
-                        
-                        target_x = target_x_roi + self.roi["left"]
-                        target_y = target_y_roi + self.roi["top"]
+                    for x1, y1, x2, y2, confidence, _ in data[keep].tolist():
+                        candidate_cx = int((x1 + x2) / 2)
+                        candidate_cy = int((y1 + y2) / 2)
+                        candidate_w = int(x2 - x1)
+                        candidate_h = int(y2 - y1)
+                        aspect_ratio = candidate_h / candidate_w
                         
-                        if target_y < 10:
-                            target_y = 10
-                        
-                        ctypes.windll.user32.SetCursorPos(target_x, target_y)
-                        ctypes.windll.user32.mouse_event(0x0001, 0, 1, 0, 0)
-                        
-                        self._last_santa_center = (santa_cx, santa_cy)
-                        
-                        ctypes.windll.user32.SetCursorPos(target_x, target_y)
-                        ctypes.windll.user32.mouse_event(0x0001, 0, 1, 0, 0)
-                        
-                        if self._debug_log_counter % 10 == 0:
-                            self.logger.info(f"[CURSOR MOVED] ROI: ({target_x_roi}, {target_y_roi}) -> Screen: ({target_x}, {target_y})")
-                        
-                        roi_center_x = self.roi["width"] // 2
-                        optimal_position = int(self.roi["width"] * 0.60)
-                        offset_x = santa_cx - optimal_position
-                        move_threshold = self.roi["width"] * 0.30
-                        
-                        if self.search_state != "idle":
-                            with self.arrow_lock:
-                                if self.current_arrow_key is not None:
-                                    pydirectinput.keyUp(self.current_arrow_key)
-                                    with self.keys_lock:
-                                        self.camera_keys_pressed.discard(self.current_arrow_key)
-                                    self.current_arrow_key = None
-                                    self.is_holding_arrow = False
-                            self.logger.info(f"[SEARCH] Santa found! Stopping search, switching to tracking")
-                            self.search_state = "idle"
-                            self._search_exit_frame = self._debug_log_counter
+                        is_valid_candidate = True
+                        frames_since_search = self._debug_log_counter - getattr(self, '_search_exit_frame', -999)
+                        skip_validation = frames_since_search < 3
                             
-                            # CRITICAL: Clear movement history after search stops
-                            # During camera pan, static trees appear to "move" - need fresh data with camera frozen
-                            self._detection_movement_history.clear()
-                            self._consecutive_detections = 0
-                            self.logger.info(f"[MOVEMENT RESET] Cleared history - validating fresh movement with camera stopped")
-                        
-                        # If Santa detected immediately on startup (within first 3 frames), abort search
-                        if self._debug_log_counter <= 3 and self.search_state == "idle":
-                            self.logger.info(f"[STARTUP] Santa detected immediately (frame {self._debug_log_counter}) - skipping search phase")
-                        
-                        if santa_cx < roi_center_x:
-                            self.last_santa_side = "left"
-                        else:
-                            self.last_santa_side = "right"
-                        
-                        if self._debug_log_counter % 5 == 0:
-                            phase_status = f"[{self.attack_phase.upper()}]" if self.attack_phase != "idle" else "[IDLE]"
-                            self.logger.info(f"[CAMERA DEBUG] {phase_status} Santa ROI X={santa_cx}, Optimal={optimal_position}, Offset={offset_x:.0f}, Threshold={move_threshold:.0f}")
-                        
-                        
-                        # Camera repositioning during attack (inspired by GPO Santa.py)
-                        # CRITICAL: For long custom attacks, aggressively track Santa to prevent loss
-                        # Must keep Santa in view even during 20+ second attack sequences
-                        if self.attack_phase == "attacking":
-                            # Check if Santa is in the danger zone (too far left or right)
-                            # Use wider thresholds (10-90%) for more aggressive tracking during attacks
-                            reposition_threshold_left = int(self.roi["width"] * 0.10)  # Left 10% - very aggressive
-                            reposition_threshold_right = int(self.roi["width"] * 0.90)  # Right 90% - very aggressive
-                            
-                            with self.arrow_lock:
-                                if santa_cx < reposition_threshold_left:
-                                    # Santa too far left - move camera LEFT to recenter
-                                    if self.current_arrow_key != 'left':
-                                        if self.current_arrow_key:
-                                            pydirectinput.keyUp(self.current_arrow_key)
-                                            with self.keys_lock:
-                                                self.camera_keys_pressed.discard(self.current_arrow_key)
-                                        pydirectinput.keyDown('left')
-                                        with self.keys_lock:
-                                            self.camera_keys_pressed.add('left')
-                                        self.current_arrow_key = 'left'
-                                        self.is_holding_arrow = True
-                                        self._camera_has_tracked = True  # Confirmed we're tracking Santa
-                                        if self._debug_log_counter % 5 == 0:  # More frequent logging
-                                            self.logger.info(f"[{self.attack_phase.upper()} TRACK] Santa at X={santa_cx} too far LEFT - repositioning camera")
-                                elif santa_cx > reposition_threshold_right:
-                                    # Santa too far right - move camera RIGHT to recenter
-                                    if self.current_arrow_key != 'right':
-                                        if self.current_arrow_key:
-                                            pydirectinput.keyUp(self.current_arrow_key)
-                                            with self.keys_lock:
-                                                self.camera_keys_pressed.discard(self.current_arrow_key)
-                                        pydirectinput.keyDown('right')
-                                        with self.keys_lock:
-                                            self.camera_keys_pressed.add('right')
-                                        self.current_arrow_key = 'right'
-                                        self.is_holding_arrow = True
-                                        self._camera_has_tracked = True  # Confirmed we're tracking Santa
-                                        if self._debug_log_counter % 5 == 0:  # More frequent logging
-                                            self.logger.info(f"[{self.attack_phase.upper()} TRACK] Santa at X={santa_cx} too far RIGHT - repositioning camera")
-                                else:
-                                    # Santa is centered enough - release arrow keys
-                                    if self.current_arrow_key is not None:
-                                        key_to_release = self.current_arrow_key
-                                        pydirectinput.keyUp(key_to_release)
-                                        with self.keys_lock:
-                                            self.camera_keys_pressed.discard(key_to_release)
-                                        self.current_arrow_key = None
-                                        self.is_holding_arrow = False
-                        
-                        self._last_detection_frame = self._debug_log_counter
-                        self._consecutive_detections += 1
-                        current_time = time.time()
-                        
-                        # Log detection state every 25 frames
-                        if self._debug_log_counter % 25 == 0:
-                            self.logger.info(f"[DETECTION STATE] consecutive={self._consecutive_detections}, attack_phase={self.attack_phase}, has_attacked={self._has_attacked_successfully}")
-                        
-                        can_start_attack = False
-                        # Simple: If YOLO consistently detects Santa, attack
-                        required_detections = 3
-                        
-                        if self.attack_phase == "idle" and self._consecutive_detections >= required_detections:
-                            # YOLO detected Santa consistently - that's enough validation
-                            can_start_attack = True
-                            if self._has_attacked_successfully:
-                                self.logger.info(f"[ATTACK] Santa detected {self._consecutive_detections} times, restarting attack")
-                            else:
-                                self.logger.info(f"[ATTACK] Santa detected {self._consecutive_detections} times, starting first attack")
-                        
-                        if can_start_attack:
-                            safe_zone_left = int(self.roi["width"] * 0.25)
-                            safe_zone_right = int(self.roi["width"] * 0.75)
-                            
-                            if santa_cx < safe_zone_left:
-                                self.logger.info(f"[ATTACK BLOCKED] Santa at X={santa_cx} LEFT of safe zone (< {safe_zone_left}) - moving camera LEFT")
-                                can_start_attack = False
-                                with self.arrow_lock:
-                                    if self.current_arrow_key != "left":
-                                        if self.current_arrow_key is not None:
-                                            pydirectinput.keyUp(self.current_arrow_key)
-                                            with self.keys_lock:
-                                                self.camera_keys_pressed.discard(self.current_arrow_key)
-                                        pydirectinput.keyDown("left")
-                                        with self.keys_lock:
-                                            self.camera_keys_pressed.add("left")
-                                        self.current_arrow_key = "left"
-                                        self.is_holding_arrow = True
-                                        self._camera_has_tracked = True  # Mark that we've tracked Santa
-                            elif santa_cx > safe_zone_right:
-                                self.logger.info(f"[ATTACK BLOCKED] Santa at X={santa_cx} RIGHT of safe zone (> {safe_zone_right}) - moving camera RIGHT")
-                                can_start_attack = False
-                                with self.arrow_lock:
-                                    if self.current_arrow_key != "right":
-                                        if self.current_arrow_key is not None:
-                                            pydirectinput.keyUp(self.current_arrow_key)
-                                            with self.keys_lock:
-                                                self.camera_keys_pressed.discard(self.current_arrow_key)
-                                        pydirectinput.keyDown("right")
-                                        with self.keys_lock:
-                                            self.camera_keys_pressed.add("right")
-                                        self.current_arrow_key = "right"
-                                        self.is_holding_arrow = True
-                                        self._camera_has_tracked = True  # Mark that we've tracked Santa
-                        
-                        if can_start_attack:
-                            # CRITICAL: Restore Roblox focus before attack
-                            # Mouse clicks and long operations can steal focus, breaking all inputs
-                            if not self._is_roblox_focused():
-                                self.logger.info("[FOCUS] Restoring Roblox focus before attack...")
-                                self._force_focus_roblox()
-                                time.sleep(0.05)  # Brief delay for focus to take effect
-                            
-                            self.logger.info(f"[ATTACK START] Santa detected {self._consecutive_detections} times, starting attack now")
-                            
-                            # Webhook: Attack started
-                            if self.webhook_manager:
-                                self.webhook_manager.attack_started("custom")
+                        # Skip position jump validation if camera is actively moving - camera movement causes legitimate large position changes
+                        camera_is_moving = self.current_arrow_key is not None and self.is_holding_arrow
                             
-                            # Start custom attack sequence with looping
-                            if self.custom_attack_manager and self.custom_attack_manager.is_custom_enabled():
-                                if not self.custom_attack_manager.player.playing:
-                                    self.custom_attack_manager.play_custom_attack(loop=True)
-                                    self.attack_phase = "attacking"  # Simple state
-                                    self.attack_phase_start = current_time
-                                    self.logger.info("[CUSTOM ATTACK] Started looping custom attack sequence")
-                        elif self.attack_phase == "attacking":
-                            # Custom attack is running - just keep tracking Santa
-                            # The custom attack player handles everything: sequence -> E spam -> loop
-                            # NEVER stop the attack sequence automatically - only F1 stops it
-                            # Even if Santa is lost, keep the attack running while searching
-                            if self._debug_log_counter % 50 == 0:
-                                self.logger.info("[ATTACKING] Custom attack sequence running, tracking Santa...")
-                        
-                        # No more LOAD/FIRE/COOLDOWN phases - custom attack handles everything
-                        
-                        if self.overlay_enabled:
-                            self._update_fps()
-                            overlay_x = x1 + self.roi["left"]
-                            overlay_y = y1 + self.roi["top"]
-                            overlay_bbox = (overlay_x, overlay_y, w, h)
-                            det = DetectionResult(bbox=overlay_bbox, confidence=best_santa['confidence'])
-                            self._draw_overlay(frame_bgr, det, (target_x, target_y), attack_mode="custom")
-                    else:
-                        if not self._running:
-                            self.logger.info("[STOP] Stopping in no-detection branch")
-                            if self._mouse_down or self._x_key_down:
-                                self._send_attack_input(down=False)
-                            with self.arrow_lock:
-                                if self.current_arrow_key:
-                                    pydirectinput.keyUp(self.current_arrow_key)
-                                    with self.keys_lock:
-                                        self.camera_keys_pressed.discard(self.current_arrow_key)
-                                    self.current_arrow_key = None
-                                    self.is_holding_arrow = False
-                            continue
-                        
-                        if self._last_detection_frame >= 0:
-                            frames_since_detection = self._debug_log_counter - self._last_detection_frame
-                        else:
-                            frames_since_detection = 9999
-                        
-                        if frames_since_detection <= self._detection_grace_frames and self._last_detection_frame >= 0:
-                            # Custom attack is running - no special handling needed during grace period
-                            # Just track predicted position if available
-                            
-                            # Extended prediction window during attacks
-                            prediction_window = 30 if self.attack_phase == "attacking" else 15
-                            if self._predicted_position and frames_since_detection < prediction_window:
-                                pred_x_roi, pred_y_roi = self._predicted_position
-                                pred_x = pred_x_roi + self.roi["left"]
-                                pred_y = pred_y_roi + self.roi["top"]
-                                pred_x = max(self.monitor["left"], min(pred_x, self.monitor["left"] + self.monitor["width"]))
-                                pred_y = max(self.monitor["top"], min(pred_y, self.monitor["top"] + self.monitor["height"]))
-                                ctypes.windll.user32.SetCursorPos(pred_x, pred_y)
-                                ctypes.windll.user32.mouse_event(0x0001, 0, 1, 0, 0)
-                                if self._debug_log_counter % 25 == 0:
-                                    self.logger.info(f"[GRACE] Tracking predicted position ({frames_since_detection}/{self._detection_grace_frames})")
-                            elif self._debug_log_counter % 25 == 0:
-                                self.logger.info(f"[GRACE] Keeping lock ({frames_since_detection}/{self._detection_grace_frames} frames)")
-                        else:
-                            self._consecutive_detections = 0
-                            if self._last_santa_center is not None:
-                                self._last_santa_center = None
-                                self.logger.info("[POSITION RESET] Grace expired, clearing old position data")
-                            self._detection_movement_history.clear()
-                            if self._debug_log_counter % 50 == 0:
-                                self.logger.info("[SEARCHING] Looking for Santa...")
-                            
-                            # IMPORTANT: Continue searching for Santa even during attack sequence!
-                            # The attack sequence will keep playing, but camera needs to find Santa
-                            if self.search_state == "idle":
-                                # CRITICAL: Force-release ALL arrows before starting search
-                                self._force_release_all_arrows()
-                                
-                                self._last_santa_center = None
-                                self._detection_movement_history.clear()
+                        # Skip position jump validation during attack phases or when camera is moving
+                        if self._last_santa_center is not None and self.search_state == "idle" and not skip_validation and self.attack_phase == AttackPhase.IDLE and not camera_is_moving:
+                            prev_cx, prev_cy = self._last_santa_center
+                            jump_distance = abs(candidate_cx - prev_cx)
+                            max_reasonable_jump = 250
                                 
-                                # CRITICAL: Restore Roblox focus before search
-                                # Camera movement requires focus to work
-                                if not self._is_roblox_focused():
-                                    self.logger.info("[FOCUS] Restoring Roblox focus for search...")
-                                    self._force_focus_roblox()
-                                    time.sleep(0.05)  # Brief delay for focus to take effect
-                                
-                                # Always search left when Santa is lost
-                                self.search_state = "searching_left"
-                                attack_status = " (DURING ATTACK)" if self.attack_phase == "attacking" else ""
-                                self.logger.info(f"[SEARCH] Santa lost{attack_status}, searching left...")
+                            if jump_distance > max_reasonable_jump:
+                                is_valid_candidate = False
+                                if log_info and log10:
+                                    self.logger.info("[YOLO REJECT] Position jump too large: X=%s (prev=%s, jump=%spx > %spx) conf=%.2f", candidate_cx, prev_cx, jump_distance, max_reasonable_jump, confidence)
+                            
+                        if is_valid_candidate and self.attack_phase == AttackPhase.IDLE:
+                            self._push_detection_movement(candidate_cx, candidate_cy)
                                 
-                                # CRITICAL: Force-release all arrows before starting search
-                                self._force_release_all_arrows()
-                                self.logger.info(f"[SEARCH] Force-released all arrows - ready for clean search")
+                            # Only check movement after collecting enough frames (reduced to 5 for faster response)
+                            if self._mv_len >= 5:
+                                total_movement = self._detection_movement_span()
+                                    
+                                if total_movement < self._min_movement_pixels:
+                                    is_valid_candidate = False
+                                    self.logger.info("[YOLO REJECT] Static object detected (moved only %spx over 5 frames) - likely tree/decoration at X=%s", total_movement, candidate_cx)
+                                    self._consecutive_detections = 0
+                                    self._clear_detection_movement()
                             
-                            self._predicted_position = None
-                            self._position_history.clear()
-                            self._smoothed_cursor_pos = None
-                        
-                        if self.overlay_enabled:
-                            self._update_fps()
-                            det = DetectionResult(bbox=None, confidence=0.0)
-                            self._draw_overlay(frame_bgr, det, None, attack_mode="custom")
-                    
-                    self._debug_log_counter += 1
-                    time.sleep(self.tick_interval)
-                    continue
-
-                det = DetectionResult(bbox=None, confidence=0.0)
+                        if is_valid_candidate:
+                            if best_santa is None or confidence > best_santa['confidence']:
+                                best_santa = {
+                                    'box': (int(x1), int(y1), int(x2), int(y2)),
+                                    'confidence': confidence
+                                }
+                                if log_info and log10:
+                                    self.logger.info("[YOLO ACCEPT] Santa %sx%s, aspect=%.2f, conf=%.2f, phase=%s", candidate_w, candidate_h, aspect_ratio, confidence, self.attack_phase.name)
+            except Exception as e:
+                if log50:
+                    self.logger.error(f"[YOLO ERROR] {e}")
+            self._prev_small_gray = small_gray
+            self._last_best_santa = best_santa
+            self._yolo_skip_count = 0
+        else:
+            if log100:
+                self.logger.warning("[YOLO MODEL] Not loaded - cannot detect Santa")
+        
+        if log_info and log25:
+            if best_santa:
+                self.logger.info("[DEBUG] YOLO detected Santa: %s", best_santa)
+            else:
+                self.logger.info("[DEBUG] YOLO detection returned None")
+        
+        if not self._running:
+            self.logger.info("[STOP] Stopping before processing Santa detection")
+            if self._mouse_down:
+                self._send_mouse_click(down=False)
+                self._mouse_down = False
+            with self.arrow_lock:
+                self._set_arrow(None)
+            return
+        
+        current_time = start_ts  # one monotonic timestamp per tick
+        
+        if best_santa:
+            x1, y1, x2, y2 = best_santa['box']
+            w = x2 - x1
+            h = y2 - y1
+            santa_cx = x1 + w // 4  # Aim between left edge and center (1/4 width from left)
+            santa_cy = y1 + h // 2
+            
+            # Stale async repeats only steer; the position history already has this sample
+            pos_first = self._pos_first
+            if fresh and pos_first is None:
+                self._pos_first = (santa_cx, santa_cy)
+                self._pos_count = 1
+            elif fresh:
+                self._pos_count += 1
+                frames = self._pos_count
+                vx = (santa_cx - pos_first[0]) / frames
+                vy = (santa_cy - pos_first[1]) / frames
+                self._predicted_position = (int(santa_cx + vx * 2), int(santa_cy + vy * 2))
+                if frames >= self._max_position_history:
+                    # Restart the window here so the estimate follows recent motion
+                    self._pos_first = (santa_cx, santa_cy)
+                    self._pos_count = 1
+            
+            if log10:
+                self.logger.info("[SANTA DETECTED] Position: (%s, %s), size: %sx%s, conf: %.2f", santa_cx, santa_cy, w, h, best_santa['confidence'])
+                # Webhook: Santa detected (rate-limited in webhook manager)
+                if self.webhook_manager and self._consecutive_detections == 1:
+                    self.webhook_manager.santa_detected(best_santa['confidence'], (santa_cx, santa_cy, w, h))
+            
+            target_x_roi = santa_cx
+            target_y_roi = santa_cy
+            
+            if log_info and log10:
+                self.logger.info("[AIM] Left-quarter of Santa (between left edge and center)")
+            
+            target_x = target_x_roi + geom.roi_left
+            target_y = max(target_y_roi + geom.roi_top, 10)
+            self._move_cursor(target_x, target_y)
+            
+            if fresh:
+                self._last_santa_center = (santa_cx, santa_cy)
+            
+            if log_info and log10:
+                self.logger.info("[CURSOR MOVED] ROI: (%s, %s) -> Screen: (%s, %s)", target_x_roi, target_y_roi, target_x, target_y)
+            
+            roi_center_x = geom.center_x
+            optimal_position = geom.optimal_x
+            offset_x = santa_cx - optimal_position
+            move_threshold = geom.move_threshold
+            
+            if self.search_state != "idle":
+                with self.arrow_lock:
+                    self._set_arrow(None)
+                self.logger.info("[SEARCH] Santa found! Stopping search, switching to tracking")
+                self.search_state = "idle"
+                self._search_exit_frame = self._debug_log_counter
                 
-                if self.lock_on_enabled and not self._locked_santa and self._learning_start_ts is None:
-                    if self.det_mode == "motion":
-                        color_det = self._detect_motion_color(frame_bgr)
-                        if color_det and color_det.bbox:
-                            x, y, w, h = color_det.bbox
-                            if w >= self.min_santa_size and h >= self.min_santa_size:
-                                self._start_learning_phase()
-                                det = color_det
-                            else:
-                                if self._debug_log_counter % 50 == 0:
-                                    self.logger.debug("Skipping small detection during search: %dx%d", w, h)
-                    else:
-                        det = self._match_templates(frame_gray) if self.det_mode == "template" else self._detect_motion(frame_gray)
-                        if det.bbox:
-                            self._start_learning_phase()
+                # CRITICAL: Clear movement history after search stops
+                # During camera pan, static trees appear to "move" - need fresh data with camera frozen
+                self._clear_detection_movement()
+                self._consecutive_detections = 0
+                self.logger.info("[MOVEMENT RESET] Cleared history - validating fresh movement with camera stopped")
+            
+            # If Santa detected immediately on startup (within first 3 frames), abort search
+            if self._debug_log_counter <= 3 and self.search_state == "idle":
+                self.logger.info("[STARTUP] Santa detected immediately (frame %s) - skipping search phase", self._debug_log_counter)
+            
+            self.last_santa_side = SIDE_NAMES[santa_cx >= roi_center_x]
+            
+            if log_info and log5:
+                self.logger.info("[CAMERA DEBUG] [%s] Santa ROI X=%s, Optimal=%s, Offset=%.0f, Threshold=%.0f", self.attack_phase.name, santa_cx, optimal_position, offset_x, move_threshold)
+            
+            
+            # Camera repositioning during attack (inspired by GPO Santa.py)
+            # CRITICAL: For long custom attacks, aggressively track Santa to prevent loss
+            # Must keep Santa in view even during 20+ second attack sequences
+            if self.attack_phase == AttackPhase.ATTACKING:
+                # Check if Santa is in the danger zone (too far left or right)
+                # Use wider thresholds (10-90%) for more aggressive tracking during attacks
+                reposition_threshold_left = geom.reposition_left  # Left 10% - very aggressive
+                reposition_threshold_right = geom.reposition_right  # Right 90% - very aggressive
                 
-                elif self.state == MacroState.LEARNING:
-                    elapsed = time.time() - self._learning_start_ts
+                # -1: too far left, +1: too far right, 0: centered enough (release arrows)
+                dir_code = (santa_cx > reposition_threshold_right) - (santa_cx < reposition_threshold_left)
+                target_arrow = ARROW_FOR_DIR[dir_code + 1]
+                # Unlocked pre-check: most frames keep the same arrow, so skip the lock entirely
+                if self.current_arrow_key != target_arrow:
+                    with self.arrow_lock:
+                        if self._set_arrow(target_arrow) and target_arrow:
+                            self._camera_has_tracked = True  # Confirmed we're tracking Santa
+                            if log_info and log5:  # More frequent logging
+                                self.logger.info("[%s TRACK] Santa at X=%s too far %s - repositioning camera", self.attack_phase.name, santa_cx, target_arrow.upper())
+            
+            if fresh:
+                # Only new results count toward confirmation; stale repeats would let one hit start an attack
+                self._last_detection_frame = self._debug_log_counter
+                self._consecutive_detections += 1
+            
+            # Log detection state every 25 frames
+            if log_info and log25:
+                self.logger.info("[DETECTION STATE] consecutive=%s, attack_phase=%s, has_attacked=%s", self._consecutive_detections, self.attack_phase.name, self._has_attacked_successfully)
+            
+            can_start_attack = False
+            # Simple: If YOLO consistently detects Santa, attack
+            required_detections = 3
+            
+            if fresh and self.attack_phase == AttackPhase.IDLE and self._consecutive_detections >= required_detections:
+                # YOLO detected Santa consistently - that's enough validation
+                can_start_attack = True
+                if self._has_attacked_successfully:
+                    self.logger.info("[ATTACK] Santa detected %s times, restarting attack", self._consecutive_detections)
+                else:
+                    self.logger.info("[ATTACK] Santa detected %s times, starting first attack", self._consecutive_detections)
+            
+            if can_start_attack:
+                safe_zone_left = geom.safe_zone_left
+                safe_zone_right = geom.safe_zone_right
+                
+                if santa_cx < safe_zone_left:
+                    self.logger.info("[ATTACK BLOCKED] Santa at X=%s LEFT of safe zone (< %s) - moving camera LEFT", santa_cx, safe_zone_left)
+                    can_start_attack = False
+                    if self.current_arrow_key != "left":
+                        with self.arrow_lock:
+                            if self._set_arrow("left"):
+                                self._camera_has_tracked = True  # Mark that we've tracked Santa
+                elif santa_cx > safe_zone_right:
+                    self.logger.info("[ATTACK BLOCKED] Santa at X=%s RIGHT of safe zone (> %s) - moving camera RIGHT", santa_cx, safe_zone_right)
+                    can_start_attack = False
+                    if self.current_arrow_key != "right":
+                        with self.arrow_lock:
+                            if self._set_arrow("right"):
+                                self._camera_has_tracked = True  # Mark that we've tracked Santa
+            
+            if can_start_attack:
+                # CRITICAL: Restore Roblox focus before attack
+                # Mouse clicks and long operations can steal focus, breaking all inputs
+                if not self._is_roblox_focused():
+                    self.logger.info("[FOCUS] Restoring Roblox focus before attack...")
+                    self._force_focus_roblox()
+                    time.sleep(0.05)  # Brief delay for focus to take effect
+                
+                self.logger.info("[ATTACK START] Santa detected %s times, starting attack now", self._consecutive_detections)
+                
+                # Webhook: Attack started
+                if self.webhook_manager:
+                    self.webhook_manager.attack_started("custom")
+                
+                # Start custom attack sequence with looping
+                cam = self.custom_attack_manager
+                if cam and not cam.player.playing and cam.is_custom_enabled():
+                    cam.play_custom_attack(loop=True)
+                    self.attack_phase = AttackPhase.ATTACKING  # Simple state
+                    self.attack_phase_start = current_time
+                    self.logger.info("[CUSTOM ATTACK] Started looping custom attack sequence")
+            elif self.attack_phase == AttackPhase.ATTACKING:
+                # Custom attack is running - just keep tracking Santa
+                # The custom attack player handles everything: sequence -> E spam -> loop
+                # NEVER stop the attack sequence automatically - only F1 stops it
+                # Even if Santa is lost, keep the attack running while searching
+                if log_info and log50:
+                    self.logger.info("[ATTACKING] Custom attack sequence running, tracking Santa...")
+            
+            # No more LOAD/FIRE/COOLDOWN phases - custom attack handles everything
+            
+            if self.overlay_enabled:
+                self._update_fps(start_ts)
+                det = self._overlay_det
+                det.bbox = (x1 + geom.roi_left, y1 + geom.roi_top, w, h)
+                det.confidence = best_santa['confidence']
+                self._draw_overlay(frame_bgr, det, (target_x, target_y), attack_mode="custom")
+        else:
+            if not self._running:
+                self.logger.info("[STOP] Stopping in no-detection branch")
+                self._send_attack_input(down=False)
+                with self.arrow_lock:
+                    self._set_arrow(None)
+                return
+            
+            if self._last_detection_frame >= 0:
+                frames_since_detection = self._debug_log_counter - self._last_detection_frame
+            else:
+                frames_since_detection = 9999
+            
+            if frames_since_detection <= self._detection_grace_frames and self._last_detection_frame >= 0:
+                # Custom attack is running - no special handling needed during grace period
+                # Just track predicted position if available
+                
+                # Extended prediction window during attacks
+                prediction_window = 30 if self.attack_phase == AttackPhase.ATTACKING else 15
+                if self._predicted_position and frames_since_detection < prediction_window:
+                    pred_x_roi, pred_y_roi = self._predicted_position
+                    pred_x = pred_x_roi + geom.roi_left
+                    pred_y = pred_y_roi + geom.roi_top
+                    pred_x = geom.mon_left if pred_x < geom.mon_left else (geom.mon_right if pred_x > geom.mon_right else pred_x)
+                    pred_y = geom.mon_top if pred_y < geom.mon_top else (geom.mon_bottom if pred_y > geom.mon_bottom else pred_y)
+                    self._move_cursor(pred_x, pred_y)
+                    if log_info and log25:
+                        self.logger.info("[GRACE] Tracking predicted position (%s/%s)", frames_since_detection, self._detection_grace_frames)
+                elif log_info and log25:
+                    self.logger.info("[GRACE] Keeping lock (%s/%s frames)", frames_since_detection, self._detection_grace_frames)
+            else:
+                self._consecutive_detections = 0
+                if self._last_santa_center is not None:
+                    self._last_santa_center = None
+                    self.logger.info("[POSITION RESET] Grace expired, clearing old position data")
+                self._clear_detection_movement()
+                if log_info and log50:
+                    self.logger.info("[SEARCHING] Looking for Santa...")
+                
+                # IMPORTANT: Continue searching for Santa even during attack sequence!
+                # The attack sequence will keep playing, but camera needs to find Santa
+                if self.search_state == "idle":
+                    # CRITICAL: Force-release ALL arrows before starting search
+                    self._force_release_all_arrows()
                     
-                    if elapsed < self.learning_duration:
-                        if self.det_mode == "motion":
-                            color_det = self._detect_motion_color(frame_bgr)
-                            if color_det and color_det.bbox:
-                                det = color_det
-                                self._process_learning_sample(det.bbox, frame_bgr, det.confidence)
-                            else:
-                                if self._debug_log_counter % 25 == 0:
-                                    self.logger.debug("Learning: temporary detection loss")
-                        else:
-                            det = self._match_templates(frame_gray) if self.det_mode == "template" else self._detect_motion(frame_gray)
-                            if det.bbox:
-                                self._process_learning_sample(det.bbox, frame_bgr, det.confidence)
-                    else:
-                        self._finalize_learning()
+                    self._last_santa_center = None
+                    self._clear_detection_movement()
+                    
+                    # CRITICAL: Restore Roblox focus before search
+                    # Camera movement requires focus to work
+                    if not self._is_roblox_focused():
+                        self.logger.info("[FOCUS] Restoring Roblox focus for search...")
+                        self._force_focus_roblox()
+                        time.sleep(0.05)  # Brief delay for focus to take effect
+                    
+                    # Always search left when Santa is lost
+                    self.search_state = "searching_left"
+                    attack_status = " (DURING ATTACK)" if self.attack_phase == AttackPhase.ATTACKING else ""
+                    self.logger.info("[SEARCH] Santa lost%s, searching left...", attack_status)
+                    
+                    # CRITICAL: Force-release all arrows before starting search
+                    self._force_release_all_arrows()
+                    self.logger.info("[SEARCH] Force-released all arrows - ready for clean search")
                 
-                elif self._locked_santa:
-                    self.state = MacroState.DETECTING
+                self._predicted_position = None
+                self._pos_first = None
+                self._smoothed_cursor_pos = None
+            
+            if self.overlay_enabled:
+                self._update_fps(start_ts)
+                det = NO_DETECTION
+                self._draw_overlay(frame_bgr, det, None, attack_mode="custom")
+        
+        self._debug_log_counter += 1
+        self._sleep_until_next_tick()
+
+    def _update_smart_tracking(self, now: float, c: int, frame_gray: np.ndarray, frame_bgr: np.ndarray):
+        """Legacy smart-tracking pass: start and feed the learning phase, then follow the learned profile."""
+        det = NO_DETECTION
+        log10 = c % 10 == 0
+        log25 = c % 25 == 0
+        log50 = c % 50 == 0
+
+        if self.lock_on_enabled and not self._locked_santa and self._learning_start_ts is None:
+            if self.det_mode == "motion":
+                color_det = self._detect_motion_color(frame_bgr)
+                if color_det and color_det.bbox:
+                    x, y, w, h = color_det.bbox
+                    if w >= self.min_santa_size and h >= self.min_santa_size:
+                        self._start_learning_phase()
+                        det = color_det
+                    else:
+                        if log50:
+                            self.logger.debug("Skipping small detection during search: %dx%d", w, h)
+            else:
+                det = self._match_templates(frame_gray) if self.det_mode == "template" else self._detect_motion(frame_gray)
+                if det.bbox:
+                    self._start_learning_phase()
+        
+        elif self.state == MacroState.LEARNING:
+            elapsed = now - self._learning_start_ts
+            
+            if elapsed < self.learning_duration:
+                if self.det_mode == "motion":
+                    color_det = self._detect_motion_color(frame_bgr)
+                    if color_det and color_det.bbox:
+                        det = color_det
+                        self._process_learning_sample(det.bbox, frame_bgr, det.confidence)
+                    else:
+                        if log25:
+                            self.logger.debug("Learning: temporary detection loss")
+                else:
+                    det = self._match_templates(frame_gray) if self.det_mode == "template" else self._detect_motion(frame_gray)
+                    if det.bbox:
+                        self._process_learning_sample(det.bbox, frame_bgr, det.confidence)
+            else:
+                self._finalize_learning()
+        
+        elif self._locked_santa:
+            self.state = MacroState.DETECTING
+            
+            if self.det_mode == "motion":
+                color_det = self._detect_motion_color(frame_bgr)
+                if color_det and color_det.bbox:
+                    is_valid, rejection_reason = self._validate_detection(color_det.bbox, frame_bgr)
                     
-                    if self.det_mode == "motion":
-                        color_det = self._detect_motion_color(frame_bgr)
-                        if color_det and color_det.bbox:
-                            is_valid, rejection_reason = self._validate_detection(color_det.bbox, frame_bgr)
-                            
-                            if is_valid:
-                                det = color_det
-                                self._update_santa_tracking(det.bbox)
-                                self._rejected_detections_count = 0
-                                if self._debug_log_counter % 25 == 0:
-                                    x, y, w, h = det.bbox
-                                    self.logger.debug("✓ Validated: %dx%d at (%d,%d) conf=%.2f (consecutive: %d)", 
-                                                     w, h, x, y, det.confidence, self._postlock_consecutive_valid)
-                            else:
-                                self._rejected_detections_count += 1
-                                self._reset_postlock_valid()
-                                if self._rejected_detections_count <= 10 or self._rejected_detections_count % 5 == 0:
-                                    x, y, w, h = color_det.bbox
-                                    self.logger.info("✗ REJECT #%d: %dx%d at (%d,%d) - %s", 
-                                                   self._rejected_detections_count, w, h, x, y, rejection_reason)
-                                
-                                if self._predicted_position and self._rejected_detections_count < 15:
-                                    if self._last_santa_center:
-                                        avg_size = (self._santa_profile.size_min + self._santa_profile.size_max) // 2
-                                        pred_x = self._predicted_position[0] - avg_size // 2
-                                        pred_y = self._predicted_position[1] - avg_size // 2
-                                        det = DetectionResult(
-                                            bbox=(pred_x, pred_y, avg_size, avg_size),
-                                            confidence=0.5
-                                        )
-                                        if self._debug_log_counter % 25 == 0:
-                                            self.logger.debug("Using prediction: %s", det.bbox)
-                        else:
-                            if self._predicted_position and self._rejected_detections_count < 20:
+                    if is_valid:
+                        det = color_det
+                        self._update_santa_tracking(det.bbox)
+                        self._rejected_detections_count = 0
+                        if log25:
+                            x, y, w, h = det.bbox
+                            self.logger.debug("✓ Validated: %dx%d at (%d,%d) conf=%.2f (consecutive: %d)", 
+                                             w, h, x, y, det.confidence, self._postlock_consecutive_valid)
+                    else:
+                        self._rejected_detections_count += 1
+                        self._reset_postlock_valid()
+                        if self._rejected_detections_count <= 10 or self._rejected_detections_count % 5 == 0:
+                            x, y, w, h = color_det.bbox
+                            self.logger.info("✗ REJECT #%d: %dx%d at (%d,%d) - %s", 
+                                           self._rejected_detections_count, w, h, x, y, rejection_reason)
+                        
+                        if self._predicted_position and self._rejected_detections_count < 15:
+                            if self._last_santa_center:
                                 avg_size = (self._santa_profile.size_min + self._santa_profile.size_max) // 2
                                 pred_x = self._predicted_position[0] - avg_size // 2
                                 pred_y = self._predicted_position[1] - avg_size // 2
                                 det = DetectionResult(
                                     bbox=(pred_x, pred_y, avg_size, avg_size),
-                                    confidence=0.4
+                                    confidence=0.5
                                 )
-                                
-                                if self._check_camera_control_needed(det.bbox):
-                                    self.state = MacroState.CAMERA_TRACKING
-                                    self._perform_camera_drag(pred_x)
-                                    
-                                if self._debug_log_counter % 25 == 0:
-                                    self.logger.debug("No detection, using prediction: %s", det.bbox)
-                            else:
-                                if self._rejected_detections_count >= 50:
-                                    self.logger.warning("⚠️ Lost Santa - resetting lock (rejected %d times)", 
-                                                       self._rejected_detections_count)
-                                    self._locked_santa = False
-                                    self._learning_start_ts = None
-                                    self._rejected_detections_count = 0
-                                    self._stop_camera_drag()
-                                elif self._debug_log_counter % 50 == 0:
-                                    self.logger.debug("Searching for Santa... (rejected %d)", 
-                                                     self._rejected_detections_count)
+                                if log25:
+                                    self.logger.debug("Using prediction: %s", det.bbox)
+                else:
+                    if self._predicted_position and self._rejected_detections_count < 20:
+                        avg_size = (self._santa_profile.size_min + self._santa_profile.size_max) // 2
+                        pred_x = self._predicted_position[0] - avg_size // 2
+                        pred_y = self._predicted_position[1] - avg_size // 2
+                        det = DetectionResult(
+                            bbox=(pred_x, pred_y, avg_size, avg_size),
+                            confidence=0.4
+                        )
+                        
+                        if self._check_camera_control_needed(det.bbox):
+                            self.state = MacroState.CAMERA_TRACKING
+                            self._perform_camera_drag(pred_x)
+                            
+                        if log25:
+                            self.logger.debug("No detection, using prediction: %s", det.bbox)
                     else:
-                        det_raw = self._match_templates(frame_gray) if self.det_mode == "template" else self._detect_motion(frame_gray)
-                        if det_raw.bbox:
-                            is_valid, rejection_reason = self._validate_detection(det_raw.bbox, frame_bgr)
-                            if is_valid:
-                                det = det_raw
-                                self._update_santa_tracking(det.bbox)
-                                self._rejected_detections_count = 0
-                            else:
-                                self._rejected_detections_count += 1
-                                if self._debug_log_counter % 10 == 0:
-                                    self.logger.info("✗ Rejected: %s", rejection_reason)
-                    
-                    if det.bbox and self._camera_drag_active:
-                        x, y, w, h = det.bbox
-                        distance_from_left = x - self.monitor["left"]
-                        if distance_from_left > self.camera_left_edge_threshold + 100:
+                        if self._rejected_detections_count >= 50:
+                            self.logger.warning("⚠️ Lost Santa - resetting lock (rejected %d times)", 
+                                               self._rejected_detections_count)
+                            self._locked_santa = False
+                            self._learning_start_ts = None
+                            self._rejected_detections_count = 0
                             self._stop_camera_drag()
-                            self.state = MacroState.DETECTING
-                
-                else:
+                        elif log50:
+                            self.logger.debug("Searching for Santa... (rejected %d)", 
+                                             self._rejected_detections_count)
+            else:
+                det_raw = self._match_templates(frame_gray) if self.det_mode == "template" else self._detect_motion(frame_gray)
+                if det_raw.bbox:
+                    is_valid, rejection_reason = self._validate_detection(det_raw.bbox, frame_bgr)
+                    if is_valid:
+                        det = det_raw
+                        self._update_santa_tracking(det.bbox)
+                        self._rejected_detections_count = 0
+                    else:
+                        self._rejected_detections_count += 1
+                        if log10:
+                            self.logger.info("✗ Rejected: %s", rejection_reason)
+            
+            if det.bbox and self._camera_drag_active:
+                x, y, w, h = det.bbox
+                distance_from_left = x - self._geom.mon_left
+                if distance_from_left > self.camera_left_edge_threshold + 100:
+                    self._stop_camera_drag()
                     self.state = MacroState.DETECTING
-                    
-                    if self.det_mode == "motion":
-                        color_det = self._detect_motion_color(frame_bgr)
-                        if color_det:
-                            det = color_det
-                        else:
-                            det = self._detect_motion(frame_gray)
-                    elif self.det_mode == "template":
-                        det = self._match_templates(frame_gray)
+        
+        else:
+            # Detection for this state happens once, in the search branch below
+            self.state = MacroState.DETECTING
+
+    def _lock_on_or_search(self, now: float, frame_gray: np.ndarray, frame_bgr: np.ndarray) -> DetectionResult:
+        """Follow the locked-on target with the tracker, or run the search detector and try to lock on."""
+        if self._locked_on_santa and self._lock_start_ts:
+            lock_duration = now - self._lock_start_ts
+            if lock_duration > self._lock_timeout_seconds:
+                self._release_lock_on(f"Timeout after {lock_duration:.1f}s")
+        
+        det = DetectionResult(bbox=None, confidence=0.0)
+        
+        if self._locked_on_santa:
+            self.state = MacroState.DETECTING
+            self.logger.debug("LOCKED ON SANTA - Using tracker only")
+            
+            track_box = None
+            if self._shoot_tracker is not None:
+                track_box = self._update_shoot_tracker(frame_bgr)
+            if track_box is None and self._shoot_tmpl is not None:
+                track_box = self._update_shoot_template(frame_bgr)
+            
+            if track_box is not None:
+                if self._is_valid_track_box(frame_bgr, track_box):
+                    if self._check_santa_left_screen(track_box):
+                        self._release_lock_on("Santa left screen")
+                        det = DetectionResult(bbox=None, confidence=0.0)
                     else:
-                        det_t = self._match_templates(frame_gray)
-                        if det_t.bbox and det_t.confidence >= self.threshold:
-                            det = det_t
+                        det = DetectionResult(bbox=track_box, confidence=0.95)
+                        self._update_lock_on(track_box)
+                        self.logger.debug("LOCKED TRACKING: bbox=%s", track_box)
+                else:
+                    self.logger.warning("Tracker gave invalid box, attempting recovery")
+                    wide_color_det = self._detect_motion_color(frame_bgr)
+                    if wide_color_det and wide_color_det.bbox:
+                        ww, wh = wide_color_det.bbox[2], wide_color_det.bbox[3]
+                        if ww >= 30 and wh >= 30:
+                            det = wide_color_det
+                            self._update_lock_on(wide_color_det.bbox)
+                            self._init_shoot_tracker(frame_bgr, wide_color_det.bbox)
+                            self._init_shoot_template(frame_bgr, wide_color_det.bbox)
+                            self.logger.info("Recovered lock with WIDE color search (w=%d, h=%d)", ww, wh)
                         else:
-                            det = self._detect_motion(frame_gray)
-                
-                self._debug_log_counter += 1
-                
-                if self._locked_on_santa and self._lock_start_ts:
-                    lock_duration = time.time() - self._lock_start_ts
-                    if lock_duration > self._lock_timeout_seconds:
-                        self._release_lock_on(f"Timeout after {lock_duration:.1f}s")
-                
-                det = DetectionResult(bbox=None, confidence=0.0)
-                
-                if self._locked_on_santa:
-                    self.state = MacroState.DETECTING
-                    self.logger.debug("LOCKED ON SANTA - Using tracker only")
-                    
-                    track_box = None
-                    if self._shoot_tracker is not None:
-                        track_box = self._update_shoot_tracker(frame_bgr)
-                    if track_box is None and self._shoot_tmpl is not None:
-                        track_box = self._update_shoot_template(frame_bgr)
-                    
-                    if track_box is not None:
-                        if self._is_valid_track_box(frame_bgr, track_box):
-                            if self._check_santa_left_screen(track_box):
-                                self._release_lock_on("Santa left screen")
+                            if self._click_cycle_phase in CLICK_BUSY_PHASES:
+                                self.logger.warning("Wide search found small object %dx%d - continuing with grace period", ww, wh)
                                 det = DetectionResult(bbox=None, confidence=0.0)
                             else:
-                                det = DetectionResult(bbox=track_box, confidence=0.95)
-                                self._update_lock_on(track_box)
-                                self.logger.debug("LOCKED TRACKING: bbox=%s", track_box)
-                        else:
-                            self.logger.warning("Tracker gave invalid box, attempting recovery")
-                            wide_color_det = self._detect_motion_color(frame_bgr)
-                            if wide_color_det and wide_color_det.bbox:
-                                ww, wh = wide_color_det.bbox[2], wide_color_det.bbox[3]
-                                if ww >= 30 and wh >= 30:
-                                    det = wide_color_det
-                                    self._update_lock_on(wide_color_det.bbox)
-                                    self._init_shoot_tracker(frame_bgr, wide_color_det.bbox)
-                                    self._init_shoot_template(frame_bgr, wide_color_det.bbox)
-                                    self.logger.info("Recovered lock with WIDE color search (w=%d, h=%d)", ww, wh)
-                                else:
-                                    if self._click_cycle_phase in ("load", "shoot"):
-                                        self.logger.warning("Wide search found small object %dx%d - continuing with grace period", ww, wh)
-                                        det = DetectionResult(bbox=None, confidence=0.0)
-                                    else:
-                                        self._release_lock_on(f"Lost Santa (wide search too small {ww}x{wh})")
-                            else:
-                                if self._click_cycle_phase in ("load", "shoot"):
-                                    self.logger.warning("Tracker failed - wide search failed - continuing with grace period during %s phase", self._click_cycle_phase)
-                                    det = DetectionResult(bbox=None, confidence=0.0)
-                                else:
-                                    self._release_lock_on("Lost Santa (tracker failed, wide search failed)")
-                else:
-                    self.state = MacroState.DETECTING
-                    self.logger.debug("SEARCHING for Santa")
-                    
-                    if self.det_mode == "template":
-                        try:
-                            det = self._match_templates(frame_gray)
-                        except Exception as e:
-                            self.logger.error("Template matching error: %s", e)
-                            det = DetectionResult(bbox=None, confidence=0.0)
-                    elif self.det_mode == "motion":
-                        try:
-                            color_det = self._detect_motion_color(frame_bgr)
-                            if color_det is not None:
-                                self.logger.info("Found red sleigh color detection, using it (conf=%.2f)", color_det.confidence)
-                                det = color_det
-                            else:
-                                det = self._detect_motion(frame_gray)
-                                
-                                if det.bbox is not None:
-                                    _, _, w, h = det.bbox
-                                    det_area = w * h
-                                    max_santa_area = self.roi["width"] * self.roi["height"] * 0.15
-                                    if det_area > max_santa_area:
-                                        self.logger.info("Rejecting large motion blob (area=%.0f > max=%.0f)", det_area, max_santa_area)
-                                        det = DetectionResult(bbox=None, confidence=0.0)
-                        except Exception as e:
-                            self.logger.error("Motion detection error: %s", e)
-                            det = DetectionResult(bbox=None, confidence=0.0)
+                                self._release_lock_on(f"Lost Santa (wide search too small {ww}x{wh})")
                     else:
-                        try:
-                            det_t = self._match_templates(frame_gray if len(frame_gray.shape) == 2 else frame_bgr)
-                            if det_t.bbox is not None and det_t.confidence >= self.threshold:
-                                det = det_t
-                            else:
-                                det = self._detect_motion(frame_gray if len(frame_gray.shape) == 2 else cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY))
-                        except Exception as e:
-                            self.logger.error("Hybrid detection error: %s", e)
+                        if self._click_cycle_phase in CLICK_BUSY_PHASES:
+                            self.logger.warning("Tracker failed - wide search failed - continuing with grace period during %s phase", self._click_cycle_phase)
                             det = DetectionResult(bbox=None, confidence=0.0)
-                    
-                    if det.bbox is not None and det.confidence > 0.5:
-                        if not self._locked_on_santa:
-                            if self._initiate_lock_on(det.bbox):
-                                self._init_shoot_tracker(frame_bgr, det.bbox)
-                                self._init_shoot_template(frame_bgr, det.bbox)
-                                self._shoot_ref_bbox = det.bbox
-                                self.logger.info("Santa detected and locked on!")
-                            else:
-                                self.logger.debug("Lock-on validation failed, continuing with normal tracking")
+                        else:
+                            self._release_lock_on("Lost Santa (tracker failed, wide search failed)")
+        else:
+            self.state = MacroState.DETECTING
+            self.logger.debug("SEARCHING for Santa")
+            
+            det = self._detect_fn(frame_gray, frame_bgr)
+            
+            if det.bbox is not None and det.confidence > 0.5:
+                if not self._locked_on_santa:
+                    if self._initiate_lock_on(det.bbox):
+                        self._init_shoot_tracker(frame_bgr, det.bbox)
+                        self._init_shoot_template(frame_bgr, det.bbox)
+                        self._shoot_ref_bbox = det.bbox
+                        self.logger.info("Santa detected and locked on!")
+                    else:
+                        self.logger.debug("Lock-on validation failed, continuing with normal tracking")
+        return det
+
+    def _record_detection(self, now: float, det: DetectionResult, frame_bgr: np.ndarray):
+        """Update the confidence EMA and, in learning mode, log/save the detection and adapt the threshold."""
+        alpha, keep = self.ema_alpha, self._ema_keep
+        prev_conf = self._ema_conf
+        self._ema_conf = det.confidence if prev_conf is None else alpha * det.confidence + keep * prev_conf
+        
+        if self.learning_enabled and det.bbox is not None:
+            self._learning_detections.append({
+                "ts": now,
+                "conf": det.confidence,
+                "bbox": det.bbox,
+                "threshold": self.threshold
+            })
+            
+            if self.learning_save_samples and det.confidence > 0.5:
+                self._sample_counter += 1
+                self._queue_imwrite(f"{self._sample_prefix}{self._sample_counter:08d}_{det.confidence:.2f}.png", frame_bgr)
+            
+            recent = self._learning_detections
+            if self.learning_auto_adjust and len(recent) == recent.maxlen:
+                avg_conf = sum(d["conf"] for d in recent) / len(recent)
+                if avg_conf > self.threshold + 0.1:
+                    self.threshold = min(0.85, self.threshold + 0.02)
+                    self.logger.info("Learning: threshold increased to %.2f", self.threshold)
+                elif avg_conf < self.threshold - 0.15:
+                    self.threshold = max(0.45, self.threshold - 0.02)
+                    self.logger.info("Learning: threshold decreased to %.2f", self.threshold)
+
+    def _compute_aim(self, now: float, c: int, det: DetectionResult) -> Tuple[DetectionResult, Optional[Tuple[int, int]]]:
+        """Smooth the detection into an aim point (or predict one mid-shoot); may veto a start in the center deadzone."""
+        alpha, keep = self.ema_alpha, self._ema_keep
+        aim = None
+        
+        dbg = self._dbg_enabled
+        if dbg:
+            self.logger.debug("FRAME: phase=%s locked=%s det.bbox=%s conf=%.2f", 
+                              self._click_cycle_phase, self._locked_on_santa, det.bbox, det.confidence)
+        elif c % 60 == 0 and self._info_enabled:
+            self.logger.info("[HEARTBEAT] frame=%s phase=%s locked=%s conf=%.2f",
+                             c, self._click_cycle_phase, self._locked_on_santa, det.confidence)
+        
+        if det.bbox is not None:
+            cx, cy = self._aim_point(det.bbox)
+            prev_center = self._ema_center
+            if prev_center is not None:
+                cx = alpha * cx + keep * prev_center[0]
+                cy = alpha * cy + keep * prev_center[1]
+            self._ema_center = (cx, cy)
+            aim = (int(cx), int(cy))
+            self._last_valid_bbox = det.bbox
+            self._last_detection_ts = now
+            
+            if self._click_cycle_phase == "load" and self._click_cycle_start_ts is None:
+                geom = self._geom
+                dist_from_center_x = abs(aim[0] - geom.mon_center_x)
+                dist_from_center_y = abs(aim[1] - geom.mon_center_y)
                 
-                self._ema_conf = self._ema(self._ema_conf, det.confidence, self.ema_alpha)
+                if dist_from_center_x < geom.deadzone_half_w and dist_from_center_y < geom.deadzone_half_h:
+                    self.logger.warning("REJECTING START: Target in center deadzone (%.1f, %.1f from center) - likely particles!", 
+                                      dist_from_center_x, dist_from_center_y)
+                    det = DetectionResult(bbox=None, confidence=0.0)
+                    aim = None
+                    self._santa_confirm_start_ts = None
+            
+            if dbg and aim:
+                self.logger.debug("%s: bbox=%s -> aim=%s", "LOCKED AIM" if self._locked_on_santa else "AIM", det.bbox, aim)
+        
+        elif self._click_cycle_phase == "shoot" and self._last_valid_bbox is not None:
+            last_center = self._aim_point(self._last_valid_bbox)
+            
+            if len(self._santa_bbox_history) >= 2:
+                prev_bbox = self._santa_bbox_history[-2]
+                curr_bbox = self._santa_bbox_history[-1]
+                prev_center = self._aim_point(prev_bbox)
+                curr_center = self._aim_point(curr_bbox)
+                aim = predict_aim(prev_center[0], prev_center[1], curr_center[0], curr_center[1])
+                self.logger.debug("SHOOT w/ PREDICTION: center=%s pred=%s", curr_center, aim)
+            else:
+                aim = last_center
+                self.logger.debug("SHOOT: aim=%s", aim)
+        
+        elif dbg:
+            self.logger.debug("NO AIM: det.bbox=%s locked=%s phase=%s", det.bbox, self._locked_on_santa, self._click_cycle_phase)
+        return det, aim
+
+    def _run_click_cycle(self, now: float, det: DetectionResult, aim: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+        """Move toward aim and advance the load/shoot/cooldown click cycle; returns the aim actually used."""
+        dbg = self._dbg_enabled
+        if aim and det.bbox is not None:
+            if dbg:
+                cur = pyautogui.position()
+                self.logger.debug("AIM: det_bbox=%s calculated_aim=%s cursor_before=%s", det.bbox, aim, (cur.x, cur.y))
+            self._move_mouse_towards(aim)
+            if dbg:
+                cur_after = pyautogui.position()
+                self.logger.debug("AIM: cursor_after=%s", (cur_after.x, cur_after.y))
+            self._push_movement(aim)
+
+            if self.clicks_enabled:
+                moving_ok = self._is_moving_naturally()
                 
-                if self.learning_enabled and det.bbox is not None:
-                    self._learning_detections.append({
-                        "ts": time.time(),
-                        "conf": det.confidence,
-                        "bbox": det.bbox,
-                        "threshold": self.threshold
-                    })
-                    
-                    if self.learning_save_samples and det.confidence > 0.5:
-                        ts = time.strftime("%Y%m%d_%H%M%S")
-                        path = os.path.join(self.learning_sample_dir, f"detect_{ts}_{det.confidence:.2f}.png")
-                        cv2.imwrite(path, frame_bgr)
+                if self.click_skip_movement_validation:
+                    moving_ok = True
+                    self.logger.debug("Movement validation SKIPPED (debug mode)")
+
+                if self._click_cycle_start_ts is None and det.bbox is not None:
+                    if self._santa_confirm_start_ts is None:
+                        self._santa_confirm_start_ts = now
+                        self.logger.info("SANTA DETECTION: Starting confirmation timer")
                     
-                    if self.learning_auto_adjust and len(self._learning_detections) > 50:
-                        recent = [d["conf"] for d in self._learning_detections[-50:]]
-                        avg_conf = sum(recent) / len(recent)
-                        if avg_conf > self.threshold + 0.1:
-                            self.threshold = min(0.85, self.threshold + 0.02)
-                            self.logger.info("Learning: threshold increased to %.2f", self.threshold)
-                        elif avg_conf < self.threshold - 0.15:
-                            self.threshold = max(0.45, self.threshold - 0.02)
-                            self.logger.info("Learning: threshold decreased to %.2f", self.threshold)
-                        self._learning_detections = self._learning_detections[-50:]
+                    confirm_elapsed = now - self._santa_confirm_start_ts
+                    if confirm_elapsed >= self._santa_confirm_duration:
+                        self._click_cycle_start_ts = now
+                        self._click_cycle_phase = "load"
+                        self.logger.info("CLICK CYCLE START: phase=load after %.1fs confirmation, bbox=%s", confirm_elapsed, det.bbox)
+                    else:
+                        self.logger.debug("Confirming Santa: %.1f/%.1fs", confirm_elapsed, self._santa_confirm_duration)
+                elif det.bbox is None:
+                    if self._santa_confirm_start_ts is not None:
+                        self.logger.debug("Lost Santa during confirmation - resetting")
+                        self._santa_confirm_start_ts = None
+
+                phase_elapsed = 0.0
+                if self._click_cycle_start_ts is not None:
+                    phase_elapsed = (now - self._click_cycle_start_ts) * 1000.0
+
+                self._click_phase_handlers[self._click_cycle_phase](phase_elapsed, now)
+
+                cycles_active = 0.0
+                if self._click_cycle_start_ts is not None:
+                    cycles_active = now - self._click_cycle_start_ts
                 
-                aim = None
+                if self.click_always_spam and self._click_cycle_phase == "shoot":
+                    allow_click = True
+                    if dbg:
+                        self.logger.debug("Click gating: spam_mode=True -> allow_click=True")
+                else:
+                    allow_click = moving_ok or (cycles_active < 0.5)
+                    if dbg:
+                        self.logger.debug("Click gating: moving_ok=%s cycles_active=%.2fs -> allow_click=%s", moving_ok, cycles_active, allow_click)
                 
-                self.logger.info("FRAME: phase=%s locked=%s det.bbox=%s conf=%.2f", 
-                                self._click_cycle_phase, self._locked_on_santa, det.bbox, det.confidence)
+                if self._click_cycle_phase in CLICK_BUSY_PHASES and allow_click:
+                    if not self._mouse_down:
+                        self._click_down()
+                        if dbg:
+                            self.logger.debug("CLICK DOWN: phase=%s (spam_mode=%s)", self._click_cycle_phase, self.click_always_spam and self._click_cycle_phase == "shoot")
+                else:
+                    if self._mouse_down:
+                        self._click_up()
+                        if dbg:
+                            self.logger.debug("CLICK UP: phase=%s", self._click_cycle_phase)
+
+            self.state = MacroState.CLICKING if self.clicks_enabled else MacroState.DETECTING
+        
+        elif det.bbox is None and self.clicks_enabled:
+            if self._last_detection_ts is None:
+                self._last_detection_ts = now
+            
+            time_since_detection = now - self._last_detection_ts
+            grace_period = 1.0
+            
+            if self._click_cycle_phase in CLICK_BUSY_PHASES and time_since_detection < grace_period:
+                if self._last_valid_bbox is not None:
+                    aim = self._aim_point(self._last_valid_bbox)
+                    self._move_mouse_towards(aim)
+                self.logger.debug("Detection lost temporarily (%.1fs) - continuing in grace period", time_since_detection)
+            elif time_since_detection >= grace_period:
+                if self._mouse_down:
+                    self._click_up()
+                    self.logger.info("Detection lost for %.1fs - releasing mouse button", time_since_detection)
                 
-                if det.bbox is not None:
-                    center = self._aim_point(det.bbox)
-                    self._ema_center = self._ema_pt(self._ema_center, center, self.ema_alpha)
-                    aim = (int(self._ema_center[0]), int(self._ema_center[1]))
-                    self._last_valid_bbox = det.bbox
-                    self._last_detection_ts = time.time()
-                    
-                    if self._click_cycle_phase == "load" and self._click_cycle_start_ts is None:
-                        screen_center_x = self.monitor["left"] + self.monitor["width"] // 2
-                        screen_center_y = self.monitor["top"] + self.monitor["height"] // 2
-                        
-                        deadzone_w = int(self.monitor["width"] * 0.3)
-                        deadzone_h = int(self.monitor["height"] * 0.3)
-                        
-                        dist_from_center_x = abs(aim[0] - screen_center_x)
-                        dist_from_center_y = abs(aim[1] - screen_center_y)
-                        
-                        if dist_from_center_x < deadzone_w // 2 and dist_from_center_y < deadzone_h // 2:
-                            self.logger.warning("REJECTING START: Target in center deadzone (%.1f, %.1f from center) - likely particles!", 
-                                              dist_from_center_x, dist_from_center_y)
-                            det = DetectionResult(bbox=None, confidence=0.0)
-                            aim = None
-                            self._santa_confirm_start_ts = None
-                    
-                    if aim and self._locked_on_santa:
-                        self.logger.info("LOCKED AIM: bbox=%s -> aim=%s", det.bbox, aim)
-                    elif aim:
-                        self.logger.info("AIM: bbox=%s -> aim=%s", det.bbox, aim)
+                if self._click_cycle_start_ts is not None:
+                    self._enter_click_cooldown(None)
+                    self._santa_confirm_start_ts = None
+                    self.logger.info("Detection lost - RESETTING cycle, waiting for Santa")
+            
+            self.state = MacroState.DETECTING
+        return aim
+
+    def _sync_espam(self):
+        """Run the E-spam thread exactly while the click cycle is in cooldown."""
+        espam = self.clicks_enabled and self._click_cycle_phase == "cooldown" and self._click_cycle_start_ts is not None
+        if espam != self._espam_evt.is_set():
+            if espam:
+                self._espam_evt.set()
+            else:
+                self._espam_evt.clear()
+
+    def run(self):
+        self.start_hotkeys()
+        self._start_capture_thread()
+        self._start_infer_thread()
+        self._start_espam_thread()
+        self._start_disk_thread()
+        toggle_key = self.cfg["hotkeys"].get("toggle", self.cfg["hotkeys"].get("start", "F1"))
+        self.logger.info("Macro loop started. Press %s to START/STOP (toggle).", toggle_key.upper())
+        self._set_timer_resolution(True)
+        self._next_tick_deadline = time.perf_counter()
+        try:
+            while self.state != MacroState.SHUTDOWN:
+                start_ts = time.perf_counter()
                 
-                elif self._click_cycle_phase == "shoot" and self._last_valid_bbox is not None:
-                    last_center = self._aim_point(self._last_valid_bbox)
-                    
-                    if len(self._santa_bbox_history) >= 2:
-                        prev_bbox = self._santa_bbox_history[-2]
-                        curr_bbox = self._santa_bbox_history[-1]
-                        prev_center = self._aim_point(prev_bbox)
-                        curr_center = self._aim_point(curr_bbox)
-                        
-                        vx = (curr_center[0] - prev_center[0]) * 2.0
-                        vy = (curr_center[1] - prev_center[1]) * 2.0
-                        
-                        pred_x = curr_center[0] + vx
-                        pred_y = curr_center[1] + vy
-                        aim = (int(pred_x), int(pred_y))
-                        self.logger.debug("SHOOT w/ PREDICTION: center=%s velocity=(%.1f,%.1f) pred=%s", 
-                                        curr_center, vx, vy, aim)
-                    else:
-                        aim = last_center
-                        self.logger.debug("SHOOT: aim=%s", aim)
+                # Periodic cleanup to prevent stuck keys every 100 frames
+                if self._debug_log_counter - self._last_cleanup_frame >= self._cleanup_interval:
+                    self._force_release_all_arrows()
+                    self._last_cleanup_frame = self._debug_log_counter
+                    self.logger.info("[CLEANUP] Frame %s: Native arrow release", self._debug_log_counter)
                 
+                frame_batch = None
+                if self._capture_thread is not None:
+                    try:
+                        frame_batch, _ = self._capture_q.get(timeout=0.5)
+                    except queue.Empty:
+                        continue
+                    frame_bgr = frame_batch[-1]
+                    frame_gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
+                elif self.yolo_async:
+                    # The inference thread may still be reading an older frame, so don't recycle buffers
+                    frame_bgr = self._grab_frame(mask_cursor=not (self._click_cycle_phase == "shoot"))
+                    frame_gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
                 else:
-                    self.logger.info("NO AIM: det.bbox=%s locked=%s phase=%s", det.bbox, self._locked_on_santa, self._click_cycle_phase)
+                    frame_bgr, frame_gray = self._grab_into_buffers(mask_cursor=not (self._click_cycle_phase == "shoot"))
 
-                if aim and det.bbox is not None:
-                    cur = pyautogui.position()
-                    self.logger.info("AIM: det_bbox=%s calculated_aim=%s cursor_before=%s", det.bbox, aim, (cur.x, cur.y))
-                    self._move_mouse_towards(aim)
-                    cur_after = pyautogui.position()
-                    self.logger.info("AIM: cursor_after=%s", (cur_after.x, cur_after.y))
-                    self._push_movement(aim)
-
-                    if self.clicks_enabled:
-                        moving_ok = self._is_moving_naturally()
-                        
-                        if self.click_skip_movement_validation:
-                            moving_ok = True
-                            self.logger.debug("Movement validation SKIPPED (debug mode)")
-
-                        if self._click_cycle_start_ts is None and det.bbox is not None:
-                            if self._santa_confirm_start_ts is None:
-                                self._santa_confirm_start_ts = time.time()
-                                self.logger.info("SANTA DETECTION: Starting confirmation timer")
-                            
-                            confirm_elapsed = time.time() - self._santa_confirm_start_ts
-                            if confirm_elapsed >= self._santa_confirm_duration:
-                                self._click_cycle_start_ts = time.time()
-                                self._click_cycle_phase = "load"
-                                self.logger.info("CLICK CYCLE START: phase=load after %.1fs confirmation, bbox=%s", confirm_elapsed, det.bbox)
-                            else:
-                                self.logger.debug("Confirming Santa: %.1f/%.1fs", confirm_elapsed, self._santa_confirm_duration)
-                        elif det.bbox is None:
-                            if self._santa_confirm_start_ts is not None:
-                                self.logger.debug("Lost Santa during confirmation - resetting")
-                                self._santa_confirm_start_ts = None
-
-                        phase_elapsed = 0.0
-                        if self._click_cycle_start_ts is not None:
-                            phase_elapsed = (time.time() - self._click_cycle_start_ts) * 1000.0
-
-                        if self._click_cycle_phase == "cooldown" and self._click_cycle_start_ts is not None and phase_elapsed >= self.click_cooldown_ms:
-                            self._click_cycle_phase = "cooldown"
-                            self._click_cycle_start_ts = None
-                            self.logger.info("PHASE: cooldown complete - resetting to detect new Santa")
-                        elif self._click_cycle_phase == "load" and phase_elapsed >= self.click_load_ms:
-                            if self._last_valid_bbox is not None:
-                                self._click_cycle_phase = "shoot"
-                                self._click_cycle_start_ts = time.time()
-                                phase_elapsed = 0
-                                self._low_conf_start_ts = None
-                                if self._locked_on_santa:
-                                    self.logger.info("PHASE: load->shoot (LOCKED ON)")
-                                else:
-                                    self.logger.info("PHASE: load->shoot (TRACKING)")
-                            else:
-                                self.logger.debug("Staying in LOAD phase - no valid target yet")
-                        elif self._click_cycle_phase == "shoot" and phase_elapsed >= self.click_shoot_ms:
-                            if self._mouse_down:
-                                self._click_up()
-                            self._click_cycle_phase = "cooldown"
-                            self._click_cycle_start_ts = time.time()
-                            phase_elapsed = 0
-                            self._locked_aim_point = None
-                            self._last_e_press_ts = None
-                            self.logger.info("PHASE: shoot->cooldown (STAYING LOCKED for next cycle)")
-
-                        cycles_active = 0.0
-                        if self._click_cycle_start_ts is not None:
-                            cycles_active = time.time() - self._click_cycle_start_ts
-                        
-                        if self.click_always_spam and self._click_cycle_phase == "shoot":
-                            allow_click = True
-                            self.logger.debug("Click gating: spam_mode=True -> allow_click=True")
-                        else:
-                            allow_click = moving_ok or (cycles_active < 0.5)
-                            self.logger.debug("Click gating: moving_ok=%s cycles_active=%.2fs -> allow_click=%s", moving_ok, cycles_active, allow_click)
-                        
-                        if self._click_cycle_phase in ("load", "shoot") and allow_click:
-                            if not self._mouse_down:
-                                self._click_down()
-                                self.logger.info("CLICK DOWN: phase=%s (spam_mode=%s)", self._click_cycle_phase, self.click_always_spam and self._click_cycle_phase == "shoot")
-                        else:
-                            if self._mouse_down:
-                                self._click_up()
-                                self.logger.debug("CLICK UP: phase=%s", self._click_cycle_phase)
+                if not self._running:
+                    self.state = MacroState.IDLE
+                    det = NO_DETECTION
+                    if self.overlay_enabled:
+                        self._update_fps(start_ts)
+                        self._draw_overlay(frame_bgr, det, None, attack_mode="custom")
+                    time.sleep(self.idle_backoff_ms / 1000.0)
+                    continue
 
-                    self.state = MacroState.CLICKING if self.clicks_enabled else MacroState.DETECTING
+                if self._paused:
+                    self.state = MacroState.PAUSED
+                    det = NO_DETECTION
+                    if self._mouse_down:
+                        self._click_up()
+                    self._espam_evt.clear()
+                    if self.overlay_enabled:
+                        self._update_fps(start_ts)
+                        self._draw_overlay(frame_bgr, det, None, attack_mode="custom")
+                    self._sleep_until_next_tick()
+                    continue
                 
-                elif det.bbox is None and self.clicks_enabled:
-                    if self._last_detection_ts is None:
-                        self._last_detection_ts = time.time()
-                    
-                    time_since_detection = time.time() - self._last_detection_ts
-                    grace_period = 1.0
-                    
-                    if self._click_cycle_phase in ("load", "shoot") and time_since_detection < grace_period:
-                        if self._last_valid_bbox is not None:
-                            aim = self._aim_point(self._last_valid_bbox)
-                            self._move_mouse_towards(aim)
-                        self.logger.debug("Detection lost temporarily (%.1fs) - continuing in grace period", time_since_detection)
-                    elif time_since_detection >= grace_period:
-                        if self._mouse_down:
-                            self._click_up()
-                            self.logger.info("Detection lost for %.1fs - releasing mouse button", time_since_detection)
-                        
-                        if self._click_cycle_start_ts is not None:
-                            self._click_cycle_start_ts = None
-                            self._click_cycle_phase = "cooldown"
-                            self._santa_confirm_start_ts = None
-                            self.logger.info("Detection lost - RESETTING cycle, waiting for Santa")
-                    
-                    self.state = MacroState.DETECTING
 
-                if self.clicks_enabled and self._click_cycle_phase == "cooldown" and self._click_cycle_start_ts is not None:
-                    now = time.time()
-                    phase_elapsed = (now - self._click_cycle_start_ts) * 1000.0
-                    if self._last_e_press_ts is None or (now - self._last_e_press_ts) >= self._e_spam_interval:
-                        kbd = keyboard.Controller()
-                        kbd.press('e')
-                        kbd.release('e')
-                        self._last_e_press_ts = now
-                        self.logger.info("COOLDOWN: Pressed E key (%.1fs into cooldown)", phase_elapsed / 1000.0)
-
-                self._update_fps()
+                if self.minimal_santa_mode_enabled:
+                    self._tick_minimal(frame_bgr, frame_gray, frame_batch, start_ts)
+                    continue
+
+                now = time.time()  # One wall-clock read per tick for all timers below
+                c = self._debug_log_counter
+                self._update_smart_tracking(now, c, frame_gray, frame_bgr)
+                self._debug_log_counter += 1
+                det = self._lock_on_or_search(now, frame_gray, frame_bgr)
+                self._record_detection(now, det, frame_bgr)
+                det, aim = self._compute_aim(now, c, det)
+                aim = self._run_click_cycle(now, det, aim)
+                self._sync_espam()
+
+                self._update_fps(start_ts)
                 if self.overlay_enabled:
                     self._draw_overlay(frame_bgr, det, aim, attack_mode="custom")
                 self._save_dump_if_needed(frame_bgr, det)
 
-                elapsed = time.time() - start_ts
-                remain = max(0.0, self.tick_interval - elapsed)
-                time.sleep(remain)
+                self._sleep_until_next_tick()
         finally:
             if self._mouse_down:
                 self._click_up()
             try:
                 with self.arrow_lock:
-                    pydirectinput.keyUp('left')
-                    pydirectinput.keyUp('right')
-                    with self.keys_lock:
-                        self.camera_keys_pressed.clear()
+                    self._send_key('left', down=False)
+                    self._send_key('right', down=False)
+                    self.camera_keys_pressed.clear()
                     self.is_holding_arrow = False
                     self.current_arrow_key = None
                 self.logger.info("[CLEANUP] Released all arrow keys")
             except Exception as e:
                 self.logger.warning(f"Error releasing keys on exit: {e}")
+            self._stop_infer_thread()
+            self._stop_espam_thread()
+            self._stop_disk_thread()
+            self._stop_capture_thread()
+            self._set_timer_resolution(False)
             self.stop_hotkeys()
             # Only destroy overlay on shutdown, not on pause
             if self.state == MacroState.SHUTDOWN:
@@ -16,7 +16,7 @@ def main():
     macro = SantaMacro(args.config)
 
     if args.mode:
-        macro.det_mode = args.mode
+        macro.set_detection_mode(args.mode)
         macro.logger.info("CLI override: detection mode -> %s", args.mode)
     if args.no_overlay:
         macro.overlay_enabled = False
@@ -1,13 +1,49 @@
 from __future__ import annotations
 import sys
 import os
+import time
 from typing import Optional, Tuple
 import numpy as np
 import cv2
-from PySide6.QtCore import Qt, QRect, QRectF
-from PySide6.QtGui import QImage, QPixmap, QPainter, QColor, QFont, QPen, QLinearGradient, QPainterPath, QMouseEvent
+from PySide6.QtCore import Qt, QEvent, QPoint, QRect, QRectF
+from PySide6.QtGui import QImage, QPixmap, QPainter, QColor, QFont, QPen, QLinearGradient, QMouseEvent, QPixmapCache
 from PySide6.QtWidgets import QApplication, QLabel, QWidget
 
+# Set OVERLAY_DEBUG=1 to print click hit-testing diagnostics
+OVERLAY_DEBUG = bool(os.environ.get("OVERLAY_DEBUG"))
+# Status bar window size
+BAR_WIDTH = 400
+BAR_HEIGHT = 70
+# Repaints of an unchanged overlay are skipped within this interval (~60 FPS)
+MIN_REPAINT_INTERVAL = 0.016
+# Fallback re-raise period; focus changes to other windows trigger a raise on the next paint
+RAISE_INTERVAL = 5.0
+# Crosshair arms around the aim point as (4, 2, 2) start/end segments
+CROSSHAIR_SEGMENTS = np.array([
+    [[-20, 0], [-9, 0]],
+    [[9, 0], [20, 0]],
+    [[0, -20], [0, -9]],
+    [[0, 9], [0, 20]],
+], dtype=np.int32)
+# Corner accents as (8, 2, 2) segments: which box corner each stroke starts at (in units of
+# box width/height) plus its unit arm, scaled by the accent length at draw time
+CORNER_SEGMENT_ORIGINS = np.array([
+    [[0, 0]], [[0, 0]],  # Top-left
+    [[1, 0]], [[1, 0]],  # Top-right
+    [[0, 1]], [[0, 1]],  # Bottom-left
+    [[1, 1]], [[1, 1]],  # Bottom-right
+], dtype=np.int32)
+CORNER_SEGMENT_ARMS = np.array([
+    [[0, 0], [1, 0]], [[0, 0], [0, 1]],
+    [[0, 0], [-1, 0]], [[0, 0], [0, 1]],
+    [[0, 0], [1, 0]], [[0, 0], [0, -1]],
+    [[0, 0], [-1, 0]], [[0, 0], [0, -1]],
+], dtype=np.int32)
+# Detection canvas colors, premultiplied BGRA (native ARGB32 byte order on little-endian)
+DET_RED = (0, 0, 255, 255)
+DET_WHITE_200 = (200, 200, 200, 200)  # white at alpha 200
+DET_WHITE_180 = (180, 180, 180, 180)  # white at alpha 180
+
 
 class ClickableWidget(QWidget):
     """Widget that can detect mouse clicks on settings button"""
@@ -18,27 +54,43 @@ class ClickableWidget(QWidget):
     def set_overlay(self, overlay):
         self.overlay = overlay
     
+    def changeEvent(self, event):
+        if self.overlay and event.type() == QEvent.WindowStateChange:
+            self.overlay.visible = not self.isMinimized()
+            # Don't leave a stale detection box on screen while updates are paused
+            det_widget = getattr(self.overlay, "detection_widget", None)
+            if det_widget:
+                det_widget.setVisible(self.overlay.visible)
+        super().changeEvent(event)
+    
+    def showEvent(self, event):
+        if self.overlay:
+            self.overlay.visible = not self.isMinimized()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        if self.overlay:
+            self.overlay.visible = False
+        super().hideEvent(event)
+    
     def mousePressEvent(self, event: QMouseEvent):
         if self.overlay and event.button() == Qt.LeftButton:
             x, y = event.pos().x(), event.pos().y()
-            print(f"Mouse click at ({x}, {y})")  # Debug output
+            if OVERLAY_DEBUG:
+                print(f"Mouse click at ({x}, {y})")
             
             # Check if click is on settings button
-            if self.overlay.settings_button_rect:
-                rect = self.overlay.settings_button_rect
-                print(f"Settings button rect: {rect}")  # Debug output
-                if rect[0] <= x <= rect[0] + rect[2] and rect[1] <= y <= rect[1] + rect[3]:
-                    print("Settings button clicked!")  # Debug output
+            hit = self.overlay.settings_button_hit
+            if hit:
+                x0, y0, x1, y1 = hit
+                if x0 <= x <= x1 and y0 <= y <= y1:
                     if self.overlay.settings_callback:
-                        print("Calling settings callback")  # Debug output
                         self.overlay.settings_callback()
-                    else:
-                        print("No settings callback set!")  # Debug output
+                    elif OVERLAY_DEBUG:
+                        print("No settings callback set!")
                     self.raise_()  # Keep on top
                     self.activateWindow()
                     return
-            else:
-                print("No settings button rect set!")  # Debug output
 
 
 class OverlayQt:
@@ -46,25 +98,43 @@ class OverlayQt:
         self.title = title
         self.status_bar_mode = status_bar_mode
         self.app = QApplication.instance() or QApplication(sys.argv)
+        self._init_paint_resources()
+        # Status bar pixmaps are rendered at native resolution so Qt never rescales them on paint
+        self._dpr = self.app.primaryScreen().devicePixelRatio()
         
-        # Load logo
+        # Load logo (decoded + scaled once per process, shared by re-created overlays)
         self.logo_pixmap = None
         logo_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "images", "icon.webp")
         if os.path.exists(logo_path):
             try:
-                self.logo_pixmap = QPixmap(logo_path).scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                logo_key = f"logo_40@{self._dpr}"
+                pm = QPixmap()
+                if not QPixmapCache.find(logo_key, pm):
+                    logo_px = int(40 * self._dpr)
+                    pm = QPixmap(logo_path).scaled(logo_px, logo_px, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    pm.setDevicePixelRatio(self._dpr)
+                    QPixmapCache.insert(logo_key, pm)
+                self.logo_pixmap = pm
             except Exception:
                 pass
         
         # Current attack mode and settings callback
         self.current_attack_mode = "custom"
         self.settings_callback = None
+        # Cleared by window events while the status bar is minimized/hidden so callers can skip drawing
+        self.visible = True
+        self._last_state = None
+        self._last_paint_ts = 0.0
+        self._last_raise_ts = 0.0
+        self._needs_raise = True
+        # Frame shown by the full overlay mode; kept alive because the QImage points into it
+        self._frame_ref = None
         
         if status_bar_mode:
             # Normal GUI window at top-center with settings button
             screen = self.app.primaryScreen().geometry()
-            bar_width = 400
-            bar_height = 70   
+            bar_width = BAR_WIDTH
+            bar_height = BAR_HEIGHT
             bar_x = (screen.width() - bar_width) // 2
             bar_y = 10
             
@@ -83,6 +153,13 @@ class OverlayQt:
             
             # Store button position for click detection
             self.settings_button_rect = None
+            self.settings_button_hit = None  # (x0, y0, x1, y1), inclusive
+            
+            self._base_pixmap = self._build_base_pixmap()
+            
+            # Last rendered status bar; only re-rendered when the displayed status changes
+            self._status_cache_key = None
+            self._status_cache_pix = None
             
             # Detection overlay (full screen, transparent, click-through)
             self.detection_widget = QWidget()
@@ -93,6 +170,7 @@ class OverlayQt:
             self.detection_widget.setGeometry(x, y, w, h)
             self.detection_label = QLabel(self.detection_widget)
             self.detection_label.setGeometry(0, 0, w, h)
+            self._alloc_det_buffer(w, h)
             
             self.widget.show()
             self.detection_widget.show()
@@ -111,11 +189,65 @@ class OverlayQt:
             self.label.show()
             self.widget = None
             self.detection_widget = None
+        
+        self.app.focusWindowChanged.connect(self._on_focus_window_changed)
     
+    def _init_paint_resources(self):
+        """Build the fonts, colors and pens used by the status bar once instead of per frame"""
+        self._font_title = QFont("Segoe UI", 13, QFont.Bold)
+        self._font_status_big = QFont("Segoe UI", 20, QFont.Bold)
+        self._font_status = QFont("Segoe UI", 12, QFont.Bold)
+        self._font_detail = QFont("Segoe UI", 8)
+        self._color_title = QColor(255, 120, 120, 255)
+        self._color_text = QColor(255, 255, 255, 255)
+        self._color_detail = QColor(170, 180, 200, 200)
+        self._status_colors = {
+            "PAUSED": QColor(255, 193, 7),
+            "ACTIVE": QColor(76, 217, 100),
+            "INACTIVE": QColor(255, 82, 82),
+        }
+        self._status_glow_pens = {
+            name: QPen(QColor(c.red(), c.green(), c.blue(), 80), 8)
+            for name, c in self._status_colors.items()
+        }
+        # status -> (indicator glyph, displayed text)
+        self._status_table = {
+            "PAUSED": ("❙❙", "PAUSED"),
+            "ACTIVE": ("●", "ACTIVE"),
+            "INACTIVE": ("●", "INACTIVE"),
+        }
+
+    def _alloc_det_buffer(self, w: int, h: int):
+        """(Re)allocate the persistent premultiplied BGRA detection canvas and the QImage that wraps it"""
+        self._det_buf = np.zeros((h, w, 4), dtype=np.uint8)
+        # ARGB32_Premultiplied is the compositor's native format, so blits need no per-pixel conversion
+        self._det_qimg = QImage(self._det_buf.data, w, h, 4 * w, QImage.Format_ARGB32_Premultiplied)
+        self._last_dirty_rect = None  # (x0, y0, x1, y1) region drawn last frame
+        # Screen-side copy of the canvas; only changed regions are blitted into it
+        self._det_pixmap = QPixmap(w, h)
+        self._det_pixmap.fill(Qt.transparent)
+
+    def _flush_det_region(self, x0: int, y0: int, x1: int, y1: int):
+        """Copy one region of the detection canvas into the persistent pixmap and show it"""
+        # Drop the label's reference first so painting doesn't detach (deep-copy) the full-screen pixmap
+        self.detection_label.clear()
+        if x0 < x1 and y0 < y1:
+            painter = QPainter(self._det_pixmap)
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+            painter.drawImage(QPoint(x0, y0), self._det_qimg, QRect(x0, y0, x1 - x0, y1 - y0))
+            painter.end()
+        self.detection_label.setPixmap(self._det_pixmap)
+
     def set_settings_callback(self, callback):
         """Set the callback function for settings button"""
         self.settings_callback = callback
     
+    def _on_focus_window_changed(self, window):
+        """Another window took focus, so it may now sit above ours; re-raise on the next paint"""
+        ours = [wdg.windowHandle() for wdg in (self.widget, self.detection_widget, self.label) if wdg is not None]
+        if window is None or window not in ours:
+            self._needs_raise = True
+
     def raise_to_top(self):
         """Ensure overlay stays on top"""
         if self.widget:
@@ -124,185 +256,233 @@ class OverlayQt:
         if self.detection_widget:
             self.detection_widget.raise_()
 
-    def update(self, frame_bgr: np.ndarray, status_text: Optional[str] = None, det_bbox: Optional[Tuple[int, int, int, int]] = None, aim_point: Optional[Tuple[int, int]] = None, roi_offset: Tuple[int, int] = (0, 0), attack_mode: str = "custom"):
-        if self.status_bar_mode and status_text:
-            # Status bar for normal GUI window
-            bar_width = 400
-            bar_height = 70
-            pixmap = QPixmap(bar_width, bar_height)
-            # Fill with dark background instead of transparent
-            pixmap.fill(QColor(45, 20, 18, 255))  # Solid dark red background
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
+    def _build_base_pixmap(self) -> QPixmap:
+        """Paint the static status bar chrome (background, border, logo, title, settings button) once"""
+        bar_width = BAR_WIDTH
+        bar_height = BAR_HEIGHT
+        pixmap = QPixmap(int(bar_width * self._dpr), int(bar_height * self._dpr))
+        pixmap.setDevicePixelRatio(self._dpr)  # painter stays in logical coordinates
+        # Fill with dark background instead of transparent
+        pixmap.fill(QColor(45, 20, 18, 255))  # Solid dark red background
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        
+        # Main background
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(65, 28, 24, 240))
+        painter.drawRect(QRectF(0, 0, bar_width, bar_height - 4))
+        
+        # Red bottom border with rounded corners: a rounded rect clipped to the 4px band below the background
+        border_radius = 15
+        painter.setBrush(QColor(220, 60, 60, 220))
+        painter.setClipRect(QRectF(0, bar_height - 4, bar_width, 4))
+        painter.drawRoundedRect(QRectF(0, bar_height - border_radius * 2, bar_width, border_radius * 2), border_radius, border_radius)
+        painter.setClipping(False)
+        
+        # Draw logo
+        logo_x = 15
+        logo_y = (bar_height - 40) // 2
+        if self.logo_pixmap:
+            painter.drawPixmap(logo_x, logo_y, self.logo_pixmap)
+            logo_x += 48
+        self._status_x = logo_x  # dynamic status indicator/text start here
+        
+        # Title
+        painter.setFont(self._font_title)
+        painter.setPen(self._color_title)
+        painter.drawText(QRect(logo_x, 15, 180, 25), Qt.AlignLeft | Qt.AlignVCenter, "Santa Macro")
+        
+        # Settings button on the right
+        button_size = 50
+        button_y = (bar_height - button_size) // 2 - 2
+        settings_button_x = bar_width - button_size - 20
+        settings_button_rect = QRectF(settings_button_x, button_y, button_size, button_size)
+        self.settings_button_rect = (int(settings_button_x), int(button_y), button_size, button_size)
+        x0, y0 = self.settings_button_rect[:2]
+        self.settings_button_hit = (x0, y0, x0 + button_size, y0 + button_size)
+        
+        # Draw settings button
+        painter.setBrush(QColor(140, 60, 50, 220))
+        painter.setPen(Qt.NoPen)
+        painter.drawRect(settings_button_rect)
+        
+        # Settings icon (gear)
+        painter.setPen(self._color_text)
+        painter.setFont(self._font_status_big)
+        painter.drawText(settings_button_rect, Qt.AlignCenter, "⚙")
+        
+        painter.end()
+        return pixmap
+
+    def _render_status_bar(self, status_emoji: str, status_text_display: str, state_detail: str) -> QPixmap:
+        """Draw one displayed status on top of a copy of the pre-rendered chrome"""
+        pixmap = QPixmap(self._base_pixmap)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        logo_x = self._status_x
+        status_color = self._status_colors[status_text_display]
+        
+        # Status indicator with glow
+        painter.setFont(self._font_status_big)
+        
+        # Glow effect
+        painter.setPen(self._status_glow_pens[status_text_display])
+        painter.drawText(QRect(logo_x + 3, 39, 28, 28), Qt.AlignCenter, status_emoji)
+        
+        # Main indicator
+        painter.setPen(status_color)
+        painter.drawText(QRect(logo_x, 36, 28, 28), Qt.AlignCenter, status_emoji)
+        
+        # Status text
+        painter.setFont(self._font_status)
+        painter.setPen(self._color_text)
+        painter.drawText(QRect(logo_x + 35, 36, 130, 28), Qt.AlignLeft | Qt.AlignVCenter, status_text_display)
+        
+        # State detail
+        if state_detail:
+            painter.setFont(self._font_detail)
+            painter.setPen(self._color_detail)
+            painter.drawText(QRect(logo_x + 35, 48, 200, 18), Qt.AlignLeft | Qt.AlignVCenter, f"• {state_detail}")
+        
+        painter.end()
+        return pixmap
+
+    def _parse_status_text(self, status_text: str) -> Tuple[str, str, str]:
+        """Legacy path: derive (glyph, displayed status, detail) from a free-form status string"""
+        status_line = status_text.split('\n', 1)[0]
+
+        # Determine status
+        if "PAUSED" in status_line:
+            status = "PAUSED"
+        elif "INACTIVE" in status_line:
+            status = "INACTIVE"
+        elif "ACTIVE" in status_line:
+            status = "ACTIVE"
+        else:
+            status = "INACTIVE"
+
+        # Extract state detail
+        state_detail = ""
+        if " - " in status_line:
+            parts = status_line.split(" - ")
+            if len(parts) > 1:
+                state_detail = parts[1]
+        return self._status_table[status] + (state_detail,)
+
+    def update(self, frame_bgr: np.ndarray, status_text: Optional[str] = None, det_bbox: Optional[Tuple[int, int, int, int]] = None, aim_point: Optional[Tuple[int, int]] = None, roi_offset: Tuple[int, int] = (0, 0), attack_mode: str = "custom", status: Optional[str] = None, detail: str = ""):
+        now = time.perf_counter()
+        state = (status, detail, status_text, det_bbox, aim_point, attack_mode)
+        if state == self._last_state and now - self._last_paint_ts < MIN_REPAINT_INTERVAL:
+            return
+        self._last_state = state
+        self._last_paint_ts = now
+        
+        if self.status_bar_mode and (status or status_text):
             self.current_attack_mode = attack_mode
-            
-            # Main background
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(65, 28, 24, 240))
-            painter.drawRect(QRectF(0, 0, bar_width, bar_height - 4))
-            
-            # Red bottom border with rounded corners
-            border_radius = 15
-            bottom_path = QPainterPath()
-            bottom_path.moveTo(0, bar_height - 4)
-            bottom_path.lineTo(0, bar_height - border_radius)
-            bottom_path.arcTo(QRectF(0, bar_height - border_radius * 2, border_radius * 2, border_radius * 2), 180, -90)
-            bottom_path.lineTo(bar_width - border_radius, bar_height)
-            bottom_path.arcTo(QRectF(bar_width - border_radius * 2, bar_height - border_radius * 2, border_radius * 2, border_radius * 2), -90, -90)
-            bottom_path.lineTo(bar_width, bar_height - 4)
-            bottom_path.closeSubpath()
-            
-            painter.setBrush(QColor(220, 60, 60, 220))
-            painter.drawPath(bottom_path)
-            
-            # Draw logo
-            logo_x = 15
-            logo_y = (bar_height - 40) // 2
-            if self.logo_pixmap:
-                painter.drawPixmap(logo_x, logo_y, self.logo_pixmap)
-                logo_x += 48
-            
-            # Title
-            painter.setFont(QFont("Segoe UI", 13, QFont.Bold))
-            painter.setPen(QColor(255, 120, 120, 255))
-            painter.drawText(QRect(logo_x, 15, 180, 25), Qt.AlignLeft | Qt.AlignVCenter, "Santa Macro")
-            
-            # Settings button on the right
-            button_size = 50
-            button_y = (bar_height - button_size) // 2 - 2
-            settings_button_x = bar_width - button_size - 20
-            settings_button_rect = QRectF(settings_button_x, button_y, button_size, button_size)
-            self.settings_button_rect = (int(settings_button_x), int(button_y), button_size, button_size)
-            
-            # Draw settings button
-            painter.setBrush(QColor(140, 60, 50, 220))
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(settings_button_rect)
-            
-            # Settings icon (gear)
-            painter.setPen(QColor(255, 255, 255, 255))
-            painter.setFont(QFont("Segoe UI", 20, QFont.Bold))
-            painter.drawText(settings_button_rect, Qt.AlignCenter, "⚙")
-            
-            # Parse status
-            lines = status_text.split('\n') if status_text else []
-            
-            if len(lines) >= 1:
-                status_line = lines[0]
-                
-                # Determine status
-                if "PAUSED" in status_line:
-                    status_color = QColor(255, 193, 7)
-                    status_emoji = "❙❙"
-                    status_text_display = "PAUSED"
-                elif "INACTIVE" in status_line:
-                    status_color = QColor(255, 82, 82)
-                    status_emoji = "●"
-                    status_text_display = "INACTIVE"
-                elif "ACTIVE" in status_line:
-                    status_color = QColor(76, 217, 100)
-                    status_emoji = "●"
-                    status_text_display = "ACTIVE"
-                else:
-                    status_color = QColor(255, 82, 82)
-                    status_emoji = "●"
-                    status_text_display = "INACTIVE"
-                
-                # Extract state detail
-                state_detail = ""
-                if " - " in status_line:
-                    parts = status_line.split(" - ")
-                    if len(parts) > 1:
-                        state_detail = parts[1]
-                
-                # Status indicator with glow
-                painter.setFont(QFont("Segoe UI", 20, QFont.Bold))
-                
-                # Glow effect
-                painter.setPen(QPen(QColor(status_color.red(), status_color.green(), status_color.blue(), 80), 8))
-                painter.drawText(QRect(logo_x + 3, 39, 28, 28), Qt.AlignCenter, status_emoji)
-                
-                # Main indicator
-                painter.setPen(status_color)
-                painter.drawText(QRect(logo_x, 36, 28, 28), Qt.AlignCenter, status_emoji)
-                
-                # Status text
-                painter.setFont(QFont("Segoe UI", 12, QFont.Bold))
-                painter.setPen(QColor(255, 255, 255, 255))
-                painter.drawText(QRect(logo_x + 35, 36, 130, 28), Qt.AlignLeft | Qt.AlignVCenter, status_text_display)
-                
-                # State detail
-                if state_detail:
-                    painter.setFont(QFont("Segoe UI", 8))
-                    painter.setPen(QColor(170, 180, 200, 200))
-                    painter.drawText(QRect(logo_x + 35, 48, 200, 18), Qt.AlignLeft | Qt.AlignVCenter, f"• {state_detail}")
-            
-            painter.end()
-            self.label.setPixmap(pixmap)
+            if status:
+                # Caller already split status and detail, so nothing needs parsing
+                status_emoji, status_text_display = self._status_table.get(status, self._status_table["INACTIVE"])
+                state_detail = detail
+            else:
+                status_emoji, status_text_display, state_detail = self._parse_status_text(status_text)
+
+            # Only the first status line is drawn, so re-render just when what it shows changes
+            cache_key = (status_text_display, state_detail, attack_mode)
+            if cache_key != self._status_cache_key:
+                self._status_cache_key = cache_key
+                self._status_cache_pix = self._render_status_bar(status_emoji, status_text_display, state_detail)
+                self.label.setPixmap(self._status_cache_pix)
             
             # Detection overlay with enhanced visuals
             if det_bbox or aim_point:
                 h, w = frame_bgr.shape[:2]
-                det_img = np.zeros((h, w, 4), dtype=np.uint8)
+                det_img = self._det_buf
+                prev = self._last_dirty_rect
+                if det_img.shape[:2] != (h, w):
+                    self._alloc_det_buffer(w, h)
+                    det_img = self._det_buf
+                    prev = None
+                elif self._last_dirty_rect is not None:
+                    # Only the previous frame's marks need erasing, not the whole screen-sized buffer
+                    x0, y0, x1, y1 = self._last_dirty_rect
+                    det_img[y0:y1, x0:x1] = 0
+                dirty = None
                 
                 if det_bbox:
                     x, y, bw, bh = det_bbox
                     ox, oy = roi_offset
+                    x0, y0 = x - ox, y - oy
+                    x1, y1 = x0 + bw, y0 + bh
+                    dirty = (x0 - 2, y0 - 2, x1 + 3, y1 + 3)
                     # Detection box in pure red - less bold
-                    cv2.rectangle(det_img, (x - ox, y - oy), (x - ox + bw, y - oy + bh), (0, 0, 255), 2)
+                    cv2.rectangle(det_img, (x0, y0), (x1, y1), DET_RED, 2)
                     
-                    # Corner accents - smaller and less intrusive
+                    # Corner accents - smaller and less intrusive, all 8 strokes in one call
                     corner_len = min(12, bw // 6, bh // 6)  # Much smaller corners
-                    corner_color = (255, 255, 255, 200)  # Slightly transparent white
-                    # Top-left
-                    cv2.line(det_img, (x - ox, y - oy), (x - ox + corner_len, y - oy), corner_color, 2)
-                    cv2.line(det_img, (x - ox, y - oy), (x - ox, y - oy + corner_len), corner_color, 2)
-                    # Top-right
-                    cv2.line(det_img, (x - ox + bw, y - oy), (x - ox + bw - corner_len, y - oy), corner_color, 2)
-                    cv2.line(det_img, (x - ox + bw, y - oy), (x - ox + bw, y - oy + corner_len), corner_color, 2)
-                    # Bottom-left
-                    cv2.line(det_img, (x - ox, y - oy + bh), (x - ox + corner_len, y - oy + bh), corner_color, 2)
-                    cv2.line(det_img, (x - ox, y - oy + bh), (x - ox, y - oy + bh - corner_len), corner_color, 2)
-                    # Bottom-right
-                    cv2.line(det_img, (x - ox + bw, y - oy + bh), (x - ox + bw - corner_len, y - oy + bh), corner_color, 2)
-                    cv2.line(det_img, (x - ox + bw, y - oy + bh), (x - ox + bw, y - oy + bh - corner_len), corner_color, 2)
+                    corner_color = DET_WHITE_200  # Slightly transparent white
+                    corners = CORNER_SEGMENT_ORIGINS * np.array((bw, bh), np.int32) + CORNER_SEGMENT_ARMS * np.int32(corner_len)
+                    corners += np.array((x0, y0), np.int32)
+                    cv2.polylines(det_img, corners, False, corner_color, 2, cv2.LINE_8)
                 
                 if aim_point:
                     ax, ay = aim_point
                     ox, oy = roi_offset
+                    aim_rect = (ax - ox - 22, ay - oy - 22, ax - ox + 23, ay - oy + 23)
+                    if dirty is None:
+                        dirty = aim_rect
+                    else:
+                        dirty = (min(dirty[0], aim_rect[0]), min(dirty[1], aim_rect[1]), max(dirty[2], aim_rect[2]), max(dirty[3], aim_rect[3]))
+                    cx, cy = ax - ox, ay - oy
                     # Enhanced crosshair with pure red center
-                    cv2.circle(det_img, (ax - ox, ay - oy), 5, (0, 0, 255, 255), -1)  # Pure red
-                    cv2.circle(det_img, (ax - ox, ay - oy), 13, (255, 255, 255, 180), 2)  # Slightly transparent ring
-                    # Crosshair lines - thinner and softer
-                    cv2.line(det_img, (ax - ox - 20, ay - oy), (ax - ox - 9, ay - oy), (255, 255, 255, 180), 2)
-                    cv2.line(det_img, (ax - ox + 9, ay - oy), (ax - ox + 20, ay - oy), (255, 255, 255, 180), 2)
-                    cv2.line(det_img, (ax - ox, ay - oy - 20), (ax - ox, ay - oy - 9), (255, 255, 255, 180), 2)
-                    cv2.line(det_img, (ax - ox, ay - oy + 9), (ax - ox, ay - oy + 20), (255, 255, 255, 180), 2)
+                    cv2.circle(det_img, (cx, cy), 5, DET_RED, -1)  # Pure red
+                    cv2.circle(det_img, (cx, cy), 13, DET_WHITE_180, 2)  # Slightly transparent ring
+                    # Crosshair lines - thinner and softer, offset from a fixed pattern in one call
+                    cv2.polylines(det_img, CROSSHAIR_SEGMENTS + np.array((cx, cy), np.int32), False, DET_WHITE_180, 2)
                 
-                qimg = QImage(det_img.data, w, h, 4 * w, QImage.Format_RGBA8888)
-                self.detection_label.setPixmap(QPixmap.fromImage(qimg))
+                x0, y0 = max(0, dirty[0]), max(0, dirty[1])
+                x1, y1 = min(w, dirty[2]), min(h, dirty[3])
+                self._last_dirty_rect = (x0, y0, x1, y1) if x0 < x1 and y0 < y1 else None
+                if prev is not None and self._last_dirty_rect is not None:
+                    # Blit what was erased plus what was drawn
+                    x0, y0 = min(x0, prev[0]), min(y0, prev[1])
+                    x1, y1 = max(x1, prev[2]), max(y1, prev[3])
+                elif prev is not None:
+                    x0, y0, x1, y1 = prev
+                self._flush_det_region(x0, y0, x1, y1)
             else:
+                if self._last_dirty_rect is not None:
+                    x0, y0, x1, y1 = self._last_dirty_rect
+                    self._det_buf[y0:y1, x0:x1] = 0
+                    self._last_dirty_rect = None
+                    # Erase the stale marks from the pixmap too so the next frame starts clean
+                    self._flush_det_region(x0, y0, x1, y1)
                 self.detection_label.clear()
         else:
             # Original full overlay mode
             h, w = frame_bgr.shape[:2]
-            rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-            qimg = QImage(rgb.data, w, h, 3 * w, QImage.Format_RGB888)
+            # Qt reads BGR directly, so no colour conversion pass is needed
+            self._frame_ref = np.ascontiguousarray(frame_bgr)
+            qimg = QImage(self._frame_ref.data, w, h, 3 * w, QImage.Format_BGR888)
             pix = QPixmap.fromImage(qimg)
             self.label.setPixmap(pix)
         
-        # Periodically raise to ensure always on top
-        if self.widget:
-            self.widget.raise_()
-        if self.detection_widget:
-            self.detection_widget.raise_()
-        
+        # Raise after focus moved elsewhere (or as a slow fallback) instead of every frame
+        if self._needs_raise or now - self._last_raise_ts > RAISE_INTERVAL:
+            self._needs_raise = False
+            self._last_raise_ts = now
+            if self.widget:
+                self.widget.raise_()
+            if self.detection_widget:
+                self.detection_widget.raise_()
+
+    def pump_events(self):
+        """Process pending window events; the caller's loop owns the thread, so it must call this every overlay tick"""
         self.app.processEvents()
 
     def close(self):
         try:
+            self.app.focusWindowChanged.disconnect(self._on_focus_window_changed)
             if self.widget:
                 self.widget.close()
             if self.detection_widget: